@@ -1,50 +1,386 @@
 # benchHUB/api.py
-from fastapi import FastAPI, Depends, Request, HTTPException
-from pydantic import BaseModel, field_validator
-from sqlalchemy import create_engine, Column, Integer, String, Float, Text
-from sqlalchemy.orm import sessionmaker, Session, declarative_base
+from fastapi import FastAPI, Body, Depends, Request, Response, HTTPException, Query
+from fastapi.exception_handlers import request_validation_exception_handler
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
+from fastapi.routing import APIRoute
+from pydantic import BaseModel, ValidationError, field_validator
+from typing import List, Optional
+from sqlalchemy import create_engine, event, func, and_, or_, case, cast, literal, select, union_all, Integer, String
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+import asyncio
+import base64
+import binascii
+import contextvars
+import gzip
+import hashlib
 import json
+import orjson
 import os
+import time
 import uvicorn
-from datetime import datetime
+import zlib
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from email.utils import formatdate, parsedate_to_datetime
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 from slowapi.middleware import SlowAPIMiddleware
+from starlette.concurrency import run_in_threadpool
+from benchHUB import api_metrics
+from benchHUB.migrations import apply_migrations
+from benchHUB.models import JSON_FIELDS, METRIC_COLUMNS, BenchmarkResult, Hardware, get_or_create_hardware, typed_metrics
+from benchHUB.utils.hardware import hardware_summary
 
-# --- Test Configuration ---
-IS_LOCAL_TEST = not os.environ.get("DATABASE_URL")
-if IS_LOCAL_TEST:
-    print("Running in local test mode with SQLite database.")
-    DATABASE_URL = "sqlite:///./test.db"
-else:
-    DATABASE_URL = os.environ.get("DATABASE_URL")
+try:
+    import brotli
+except ImportError:  # Optional; responses fall back to gzip
+    brotli = None
 
 # Rate Limiter Setup
 limiter = Limiter(key_func=get_remote_address, default_limits=["100/hour"])
 
-# Database setup
-Base = declarative_base()
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False} if IS_LOCAL_TEST else {})
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-
-class BenchmarkResult(Base):
-    __tablename__ = "results"
-    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
-    system_info = Column(Text)
-    cpu = Column(Text)
-    memory = Column(Text)
-    gpu = Column(Text)
-    disk = Column(Text)
-    ml = Column(Text)
-    plot = Column(Text)
-    reference_index = Column(Float)
-    config_name = Column(Text, nullable=True)
-    uuid = Column(String, unique=True, nullable=False)
-    timestamp = Column(String, default=datetime.utcnow().isoformat)
-
-# Create/update the table
-Base.metadata.create_all(bind=engine)
+# Connection pool sizing, per API process
+DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.environ.get("DB_MAX_OVERFLOW", "20"))
+DB_POOL_TIMEOUT = float(os.environ.get("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.environ.get("DB_POOL_RECYCLE", "1800"))
+POOL_OPTIONS = {
+    "pool_size": DB_POOL_SIZE,
+    "max_overflow": DB_MAX_OVERFLOW,
+    "pool_timeout": DB_POOL_TIMEOUT,
+    "pool_recycle": DB_POOL_RECYCLE,
+    "pool_pre_ping": True,
+}
+# Read-only connections per API process on local SQLite, next to its single writer
+SQLITE_READ_POOL_SIZE = int(os.environ.get("SQLITE_READ_POOL_SIZE", "4"))
+
+def sync_database_url(url: str) -> str:
+    # Render and Heroku hand out postgres:// URLs, which SQLAlchemy 2 no longer accepts
+    return "postgresql://" + url[len("postgres://"):] if url.startswith("postgres://") else url
+
+def async_engine_options(url: str):
+    """
+    The async driver URL (asyncpg or aiosqlite) for a database URL, and its connect_args.
+    """
+    url = make_url(sync_database_url(url))
+    connect_args = {}
+    if url.get_backend_name() == "postgresql":
+        url = url.set(drivername="postgresql+asyncpg")
+        # asyncpg takes 'ssl' instead of libpq's 'sslmode'
+        if "sslmode" in url.query:
+            connect_args["ssl"] = url.query["sslmode"]
+            url = url.difference_update_query(["sslmode"])
+    elif url.get_backend_name() == "sqlite":
+        url = url.set(drivername="sqlite+aiosqlite")
+    return url, connect_args
+
+def database_url() -> str:
+    url = os.environ.get("DATABASE_URL")
+    if not url:
+        print("Running in local test mode with SQLite database.")
+        return "sqlite:///./test.db"
+    return url
+
+# Database handles, created by `startup` when the app starts rather than at import,
+# so importing this module does no database work. The endpoints use the async engines
+# (writes on `async_engine`, reads on `async_read_engine`, the same engine except on
+# SQLite); the sync one serves scripts such as the load test's seeding.
+engine = None
+SessionLocal = None
+async_engine = None
+AsyncSessionLocal = None
+async_read_engine = None
+AsyncReadSessionLocal = None
+
+def sqlite_pragmas(*pragmas):
+    """
+    A connect listener that runs `pragmas` on every new SQLite connection.
+    """
+    def set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma in pragmas:
+            cursor.execute(f"PRAGMA {pragma}")
+        cursor.close()
+    return set_pragmas
+
+async def startup():
+    """
+    Create the engines and apply pending schema migrations.
+    """
+    global engine, SessionLocal, async_engine, AsyncSessionLocal, async_read_engine, AsyncReadSessionLocal
+    url = database_url()
+    engine = create_engine(
+        sync_database_url(url),
+        connect_args={"check_same_thread": False} if url.startswith("sqlite") else {},
+        **POOL_OPTIONS,
+    )
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    async_url, async_connect_args = async_engine_options(url)
+    if async_url.get_backend_name() == "sqlite":
+        # SQLite has a single writer: queue writes on one pooled connection rather than
+        # on the file lock, where concurrent writers fail with "database is locked".
+        # (aiosqlite would otherwise open a new connection per checkout.) In WAL mode
+        # readers do not block the writer or each other, so reads get their own pool.
+        async_engine = create_async_engine(
+            async_url, connect_args=async_connect_args,
+            **dict(POOL_OPTIONS, poolclass=AsyncAdaptedQueuePool, pool_size=1, max_overflow=0),
+        )
+        event.listen(async_engine.sync_engine, "connect", sqlite_pragmas("journal_mode=WAL", "synchronous=NORMAL"))
+        async_read_engine = create_async_engine(
+            async_url, connect_args=async_connect_args,
+            **dict(POOL_OPTIONS, poolclass=AsyncAdaptedQueuePool, pool_size=SQLITE_READ_POOL_SIZE, max_overflow=0),
+        )
+        event.listen(async_read_engine.sync_engine, "connect", sqlite_pragmas("query_only=ON"))
+        api_metrics.instrument_engine(async_read_engine.sync_engine)
+    else:
+        async_engine = async_read_engine = create_async_engine(async_url, connect_args=async_connect_args, **POOL_OPTIONS)
+    api_metrics.instrument_engine(engine)
+    api_metrics.instrument_engine(async_engine.sync_engine)
+    # expire_on_commit=False keeps attributes (e.g. the new id) readable after commit without a refresh
+    AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+    AsyncReadSessionLocal = async_sessionmaker(async_read_engine, autoflush=False, expire_on_commit=False)
+
+    async with async_engine.begin() as conn:
+        applied = await conn.run_sync(apply_migrations)
+    if applied:
+        print(f"Applied schema migrations: {', '.join(applied)}")
+
+async def shutdown():
+    # Flush queued submissions before the engines go away
+    await write_behind.stop()
+    # Pooled aiosqlite connections run in their own threads and would keep the process alive
+    await async_engine.dispose()
+    await async_read_engine.dispose()
+    engine.dispose()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await startup()
+    yield
+    await shutdown()
+
+MAX_SAMPLES_PER_METRIC = 50
+# Submissions per batch request; each is scored and bootstrapped server-side
+MAX_BATCH_SIZE = 100
+
+# Leaderboard pagination and projection
+LEADERBOARD_DEFAULT_LIMIT = 100
+LEADERBOARD_MAX_LIMIT = 500
+SCALAR_FIELDS = ("id", "uuid", "config_name", "reference_index", "reference_index_low", "reference_index_high", "scoring_version",
+                 "coverage", "missing_subsystems", "timestamp")
+HARDWARE_FIELDS = ("os", "cpu_model", "cpu_cores", "memory_gb", "gpu_model")
+METRIC_FIELDS = tuple(METRIC_COLUMNS)
+LEADERBOARD_FIELDS = SCALAR_FIELDS + HARDWARE_FIELDS + METRIC_FIELDS + JSON_FIELDS
+# The raw JSON columns are large, so they are only returned when asked for
+DEFAULT_LEADERBOARD_FIELDS = SCALAR_FIELDS + HARDWARE_FIELDS
+
+# Leaderboard response cache. Submissions invalidate it; the TTL bounds staleness after
+# writes from other processes (e.g. db_manager.py rescore).
+LEADERBOARD_CACHE_SIZE = 256
+LEADERBOARD_CACHE_TTL = float(os.environ.get("LEADERBOARD_CACHE_TTL", "300"))
+
+# Optional write-behind mode for /api/submit: rows are committed in groups of up to
+# SUBMIT_BATCH_ROWS, or after SUBMIT_BATCH_MS milliseconds, by one background task.
+SUBMIT_WRITE_BEHIND = os.environ.get("SUBMIT_WRITE_BEHIND", "").lower() in ("1", "true", "yes")
+SUBMIT_BATCH_ROWS = int(os.environ.get("SUBMIT_BATCH_ROWS", "50"))
+SUBMIT_BATCH_MS = float(os.environ.get("SUBMIT_BATCH_MS", "20"))
+
+# Response compression: bodies of at least COMPRESS_MIN_SIZE bytes are sent with the
+# best encoding the client accepts. Request bodies may be gzip-compressed.
+COMPRESS_MIN_SIZE = int(os.environ.get("COMPRESS_MIN_SIZE", "1024"))
+GZIP_LEVEL = 4
+BROTLI_QUALITY = 4
+ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+MAX_REQUEST_BODY = 10 * 1024 * 1024  # Decompressed size limit for gzip request bodies
+
+
+class ResponseCache:
+    """
+    In-process cache of serialized JSON responses, keyed by query parameters.
+
+    Each entry keeps its body, a strong ETag (hash of the body) and the time the
+    content last changed, for conditional requests, plus its compressed variants
+    once requested. Only used from the event loop by async endpoints; no method
+    awaits, so each call runs without interleaving and needs no lock.
+
+    An endpoint does await its query between a miss and `put`, and a write may
+    invalidate the cache meanwhile. It reads `generation` before the query and
+    passes it to `put`, which then does not store the now stale response.
+    """
+
+    def __init__(self, max_entries: int = LEADERBOARD_CACHE_SIZE, ttl: float = LEADERBOARD_CACHE_TTL):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.last_modified = time.time()
+        self.generation = 0  # Incremented by every invalidation
+        self._entries = OrderedDict()
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() - entry["stored"] > self.ttl:
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key, payload, generation: Optional[int] = None):
+        """
+        Serialize `payload` and cache it under `key`, unless the cache was invalidated
+        since `generation`; the entry is returned for the response either way.
+        """
+        body = orjson.dumps(payload)
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        if generation is not None and generation != self.generation:
+            return {"body": body, "etag": etag, "last_modified": self.last_modified, "stored": time.monotonic(), "encoded": {}}
+        previous = self._entries.get(key)
+        # A TTL refresh that finds different content counts as a modification
+        if previous is not None and previous["etag"] != etag:
+            self.last_modified = time.time()
+        entry = {"body": body, "etag": etag, "last_modified": self.last_modified, "stored": time.monotonic(), "encoded": {}}
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return entry
+
+    def invalidate(self):
+        self._entries.clear()
+        self.last_modified = time.time()
+        self.generation += 1
+
+leaderboard_cache = ResponseCache()
+stats_cache = ResponseCache()
+
+
+def invalidate_caches():
+    """Drop cached responses derived from the results table, after a write."""
+    leaderboard_cache.invalidate()
+    stats_cache.invalidate()
+
+
+def accepted_encoding(request: Request) -> Optional[str]:
+    """
+    The preferred supported content coding ('br' or 'gzip') in the request's
+    Accept-Encoding header, or None to send the body uncompressed.
+    """
+    weights = {}
+    for part in request.headers.get("accept-encoding", "").split(","):
+        coding, _, params = part.strip().lower().partition(";")
+        weight = 1.0
+        if params.strip().startswith("q="):
+            try:
+                weight = float(params.strip()[2:])
+            except ValueError:
+                weight = 0.0
+        weights[coding.strip()] = weight
+    best, best_weight = None, 0.0
+    for coding in ENCODINGS:  # In order of preference, so ties go to brotli
+        weight = weights.get(coding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = coding, weight
+    return best
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL)
+
+
+def strip_encoding_suffix(tag: str) -> str:
+    # Compressed variants carry the identity ETag with a '-gzip' or '-br' suffix
+    for coding in ENCODINGS:
+        if tag.endswith(f'-{coding}"'):
+            return tag[:-len(coding) - 2] + '"'
+    return tag
+
+
+def not_modified(request: Request, entry) -> bool:
+    """
+    Evaluate If-None-Match (preferred) or If-Modified-Since against a cache entry.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = {strip_encoding_suffix(tag.strip().removeprefix("W/")) for tag in if_none_match.split(",")}
+        return "*" in tags or entry["etag"] in tags
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            return int(entry["last_modified"]) <= parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+def cached_response(request: Request, entry) -> Response:
+    """
+    Serve a cache entry, compressed if it is large enough and the client accepts it.
+    Each encoding of an entry is compressed once and then reused.
+    """
+    encoding = accepted_encoding(request) if len(entry["body"]) >= COMPRESS_MIN_SIZE else None
+    headers = {
+        "ETag": entry["etag"] if encoding is None else f'{entry["etag"][:-1]}-{encoding}"',
+        "Last-Modified": formatdate(entry["last_modified"], usegmt=True),
+        "Cache-Control": "no-cache",  # Clients may store it but must revalidate
+        "Vary": "Accept-Encoding",
+    }
+    if not_modified(request, entry):
+        return Response(status_code=304, headers=headers)
+    if encoding is None:
+        return Response(content=entry["body"], media_type="application/json", headers=headers)
+    body = entry["encoded"].get(encoding)
+    if body is None:
+        body = entry["encoded"][encoding] = compress(entry["body"], encoding)
+    headers["Content-Encoding"] = encoding
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def decompress_request_body(body: bytes, encoding: str) -> bytes:
+    """
+    Decode a request body sent with Content-Encoding, up to MAX_REQUEST_BODY bytes.
+
+    Raises:
+        HTTPException: 415 for unsupported codings, 400 for corrupt data, 413 if too large.
+    """
+    if encoding in ("", "identity"):
+        return body
+    if encoding != "gzip":
+        raise HTTPException(status_code=415, detail=f"Unsupported Content-Encoding '{encoding}', use gzip")
+    decompressor = zlib.decompressobj(wbits=16 + zlib.MAX_WBITS)
+    try:
+        data = decompressor.decompress(body, MAX_REQUEST_BODY + 1)
+    except zlib.error:
+        raise HTTPException(status_code=400, detail="Invalid gzip request body")
+    if len(data) > MAX_REQUEST_BODY:
+        raise HTTPException(status_code=413, detail=f"Request body larger than {MAX_REQUEST_BODY} bytes once decompressed")
+    return data
+
+
+class DecompressingRequest(Request):
+    async def body(self) -> bytes:
+        if not hasattr(self, "_body"):
+            raw = await super().body()
+            self._body = decompress_request_body(raw, self.headers.get("content-encoding", "").strip().lower())
+        return self._body
+
+
+class DecompressingRoute(APIRoute):
+    """
+    Route that accepts gzip-compressed request bodies (Content-Encoding: gzip).
+    """
+
+    def get_route_handler(self):
+        handler = super().get_route_handler()
+
+        async def decompressing_handler(request: Request) -> Response:
+            return await handler(DecompressingRequest(request.scope, request.receive))
+
+        return decompressing_handler
 
 # Pydantic models with validation
 class BenchmarkPayload(BaseModel):
@@ -56,6 +392,10 @@ class BenchmarkPayload(BaseModel):
     ml: dict
     plot: dict
     reference_index: float
+    reference_index_low: Optional[float] = None
+    reference_index_high: Optional[float] = None
+    samples: dict = {}  # Per-run times, {subsystem: {metric: [seconds, ...]}}
+    scoring_version: str = "1.0"  # Clients predating versioned scoring used the 1.0 formula
     config_name: str = "standard"
     uuid: str
     timestamp: str
@@ -89,49 +429,116 @@ class BenchmarkPayload(BaseModel):
         
         return v
 
-# FastAPI app
-app = FastAPI()
+    @field_validator('samples')
+    @classmethod
+    def validate_samples(cls, v):
+        # Samples drive the server-side bootstrap, so keep them small and well-formed
+        for subsystem, metrics in v.items():
+            if not isinstance(metrics, dict):
+                raise ValueError(f'samples.{subsystem} must be an object')
+            for key, runs in metrics.items():
+                if not isinstance(runs, list) or len(runs) > MAX_SAMPLES_PER_METRIC:
+                    raise ValueError(f'samples.{subsystem}.{key} must be a list of at most {MAX_SAMPLES_PER_METRIC} timings')
+                if not all(isinstance(t, (int, float)) and 0 <= t <= 3600 for t in runs):
+                    raise ValueError(f'samples.{subsystem}.{key} must contain timings between 0 and 3600 seconds')
+        return v
+
+# FastAPI app. Responses are serialized with orjson; request bodies may be gzip-compressed.
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
+app.router.route_class = DecompressingRoute
 app.state.limiter = limiter
-app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 app.add_middleware(SlowAPIMiddleware)
+# Added last so it is outermost and also records responses from the rate limiter
+app.add_middleware(api_metrics.MetricsMiddleware)
 
-# Dependency to get DB session
-def get_db():
-    db = SessionLocal()
-    try:
+def rate_limit_exceeded(request: Request, exc: RateLimitExceeded):
+    # Must stay synchronous: SlowAPIMiddleware falls back to its own handler for coroutines
+    api_metrics.rate_limited.inc((api_metrics.route_label(request.scope),))
+    return _rate_limit_exceeded_handler(request, exc)
+
+app.add_exception_handler(RateLimitExceeded, rate_limit_exceeded)
+
+@app.exception_handler(RequestValidationError)
+async def validation_failed(request: Request, exc: RequestValidationError):
+    api_metrics.validation_failures.inc((api_metrics.route_label(request.scope), "schema"))
+    return await request_validation_exception_handler(request, exc)
+
+# Dependencies to get DB sessions
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
-@app.post("/api/submit")
-@limiter.limit("10/hour")
-def submit_result(request: Request, payload: BenchmarkPayload, db: Session = Depends(get_db)):
-    # Server-side score verification to prevent manipulation
+async def get_async_read_db():
+    """A session for endpoints that only read; on SQLite it does not wait behind writes."""
+    async with AsyncReadSessionLocal() as db:
+        yield db
+
+def verify_submission(payload: BenchmarkPayload, payload_results: dict):
+    """
+    Recompute the score and confidence interval of a submission server-side.
+
+    Returns:
+        dict: 'score' (the verified score), 'interval' ((low, high) or None), and the
+              subsystem 'coverage' and 'missing' subsystems (None if not known).
+
+    Raises:
+        HTTPException: 422 if the results cannot be scored, a required subsystem is
+                       missing, or the submitted score is off by more than 5%.
+    """
     try:
-        from benchHUB.reference_index import calculate_reference_index, score_cpu, score_gpu, score_memory
-        
-        cpu_score = score_cpu(payload.cpu)
-        gpu_score = score_gpu(payload.gpu)
-        memory_score = score_memory(payload.memory)
-        server_calculated_score = calculate_reference_index(cpu_score, gpu_score, memory_score)
-        
+        from benchHUB.reference_index import OPTIONAL_SUBSYSTEMS, score_results, bootstrap_reference_index
+        scored = score_results(payload_results, version=payload.scoring_version)
+    except ImportError:
+        # Fallback if reference_index module unavailable
+        scored = None
+    except Exception as e:
+        raise HTTPException(status_code=422, detail=f"Score validation failed: {str(e)}")
+
+    if scored is not None and scored["coverage"] is not None:
+        # The index is renormalized over the subsystems present, so leaving out slow
+        # ones would raise it. Only machines without an accelerator may skip one.
+        required_missing = [name for name in scored["missing"] if name not in OPTIONAL_SUBSYSTEMS]
+        if required_missing:
+            raise HTTPException(status_code=422, detail=f"Incomplete run: missing {', '.join(required_missing)} results")
+
+    try:
+        server_calculated_score = scored["index"] if scored is not None else None
+        # The confidence interval is recomputed from the submitted run samples, never trusted as sent
+        interval = bootstrap_reference_index(payload_results, payload.samples, payload.scoring_version) if scored is not None else None
+    except Exception as e:
+        raise HTTPException(status_code=422, detail=f"Score validation failed: {str(e)}")
+
+    if server_calculated_score is None:
+        verified_score = payload.reference_index
+    else:
+        if server_calculated_score <= 0:
+            raise HTTPException(status_code=422, detail="Score validation failed: no scorable benchmark results")
         # Allow 5% tolerance for floating-point differences
         tolerance = 0.05
         if abs(payload.reference_index - server_calculated_score) / server_calculated_score > tolerance:
             raise HTTPException(
-                status_code=422, 
-                detail=f"Score mismatch: submitted {payload.reference_index:.0f}, calculated {server_calculated_score:.0f}"
+                status_code=422,
+                detail=f"Score mismatch: submitted {payload.reference_index:.0f}, calculated {server_calculated_score:.0f} (scoring v{payload.scoring_version})"
             )
-            
         # Use server-calculated score for data integrity
         verified_score = server_calculated_score
-        
-    except ImportError:
-        # Fallback if reference_index module unavailable
-        verified_score = payload.reference_index
-    except Exception as e:
-        raise HTTPException(status_code=422, detail=f"Score validation failed: {str(e)}")
-    
+    return {
+        "score": verified_score,
+        "interval": interval,
+        "coverage": scored["coverage"] if scored is not None else None,
+        "missing": scored["missing"] if scored is not None and scored["coverage"] is not None else None,
+    }
+
+def build_result(db: Session, payload: BenchmarkPayload, payload_results: dict, verification: dict,
+                 known_hardware: Optional[dict] = None) -> BenchmarkResult:
+    """
+    Create the row for a verified submission, linked to its hardware entry, and add it to the session.
+    `verification` is the result of `verify_submission`; `known_hardware` is passed on to
+    `get_or_create_hardware`.
+    """
+    interval = verification["interval"]
+    missing = verification["missing"]
+    hardware = get_or_create_hardware(db, payload.system_info, known_hardware)
     result = BenchmarkResult(
         system_info=json.dumps(payload.system_info),
         cpu=json.dumps(payload.cpu),
@@ -140,20 +547,585 @@ def submit_result(request: Request, payload: BenchmarkPayload, db: Session = Dep
         disk=json.dumps(payload.disk),
         ml=json.dumps(payload.ml),
         plot=json.dumps(payload.plot),
-        reference_index=verified_score,
+        reference_index=verification["score"],
+        reference_index_low=interval[0] if interval else None,
+        reference_index_high=interval[1] if interval else None,
+        coverage=verification["coverage"],
+        missing_subsystems=",".join(missing) if missing is not None else None,
+        scoring_version=payload.scoring_version,
         config_name=payload.config_name,
         uuid=payload.uuid,
-        timestamp=payload.timestamp
+        timestamp=payload.timestamp,
+        hardware_id=hardware.id,
+        operating_system=hardware_summary(payload.system_info)["os"],
+        **typed_metrics(payload_results),
     )
     db.add(result)
-    db.commit()
-    db.refresh(result)
+    return result
+
+@app.post("/api/submit")
+@limiter.limit("10/hour")
+async def submit_result(request: Request, payload: BenchmarkPayload, db: AsyncSession = Depends(get_async_db)):
+    # Server-side score verification against the scoring version the client used.
+    # Scoring and the bootstrap are CPU-bound, so they run off the event loop.
+    payload_results = payload.model_dump()
+    try:
+        verification = await run_in_threadpool(verify_submission, payload, payload_results)
+    except HTTPException:
+        api_metrics.validation_failures.inc(("/api/submit", "score"))
+        raise
+
+    if SUBMIT_WRITE_BEHIND:
+        status, row_id = await write_behind.submit((payload, payload_results, verification))
+        if status == "duplicate":
+            raise HTTPException(status_code=409, detail=f"Result {payload.uuid} was already submitted")
+        return {"message": "Result submitted successfully", "id": row_id}
+
+    try:
+        result = await db.run_sync(build_result, payload, payload_results, verification)
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=409, detail=f"Result {payload.uuid} was already submitted")
+    invalidate_caches()
     return {"message": "Result submitted successfully", "id": result.id}
 
+def validation_message(error: ValidationError) -> str:
+    return "; ".join(f"{'.'.join(str(part) for part in e['loc']) or 'payload'}: {e['msg']}" for e in error.errors())
+
+def verify_batch(items: List[dict]) -> list:
+    """
+    Validate and score every item of a batch submission.
+
+    Returns:
+        list: Per item, either ('accepted', payload, payload_results, verification)
+              or ('rejected', uuid or None, detail, reason), reason being 'schema' or 'score'.
+    """
+    outcomes = []
+    for item in items:
+        try:
+            payload = BenchmarkPayload.model_validate(item)
+        except ValidationError as e:
+            uuid = item.get("uuid")
+            outcomes.append(("rejected", uuid if isinstance(uuid, str) else None, validation_message(e), "schema"))
+            continue
+        payload_results = payload.model_dump()
+        try:
+            verification = verify_submission(payload, payload_results)
+        except HTTPException as e:
+            outcomes.append(("rejected", payload.uuid, e.detail, "score"))
+            continue
+        outcomes.append(("accepted", payload, payload_results, verification))
+    return outcomes
+
+def insert_batch(db: Session, accepted: list) -> dict:
+    """
+    Add the verified submissions whose uuid is not stored yet and flush them in one bulk insert.
+    A uuid that already exists, or repeats within the batch, is reported as a duplicate
+    of the stored row, so retried uploads are idempotent.
+
+    Returns:
+        dict: {item index: (status, row id)} with status 'created' or 'duplicate'.
+    """
+    uuids = {payload.uuid for _, payload, _, _ in accepted}
+    stored = dict(db.query(BenchmarkResult.uuid, BenchmarkResult.id).filter(BenchmarkResult.uuid.in_(uuids)).all())
+    known_hardware, created, rows = {}, {}, {}
+    for index, payload, payload_results, verification in accepted:
+        if payload.uuid in stored:
+            rows[index] = ("duplicate", stored[payload.uuid])
+        elif payload.uuid in created:
+            rows[index] = ("duplicate", created[payload.uuid])
+        else:
+            created[payload.uuid] = build_result(db, payload, payload_results, verification, known_hardware)
+            rows[index] = ("created", created[payload.uuid])
+    db.flush()
+    return {index: (status, row if isinstance(row, int) else row.id) for index, (status, row) in rows.items()}
+
+async def store_batch(db: AsyncSession, accepted: list) -> dict:
+    """
+    Run `insert_batch` and commit. If a concurrent request stored one of the uuids
+    first, the batch is retried once and sees that row as a duplicate.
+    """
+    try:
+        stored = await db.run_sync(insert_batch, accepted)
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        stored = await db.run_sync(insert_batch, accepted)
+        await db.commit()
+    if any(status == "created" for status, _ in stored.values()):
+        invalidate_caches()
+    return stored
+
+class WriteBehindQueue:
+    """
+    Group commit for single submissions. Verified rows are queued and written by one
+    background task, in a transaction per batch of up to `batch_rows` rows or whatever
+    arrived within `batch_ms` of the first one. Each submitter awaits its batch's
+    commit, so responses still carry the stored id and a failed write is reported.
+    """
+
+    def __init__(self, batch_rows: int = SUBMIT_BATCH_ROWS, batch_ms: float = SUBMIT_BATCH_MS):
+        self.batch_rows = batch_rows
+        self.batch_ms = batch_ms
+        self._queue = None
+        self._task = None
+        self._closing = False
+
+    def start(self):
+        self._queue = asyncio.Queue()
+        # A fresh context: the first submitter's request context (and its database
+        # time) would otherwise be copied into the task and outlive the request
+        self._task = asyncio.create_task(self._run(), context=contextvars.Context())
+
+    async def submit(self, entry) -> tuple:
+        """
+        Queue (payload, payload_results, verification) and wait for it to be stored.
+
+        Returns:
+            tuple: (status, row id) as from `insert_batch`.
+        """
+        if self._closing:
+            raise HTTPException(status_code=503, detail="Server is shutting down")
+        if self._task is None:
+            self.start()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((entry, future))
+        return await future
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            item = await self._queue.get()
+            if item is None:
+                break
+            batch = [item]
+            deadline = loop.time() + self.batch_ms / 1000
+            while len(batch) < self.batch_rows:
+                try:
+                    item = self._queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        item = await asyncio.wait_for(self._queue.get(), remaining)
+                    except asyncio.TimeoutError:
+                        break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            await self._flush(batch)
+
+    async def _flush(self, batch):
+        accepted = [(index, *entry) for index, (entry, _) in enumerate(batch)]
+        db_time = [0.0]
+        token = api_metrics.request_db_time.set(db_time)
+        try:
+            async with AsyncSessionLocal() as db:
+                stored = await store_batch(db, accepted)
+        except Exception as e:
+            print(f"Write-behind flush of {len(batch)} submission(s) failed: {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(HTTPException(status_code=503, detail="Could not store the result, please retry"))
+            return
+        finally:
+            api_metrics.request_db_time.reset(token)
+            api_metrics.write_behind_flush_db.observe(db_time[0])
+        for index, (_, future) in enumerate(batch):
+            if not future.done():  # The client may have disconnected
+                future.set_result(stored[index])
+
+    async def stop(self):
+        """
+        Stop accepting submissions and wait until everything queued is committed.
+        """
+        self._closing = True
+        if self._task is not None:
+            await self._queue.put(None)
+            await self._task
+            self._task = None
+
+
+write_behind = WriteBehindQueue()
+
+@app.post("/api/submit/batch")
+@limiter.limit("10/hour")
+async def submit_batch(request: Request, items: List[dict] = Body(...), db: AsyncSession = Depends(get_async_db)):
+    """
+    Submit up to MAX_BATCH_SIZE results at once, e.g. from a fleet of hosts.
+    Every item is validated and scored independently; the accepted ones are stored in a
+    single transaction. Returns one status per item, in request order.
+    """
+    if not items:
+        raise HTTPException(status_code=422, detail="Batch is empty")
+    if len(items) > MAX_BATCH_SIZE:
+        raise HTTPException(status_code=413, detail=f"Batch too large: {len(items)} items, at most {MAX_BATCH_SIZE}")
+
+    outcomes = await run_in_threadpool(verify_batch, items)
+    accepted = [(index, *outcome[1:]) for index, outcome in enumerate(outcomes) if outcome[0] == "accepted"]
+    stored = await store_batch(db, accepted) if accepted else {}
+
+    results = []
+    for index, outcome in enumerate(outcomes):
+        if outcome[0] == "rejected":
+            api_metrics.validation_failures.inc(("/api/submit/batch", outcome[3]))
+            results.append({"index": index, "uuid": outcome[1], "status": "rejected", "detail": outcome[2]})
+        else:
+            status, row_id = stored[index]
+            results.append({"index": index, "uuid": outcome[1].uuid, "status": status, "id": row_id})
+    counts = {status: sum(r["status"] == status for r in results) for status in ("created", "duplicate", "rejected")}
+    return {**counts, "items": results}
+
+def encode_cursor(reference_index: float, row_id: int) -> str:
+    """Opaque keyset cursor pointing just after the given leaderboard row."""
+    return base64.urlsafe_b64encode(json.dumps([reference_index, row_id]).encode()).decode()
+
+def decode_cursor(cursor: str):
+    try:
+        reference_index, row_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return float(reference_index), int(row_id)
+    except (binascii.Error, ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+def parse_fields(fields: Optional[str]):
+    if not fields:
+        return list(DEFAULT_LEADERBOARD_FIELDS)
+    requested = [field.strip() for field in fields.split(",") if field.strip()]
+    unknown = [field for field in requested if field not in LEADERBOARD_FIELDS]
+    if unknown:
+        raise HTTPException(status_code=422, detail=f"Unknown field(s): {', '.join(unknown)}. Allowed: {', '.join(LEADERBOARD_FIELDS)}")
+    return requested
+
+HARDWARE_COLUMNS = {
+    "os": BenchmarkResult.operating_system,
+    "cpu_model": Hardware.cpu_model,
+    "cpu_cores": Hardware.cpu_cores,
+    "memory_gb": Hardware.memory_gb,
+    "gpu_model": Hardware.gpu_model,
+}
+
+def leaderboard_item(row, requested, fallback_hardware):
+    """Build one leaderboard entry with the requested fields; JSON columns are returned parsed."""
+    item = {}
+    for field in requested:
+        if field in HARDWARE_FIELDS:
+            # Rows not yet migrated to the hardware table are summarized from system_info
+            item[field] = row[field] if row["hardware_id"] is not None else fallback_hardware[row["id"]][field]
+        elif field in JSON_FIELDS:
+            item[field] = orjson.loads(row[field]) if row[field] else None
+        else:
+            item[field] = row[field]
+    return item
+
+def leaderboard_page(db: Session, config_name: Optional[str], limit: int, cursor: Optional[str], fields: Optional[str],
+                     cpu_model: Optional[str] = None, gpu_model: Optional[str] = None, min_memory_gb: Optional[float] = None,
+                     min_coverage: Optional[float] = None):
+    requested = parse_fields(fields)
+    names = {"id", "reference_index"} | {f for f in requested if f in SCALAR_FIELDS or f in METRIC_FIELDS or f in JSON_FIELDS}
+    selected = [getattr(BenchmarkResult, name) for name in sorted(names)]
+    with_hardware = any(f in HARDWARE_FIELDS for f in requested)
+    if with_hardware:
+        selected += [BenchmarkResult.hardware_id] + [column.label(field) for field, column in HARDWARE_COLUMNS.items()]
+
+    query = db.query(*selected).filter(BenchmarkResult.reference_index.isnot(None))
+    hardware_filters = []
+    if cpu_model is not None:
+        hardware_filters.append(Hardware.cpu_model == cpu_model)
+    if gpu_model is not None:
+        hardware_filters.append(Hardware.gpu_model == gpu_model)
+    if min_memory_gb is not None:
+        hardware_filters.append(Hardware.memory_gb >= min_memory_gb)
+    if hardware_filters:
+        query = query.join(Hardware, BenchmarkResult.hardware_id == Hardware.id).filter(*hardware_filters)
+    elif with_hardware:
+        query = query.outerjoin(Hardware, BenchmarkResult.hardware_id == Hardware.id)
+    if config_name:
+        query = query.filter(BenchmarkResult.config_name == config_name)
+    if min_coverage is not None:
+        query = query.filter(BenchmarkResult.coverage >= min_coverage)
+    if cursor:
+        after_score, after_id = decode_cursor(cursor)
+        query = query.filter(or_(
+            BenchmarkResult.reference_index < after_score,
+            and_(BenchmarkResult.reference_index == after_score, BenchmarkResult.id < after_id),
+        ))
+    rows = query.order_by(BenchmarkResult.reference_index.desc(), BenchmarkResult.id.desc()).limit(limit + 1).all()
+
+    page = [row._mapping for row in rows[:limit]]
+    fallback_hardware = {}
+    unmigrated = [row["id"] for row in page if with_hardware and row["hardware_id"] is None]
+    if unmigrated:
+        for row_id, system_info in db.query(BenchmarkResult.id, BenchmarkResult.system_info).filter(BenchmarkResult.id.in_(unmigrated)):
+            fallback_hardware[row_id] = hardware_summary(json.loads(system_info) if system_info else {})
+    next_cursor = encode_cursor(page[-1]["reference_index"], page[-1]["id"]) if len(rows) > limit else None
+    return {
+        "items": [leaderboard_item(row, requested, fallback_hardware) for row in page],
+        "next_cursor": next_cursor,
+    }
+
 @app.get("/api/leaderboard")
-def get_leaderboard(db: Session = Depends(get_db)):
-    results = db.query(BenchmarkResult).order_by(BenchmarkResult.reference_index.desc()).all()
-    return results
+async def get_leaderboard(
+    request: Request,
+    config_name: Optional[str] = None,
+    limit: int = Query(LEADERBOARD_DEFAULT_LIMIT, ge=1, le=LEADERBOARD_MAX_LIMIT),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    cpu_model: Optional[str] = None,
+    gpu_model: Optional[str] = None,
+    min_memory_gb: Optional[float] = None,
+    min_coverage: Optional[float] = Query(None, ge=0, le=1),
+    db: AsyncSession = Depends(get_async_read_db),
+):
+    """
+    One page of the leaderboard, best score first.
+
+    Pass the returned 'next_cursor' back as `cursor` to get the following page; it is
+    null on the last page. `fields` is a comma-separated projection of LEADERBOARD_FIELDS
+    (default: scores, ids and the hardware summary, without the raw JSON columns).
+    `cpu_model`, `gpu_model` and `min_memory_gb` filter on the hardware table, so they
+    only match results linked to it (see `backfill_typed_columns`). `min_coverage=1` keeps
+    only runs that scored every subsystem, GPU included; results stored before coverage
+    was recorded have none and are left out by any `min_coverage`.
+
+    Pages are served from an in-process cache until the next submission, with ETag and
+    Last-Modified headers; conditional requests get 304 Not Modified.
+    """
+    key = (config_name, limit, cursor, fields, cpu_model, gpu_model, min_memory_gb, min_coverage)
+    entry = leaderboard_cache.get(key)
+    if entry is None:
+        generation = leaderboard_cache.generation
+        page = await db.run_sync(leaderboard_page, config_name, limit, cursor, fields, cpu_model, gpu_model, min_memory_gb, min_coverage)
+        entry = leaderboard_cache.put(key, page, generation)
+    return cached_response(request, entry)
+
+def rank_within(db: Session, score: float, row_id: int, conditions, join_hardware: bool = False):
+    """
+    Position of a result among the results matching `conditions` (joined with the
+    hardware table if `join_hardware`), using the same
+    ordering as the leaderboard (score, then newest first). All three numbers come
+    from one pass over the (config_name, reference_index) indexes.
+
+    Returns:
+        dict: 'rank' (1 = best), 'total' and 'percentile', the share of the other
+              results that score lower (100 when the result is alone).
+    """
+    is_ahead = or_(
+        BenchmarkResult.reference_index > score,
+        and_(BenchmarkResult.reference_index == score, BenchmarkResult.id > row_id),
+    )
+    query = db.query(
+        func.count(BenchmarkResult.id),
+        func.sum(case((is_ahead, 1), else_=0)),
+        func.sum(case((BenchmarkResult.reference_index < score, 1), else_=0)),
+    ).filter(BenchmarkResult.reference_index.isnot(None), *conditions)
+    if join_hardware:
+        query = query.join(Hardware, BenchmarkResult.hardware_id == Hardware.id)
+    total, ahead, below = query.one()
+    ahead, below = ahead or 0, below or 0
+    percentile = 100.0 * below / (total - 1) if total > 1 else 100.0
+    return {"rank": ahead + 1, "total": total, "percentile": round(percentile, 1)}
+
+def rank_lookup(db: Session, uuid: str):
+    row = db.query(BenchmarkResult).filter(BenchmarkResult.uuid == uuid).first()
+    if row is None and len(uuid) >= 8:
+        # Range scan on the unique uuid index instead of LIKE, which may not use it
+        matches = (
+            db.query(BenchmarkResult)
+            .filter(BenchmarkResult.uuid >= uuid, BenchmarkResult.uuid < uuid + "\uffff")
+            .limit(2)
+            .all()
+        )
+        if len(matches) > 1:
+            raise HTTPException(status_code=409, detail=f"UUID prefix '{uuid}' matches more than one result")
+        row = matches[0] if matches else None
+    if row is None or row.reference_index is None:
+        raise HTTPException(status_code=404, detail="Result not found")
+
+    in_profile = BenchmarkResult.config_name == row.config_name
+    score, row_id = row.reference_index, row.id
+    result = {
+        "uuid": row.uuid,
+        "config_name": row.config_name,
+        "reference_index": score,
+        # Leaderboard cursor whose page (with config_name) starts at this result
+        "leaderboard_cursor": encode_cursor(score, row_id + 1),
+        "profile": rank_within(db, score, row_id, [in_profile]),
+        "cpu_cohort": None,
+        "gpu_cohort": None,
+    }
+    if row.hardware_id is None:
+        # Cohorts count linked rows only, which would leave this row out of its own cohort
+        return result
+
+    hardware = db.get(Hardware, row.hardware_id)
+    result["cpu_cohort"] = {"cpu_model": hardware.cpu_model, **rank_within(db, score, row_id, [in_profile, Hardware.cpu_model == hardware.cpu_model], join_hardware=True)}
+    result["gpu_cohort"] = {"gpu_model": hardware.gpu_model, **rank_within(db, score, row_id, [in_profile, Hardware.gpu_model == hardware.gpu_model], join_hardware=True)}
+    return result
+
+@app.get("/api/rank/{uuid}")
+async def get_rank(uuid: str, db: AsyncSession = Depends(get_async_read_db)):
+    """
+    Rank and percentile of one result within its profile, and within its hardware
+    cohorts: results of the same profile with the same CPU model or the same GPU.
+    The cohorts are null for results not yet linked to the hardware table (see
+    `db_manager.py migrate`).
+
+    `uuid` may also be a unique prefix of at least 8 characters, as shown on the leaderboard.
+    Pass 'leaderboard_cursor' to /api/leaderboard with the result's config_name to get
+    the leaderboard page that starts at it.
+    """
+    return await db.run_sync(rank_lookup, uuid)
+
+@app.get("/metrics", include_in_schema=False)
+@limiter.exempt
+async def get_metrics():
+    """Request, database and rejection metrics in the Prometheus text format."""
+    return Response(content=api_metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+# Aggregate statistics
+STATS_GROUPINGS = {"profile": None, "cpu_model": Hardware.cpu_model, "gpu_model": Hardware.gpu_model}
+STATS_METRICS = ("reference_index",) + METRIC_FIELDS
+STATS_PERCENTILES = (5, 25, 75, 95)
+STATS_DEFAULT_BINS = 20
+STATS_MAX_BINS = 100
+
+def stat_values(group_by: str, metrics, config_name: Optional[str] = None):
+    """
+    One row per (result, metric) with a value: config_name, the `group_by` column
+    (unless grouping by profile only), the metric name and its value. Hardware groupings
+    only include results linked to the hardware table.
+    """
+    group_column = STATS_GROUPINGS[group_by]
+    selects = []
+    for metric in metrics:
+        column = getattr(BenchmarkResult, metric)
+        columns = [BenchmarkResult.config_name.label("config_name")]
+        if group_column is not None:
+            columns.append(group_column.label(group_by))
+        query = select(*columns, literal(metric, String).label("metric"), column.label("value")).where(column.isnot(None))
+        if group_column is not None:
+            query = query.join(Hardware, BenchmarkResult.hardware_id == Hardware.id).where(group_column.isnot(None))
+        if config_name is not None:
+            query = query.where(BenchmarkResult.config_name == config_name)
+        selects.append(query)
+    return union_all(*selects).subquery("stat_values")
+
+def histogram_bucket(dialect_name: str, value, low, high, bins: int):
+    """0-based equal-width bucket of `value` in [low, high]; the maximum falls in the last bucket."""
+    if dialect_name == "postgresql":
+        bucket = func.least(func.width_bucket(value, low, high, bins), bins) - 1
+    else:
+        # SQLite truncates on CAST, which is floor() for the non-negative offset
+        bucket = func.min(cast((value - low) * bins / (high - low), Integer), bins - 1)
+    return case((high == low, 0), else_=bucket)
+
+def aggregate_statistics(db: Session, group_by: str = "profile", metrics=STATS_METRICS, config_name: Optional[str] = None,
+                         bins: int = STATS_DEFAULT_BINS, min_count: int = 1):
+    """
+    Count, min, max, mean, median, percentiles and an equal-width histogram of each metric,
+    per profile or per (profile, hardware model), computed in the database with window
+    functions. Percentiles use the nearest-rank method; the median averages the middle pair.
+
+    Returns:
+        list: One dict per group with 'config_name', the `group_by` value (if not 'profile')
+              and 'metrics': {metric: {'count', 'min', 'max', 'mean', 'median', 'p5', ...,
+              'histogram': {'edges', 'counts'}}}, ordered by profile and group.
+    """
+    values = stat_values(group_by, metrics, config_name)
+    key_names = ["config_name"] + ([group_by] if group_by != "profile" else [])
+    partition = [values.c[name] for name in key_names + ["metric"]]
+
+    ranked = select(
+        *partition,
+        values.c.value,
+        func.row_number().over(partition_by=partition, order_by=values.c.value).label("rn"),
+        func.count().over(partition_by=partition).label("n"),
+    ).subquery("ranked")
+    rn, n, value = ranked.c.rn, ranked.c.n, ranked.c.value
+    ranked_partition = [ranked.c[name] for name in key_names + ["metric"]]
+    summary = db.execute(
+        select(
+            *ranked_partition,
+            func.count().label("count"),
+            func.min(value).label("min"),
+            func.max(value).label("max"),
+            func.avg(value).label("mean"),
+            func.avg(case((or_(rn == (n + 1) // 2, rn == (n + 2) // 2), value))).label("median"),
+            *(func.max(case((rn == (n * p + 99) // 100, value))).label(f"p{p}") for p in STATS_PERCENTILES),
+        )
+        .group_by(*ranked_partition)
+        .having(func.count() >= min_count)
+        .order_by(*ranked_partition)
+    ).mappings().all()
+
+    windowed = select(
+        *partition,
+        values.c.value,
+        func.min(values.c.value).over(partition_by=partition).label("low"),
+        func.max(values.c.value).over(partition_by=partition).label("high"),
+    ).subquery("windowed")
+    bucket = histogram_bucket(db.get_bind().dialect.name, windowed.c.value, windowed.c.low, windowed.c.high, bins).label("bucket")
+    windowed_partition = [windowed.c[name] for name in key_names + ["metric"]]
+    histograms = {}
+    for row in db.execute(select(*windowed_partition, bucket, func.count().label("count")).group_by(*windowed_partition, bucket)).mappings():
+        counts = histograms.setdefault(tuple(row[name] for name in key_names + ["metric"]), [0] * bins)
+        counts[int(row["bucket"])] = row["count"]
+
+    groups = {}
+    for row in summary:
+        key = tuple(row[name] for name in key_names)
+        group = groups.get(key)
+        if group is None:
+            group = groups[key] = {name: row[name] for name in key_names}
+            group["metrics"] = {}
+        low, high = row["min"], row["max"]
+        group["metrics"][row["metric"]] = {
+            "count": row["count"],
+            "min": low,
+            "max": high,
+            "mean": row["mean"],
+            "median": row["median"],
+            **{f"p{p}": row[f"p{p}"] for p in STATS_PERCENTILES},
+            "histogram": {
+                "edges": [low + (high - low) * i / bins for i in range(bins + 1)],
+                "counts": histograms.get(key + (row["metric"],), [0] * bins),
+            },
+        }
+    return list(groups.values())
+
+@app.get("/api/stats")
+async def get_stats(
+    request: Request,
+    group_by: str = Query("profile", pattern="^(profile|cpu_model|gpu_model)$"),
+    metric: Optional[str] = None,
+    config_name: Optional[str] = None,
+    bins: int = Query(STATS_DEFAULT_BINS, ge=1, le=STATS_MAX_BINS),
+    min_count: int = Query(1, ge=1),
+    db: AsyncSession = Depends(get_async_read_db),
+):
+    """
+    Distribution of the reference index and every timing metric, per profile
+    (`group_by=profile`) or per profile and hardware model (`cpu_model`, `gpu_model`).
+
+    `metric` is a comma-separated subset of STATS_METRICS (default: all); groups with
+    fewer than `min_count` results are left out. Served from a cache that each
+    submission clears, with the same ETag and compression handling as the leaderboard.
+    """
+    metrics = [m.strip() for m in metric.split(",") if m.strip()] if metric else list(STATS_METRICS)
+    unknown = [m for m in metrics if m not in STATS_METRICS]
+    if unknown:
+        raise HTTPException(status_code=422, detail=f"Unknown metric(s): {', '.join(unknown)}. Allowed: {', '.join(STATS_METRICS)}")
+    key = (group_by, tuple(metrics), config_name, bins, min_count)
+    entry = stats_cache.get(key)
+    if entry is None:
+        generation = stats_cache.generation
+        groups = await db.run_sync(aggregate_statistics, group_by, metrics, config_name, bins, min_count)
+        entry = stats_cache.put(key, {"group_by": group_by, "metrics": metrics, "groups": groups}, generation)
+    return cached_response(request, entry)
 
 if __name__ == "__main__":
     print("Starting Uvicorn server...")
@@ -0,0 +1,255 @@
+#api_loadtest.py
+"""
+api_loadtest.py
+
+In-process load test for the leaderboard API. The app runs against a temporary
+SQLite database seeded with synthetic results and is driven through httpx's ASGI
+transport by concurrent clients, so no server or network is involved and runs are
+comparable between code changes.
+
+For each table size, the table is topped up to that many rows and every endpoint
+is measured at each concurrency level; throughput and p50/p95/p99 latency are
+printed and can be saved as JSON to compare before and after a change.
+
+Usage:
+    python -m benchHUB.main loadtest [--rows 1000 10000] [--concurrency 1 8 32]
+        [--requests 200] [--endpoints submit leaderboard ...] [--report-json load.json]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import tempfile
+import time
+import uuid
+
+PROFILE = "standard"
+SEED_CHUNK = 1000
+
+# Endpoint name -> fraction of --requests issued against it. Uncached statistics scan
+# the whole table, so they get fewer requests.
+ENDPOINTS = {
+    "submit": 1.0,
+    "leaderboard": 1.0,
+    "leaderboard_cached": 1.0,
+    "leaderboard_filtered": 1.0,
+    "rank": 1.0,
+    "stats": 0.1,
+    "mixed": 1.0,
+}
+
+
+def synthetic_payload(rng: random.Random, n_samples: int = 5) -> dict:
+    """
+    A submission that passes the API's validation and score check: the reference
+    machine's timings scaled by a random factor, with per-run samples around them.
+    """
+    from benchHUB.config.reference_machine import REFERENCE_MACHINES
+    from benchHUB.reference_index import SCORING_VERSION, score_results
+
+    factor = rng.uniform(0.5, 2.0)
+    reference = REFERENCE_MACHINES[SCORING_VERSION][PROFILE]
+    payload = {
+        subsystem: {metric: seconds * factor * rng.uniform(0.95, 1.05) for metric, seconds in metrics.items()}
+        for subsystem, metrics in reference.items()
+    }
+    payload["samples"] = {
+        subsystem: {metric: [value * rng.uniform(0.97, 1.03) for _ in range(n_samples)] for metric, value in metrics.items()}
+        for subsystem, metrics in payload.items()
+    } if n_samples else {}
+    payload.update({
+        "system_info": {
+            "os": "Linux",
+            "cpu": {"model": f"Load Test CPU {rng.randint(1, 20)}", "cores": rng.choice([4, 8, 16])},
+            "memory": {"total_gb": float(rng.choice([16, 32, 64]))},
+            "gpus": [{"name": f"Load Test GPU {rng.randint(1, 5)}"}],
+        },
+        "config_name": PROFILE,
+        "scoring_version": SCORING_VERSION,
+        "uuid": str(uuid.UUID(int=rng.getrandbits(128))),
+        "timestamp": "2025-01-01T00:00:00",
+    })
+    payload["reference_index"] = score_results(payload, SCORING_VERSION)["index"]
+    return payload
+
+
+def seed_rows(api, rng: random.Random, target: int) -> list:
+    """
+    Insert synthetic results directly (bypassing HTTP and the bootstrap) until the
+    table holds `target` rows.
+
+    :return: The uuids of the inserted rows.
+    """
+    uuids = []
+    with api.SessionLocal() as db:
+        missing = target - db.query(api.BenchmarkResult).count()
+        while missing > 0:
+            accepted = []
+            for index in range(min(missing, SEED_CHUNK)):
+                payload = api.BenchmarkPayload.model_validate(synthetic_payload(rng, 0))
+                verification = {"score": payload.reference_index, "interval": None, "coverage": 1.0, "missing": []}
+                accepted.append((index, payload, payload.model_dump(), verification))
+            api.insert_batch(db, accepted)
+            db.commit()
+            uuids.extend(payload.uuid for _, payload, _, _ in accepted)
+            missing -= len(accepted)
+    api.invalidate_caches()
+    return uuids
+
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+async def run_load(client, make_request, n_requests: int, concurrency: int) -> dict:
+    """
+    Issue `n_requests` requests from `concurrency` concurrent workers.
+
+    :param make_request: Callable taking (client, request number) and returning an awaitable response.
+    :return: 'rps', 'errors' and 'p50'/'p95'/'p99' latencies in milliseconds.
+    """
+    latencies, errors = [], 0
+    counter = iter(range(n_requests))
+
+    async def worker():
+        nonlocal errors
+        for i in counter:
+            started = time.perf_counter()
+            try:
+                response = await make_request(client, i)
+                failed = response.status_code >= 400
+            except Exception:
+                failed = True
+            latencies.append((time.perf_counter() - started) * 1000)
+            errors += failed
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    return {
+        "rps": n_requests / elapsed,
+        "errors": errors,
+        "p50": statistics.median(latencies),
+        "p95": percentile(latencies, 0.95),
+        "p99": percentile(latencies, 0.99),
+    }
+
+
+def print_row(rows: int, endpoint: str, concurrency: int, stats: dict):
+    print(
+        f"{rows:>7} {endpoint:<22} {concurrency:>5} {stats['rps']:>9.1f} {stats['p50']:>8.1f} "
+        f"{stats['p95']:>8.1f} {stats['p99']:>8.1f} {stats['errors']:>7}"
+    )
+
+
+def request_factories(api, payloads, seeded_uuids: list) -> dict:
+    """
+    One request function per endpoint in ENDPOINTS, taking (client, request number).
+    Uncached variants clear the response cache first, so every request reaches the database.
+    """
+    submitted = iter(payloads)
+
+    async def submit(client, _):
+        return await client.post("/api/submit", json=next(submitted))
+
+    async def leaderboard(client, _):
+        api.leaderboard_cache.invalidate()
+        return await client.get("/api/leaderboard", params={"config_name": PROFILE})
+
+    async def leaderboard_cached(client, _):
+        return await client.get("/api/leaderboard", params={"config_name": PROFILE})
+
+    async def leaderboard_filtered(client, i):
+        api.leaderboard_cache.invalidate()
+        return await client.get("/api/leaderboard", params={"config_name": PROFILE, "cpu_model": f"Load Test CPU {i % 20 + 1}"})
+
+    async def rank(client, i):
+        return await client.get(f"/api/rank/{seeded_uuids[i % len(seeded_uuids)]}")
+
+    async def stats(client, _):
+        api.stats_cache.invalidate()
+        return await client.get("/api/stats", params={"config_name": PROFILE})
+
+    async def mixed(client, i):
+        # Every fourth request submits, so reads contend with writes
+        if i % 4 == 0:
+            return await submit(client, i)
+        return await (leaderboard, leaderboard_filtered, rank)[i % 4 - 1](client, i)
+
+    return {
+        "submit": submit,
+        "leaderboard": leaderboard,
+        "leaderboard_cached": leaderboard_cached,
+        "leaderboard_filtered": leaderboard_filtered,
+        "rank": rank,
+        "stats": stats,
+        "mixed": mixed,
+    }
+
+
+async def run(args) -> list:
+    import httpx
+    from benchHUB import api
+
+    api.limiter.enabled = False  # Measure the endpoints, not the rate limiter
+    rng = random.Random(0)
+    endpoints = args.endpoints or list(ENDPOINTS)
+    n_submits = args.requests * len(args.concurrency) * len(args.rows) * (("submit" in endpoints) + ("mixed" in endpoints))
+    payloads = [synthetic_payload(rng, args.samples) for _ in range(n_submits)]
+
+    await api.startup()  # httpx's ASGI transport does not run the app's lifespan
+    report = []
+    seeded_uuids = []
+    transport = httpx.ASGITransport(app=api.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://loadtest") as client:
+        print(f"{'Rows':>7} {'Endpoint':<22} {'Conc.':>5} {'Req/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'Errors':>7}")
+        factories = request_factories(api, payloads, seeded_uuids)
+        for rows in sorted(args.rows):
+            started = time.perf_counter()
+            seeded_uuids.extend(seed_rows(api, rng, rows))
+            if args.verbose:
+                print(f"Seeded the table to {rows} rows in {time.perf_counter() - started:.1f}s")
+            for endpoint in endpoints:
+                if endpoint == "rank" and not seeded_uuids:
+                    continue
+                n_requests = max(1, int(args.requests * ENDPOINTS[endpoint]))
+                for concurrency in args.concurrency:
+                    stats = await run_load(client, factories[endpoint], n_requests, concurrency)
+                    print_row(rows, endpoint, concurrency, stats)
+                    report.append({"rows": rows, "endpoint": endpoint, "concurrency": concurrency, "requests": n_requests, **stats})
+    await api.shutdown()
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="In-process load test for the leaderboard API.")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000], help="Table sizes to measure at.")
+    parser.add_argument("--requests", type=int, default=200, help="Requests per endpoint, table size and concurrency level.")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32], help="Concurrent clients.")
+    parser.add_argument("--endpoints", nargs="+", choices=list(ENDPOINTS), help="Endpoints to measure (default: all).")
+    parser.add_argument("--samples", type=int, default=5, help="Per-run samples per metric in each submission.")
+    parser.add_argument("--write-behind", action="store_true", help="Group-commit submissions (SUBMIT_WRITE_BEHIND).")
+    parser.add_argument("--report-json", help="Write the measurements to this JSON file.")
+    parser.add_argument("--verbose", action="store_true", help="Print seeding progress.")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as directory:
+        # Read by api.startup()
+        os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(directory, 'loadtest.db')}"
+        if args.write_behind:
+            os.environ["SUBMIT_WRITE_BEHIND"] = "1"
+        report = asyncio.run(run(args))
+
+    if args.report_json:
+        with open(args.report_json, "w") as f:
+            json.dump(report, f, indent=4)
+        print(f"\nReport saved to: {args.report_json}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,228 @@
+#api_metrics.py
+"""
+api_metrics.py
+
+Request metrics for the leaderboard API, exposed in the Prometheus text format
+(`render()`, served at /metrics).
+
+Metrics are recorded on the event loop thread: by the ASGI middleware and by
+SQLAlchemy cursor events, which run inside the async session's greenlets on
+that thread. Counters are plain integers and each histogram series is a
+preallocated list of bucket counts, so recording a value needs no lock, and
+after a label set's first request it allocates nothing.
+"""
+
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from starlette.routing import Match
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+DB_OPERATIONS = ("SELECT", "INSERT", "UPDATE", "DELETE")
+UNMATCHED_ROUTE = "unmatched"
+
+# Database time spent by the current request (or write-behind flush), as a one-element
+# list the cursor events add to
+request_db_time = ContextVar("request_db_time", default=None)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names, values, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """
+    A monotonically increasing count per label set.
+    """
+
+    def __init__(self, name: str, documentation: str, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.values = {}
+
+    def inc(self, labels=(), amount=1):
+        self.values[labels] = self.values.get(labels, 0) + amount
+
+    def render(self) -> list:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        for labels, value in sorted(self.values.items()):
+            lines.append(f"{self.name}{_labels(self.labelnames, labels)} {_number(value)}")
+        return lines
+
+
+class Histogram:
+    """
+    A Prometheus histogram per label set. Each series is a list of per-bucket counts
+    (the last one for +Inf) followed by the sum; counts are made cumulative on render.
+    """
+
+    def __init__(self, name: str, documentation: str, buckets, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.buckets = tuple(buckets)
+        self.labelnames = tuple(labelnames)
+        self.series = {}
+
+    def observe(self, value: float, labels=()):
+        series = self.series.get(labels)
+        if series is None:
+            series = self.series[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+        series[bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def render(self) -> list:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        for labels, series in sorted(self.series.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + ("+Inf",), series[:-1]):
+                cumulative += count
+                le = 'le="%s"' % (bound if bound == "+Inf" else _number(bound))
+                lines.append(f"{self.name}_bucket{_labels(self.labelnames, labels, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, labels)} {_number(series[-1])}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, labels)} {cumulative}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self.metrics = []
+
+    def counter(self, name: str, documentation: str, labelnames=()) -> Counter:
+        metric = Counter(name, documentation, labelnames)
+        self.metrics.append(metric)
+        return metric
+
+    def histogram(self, name: str, documentation: str, buckets, labelnames=()) -> Histogram:
+        metric = Histogram(name, documentation, buckets, labelnames)
+        self.metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        return "\n".join(line for metric in self.metrics for line in metric.render()) + "\n"
+
+
+registry = Registry()
+http_requests = registry.counter(
+    "benchhub_http_requests_total", "HTTP requests by route and status.", ("method", "route", "status"))
+http_duration = registry.histogram(
+    "benchhub_http_request_duration_seconds", "Time to serve a request.", LATENCY_BUCKETS, ("method", "route"))
+http_request_size = registry.histogram(
+    "benchhub_http_request_size_bytes", "Request body size as sent (Content-Length).", SIZE_BUCKETS, ("route",))
+http_response_size = registry.histogram(
+    "benchhub_http_response_size_bytes", "Response body size as sent.", SIZE_BUCKETS, ("route",))
+db_query_duration = registry.histogram(
+    "benchhub_db_query_duration_seconds", "Time per database statement.", LATENCY_BUCKETS, ("operation",))
+db_request_duration = registry.histogram(
+    "benchhub_db_time_per_request_seconds", "Total database time per request.", LATENCY_BUCKETS, ("route",))
+write_behind_flush_db = registry.histogram(
+    "benchhub_write_behind_flush_db_seconds",
+    "Database time per write-behind flush, which no request's database time includes.", LATENCY_BUCKETS)
+validation_failures = registry.counter(
+    "benchhub_validation_failures_total",
+    "Rejected submissions or parameters: 'schema' for invalid input, 'score' for failed score verification.",
+    ("route", "reason"))
+rate_limited = registry.counter(
+    "benchhub_rate_limited_total", "Requests rejected by the rate limiter.", ("route",))
+
+
+def route_label(scope) -> str:
+    """
+    The path template of the route serving `scope` (e.g. '/api/rank/{uuid}'), so label
+    values stay bounded; 'unmatched' for paths no route handles.
+    """
+    app = scope.get("app")
+    endpoint = scope.get("endpoint")
+    for route in getattr(app, "routes", ()):
+        if endpoint is not None:
+            if getattr(route, "endpoint", None) is endpoint:
+                return route.path
+        elif route.matches(scope)[0] == Match.FULL:
+            return route.path
+    return UNMATCHED_ROUTE
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording the count, latency, body sizes and database time of each
+    HTTP request. Add it last, so it also sees responses from the rate limiter.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        db_time = [0.0]
+        token = request_db_time.set(db_time)
+        status = 500
+        response_bytes = 0
+
+        async def send_with_metrics(message):
+            nonlocal status, response_bytes
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                response_bytes += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_metrics)
+        finally:
+            request_db_time.reset(token)
+            route = route_label(scope)
+            method = scope["method"]
+            http_requests.inc((method, route, status))
+            http_duration.observe(time.perf_counter() - started, (method, route))
+            http_response_size.observe(response_bytes, (route,))
+            db_request_duration.observe(db_time[0], (route,))
+            for name, value in scope["headers"]:
+                if name == b"content-length":
+                    http_request_size.observe(int(value), (route,))
+                    break
+
+
+def statement_operation(statement: str) -> str:
+    operation = statement.lstrip()[:6].upper()
+    return operation if operation in DB_OPERATIONS else "OTHER"
+
+
+def instrument_engine(engine):
+    """
+    Time every statement run on `engine` (a sync Engine, or an AsyncEngine's
+    `sync_engine`) and add it to the current request's database time.
+    """
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def start_timer(conn, cursor, statement, parameters, context, executemany):
+        context._metrics_started = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def stop_timer(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - context._metrics_started
+        db_query_duration.observe(elapsed, (statement_operation(statement),))
+        db_time = request_db_time.get()
+        if db_time is not None:
+            db_time[0] += elapsed
+
+
+def render() -> str:
+    return registry.render()
@@ -0,0 +1,261 @@
+#compare.py
+"""
+compare.py
+
+Compare a benchmark run against earlier runs on the same hardware (same
+`hardware_fingerprint` and profile) and report which metrics changed significantly,
+e.g. after a kernel, BIOS or driver update.
+
+Each metric's per-run timings are compared with a two-sided Mann-Whitney U test;
+p-values are Holm-corrected across metrics. Runs saved before per-run samples were
+recorded contribute their median time as a single observation.
+
+Usage:
+    python -m benchHUB.compare [RESULT_FILE] [--results-dir results] [--alpha 0.05]
+"""
+
+import argparse
+import json
+import math
+import os
+import statistics
+from typing import Dict, List, Optional
+
+from benchHUB.reference_index import SUBSYSTEM_METRICS, metric_value
+from benchHUB.results_store import DEFAULT_STORE_NAME, ResultsStore, timestamp_from_filename
+from benchHUB.utils.hardware import hardware_fingerprint
+
+DEFAULT_ALPHA = 0.05
+# Changes smaller than this are not reported even if statistically significant.
+DEFAULT_MIN_CHANGE = 0.02
+
+
+def rank(values: List[float]) -> List[float]:
+    """
+    1-based ranks of `values`, with tied values sharing the average rank.
+    """
+    order = sorted(range(len(values)), key=values.__getitem__)
+    ranks = [0.0] * len(values)
+    i = 0
+    while i < len(order):
+        j = i
+        while j + 1 < len(order) and values[order[j + 1]] == values[order[i]]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[order[k]] = (i + j) / 2 + 1
+        i = j + 1
+    return ranks
+
+
+def mann_whitney_u(current: List[float], baseline: List[float]):
+    """
+    Two-sided Mann-Whitney U test (normal approximation with tie and continuity correction).
+
+    Returns:
+        tuple: (rank-biserial effect size, p-value). The effect size is in [-1, 1];
+               positive means `current` tends to be larger (slower, for timings).
+    """
+    n1, n2 = len(current), len(baseline)
+    ranks = rank(list(current) + list(baseline))
+    u = sum(ranks[:n1]) - n1 * (n1 + 1) / 2
+    effect = 2 * u / (n1 * n2) - 1
+
+    n = n1 + n2
+    counts: Dict[float, int] = {}
+    for value in list(current) + list(baseline):
+        counts[value] = counts.get(value, 0) + 1
+    tie_term = sum(t ** 3 - t for t in counts.values()) / (n * (n - 1))
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term)
+    if variance <= 0:
+        return effect, 1.0
+    deviation = max(abs(u - n1 * n2 / 2) - 0.5, 0.0)
+    p_value = math.erfc(deviation / math.sqrt(variance) / math.sqrt(2))
+    return effect, min(p_value, 1.0)
+
+
+def holm_correction(p_values: List[float]) -> List[float]:
+    """
+    Holm-Bonferroni adjusted p-values, in the order given.
+    """
+    order = sorted(range(len(p_values)), key=p_values.__getitem__)
+    adjusted = [1.0] * len(p_values)
+    running = 0.0
+    for position, index in enumerate(order):
+        running = max(running, min((len(p_values) - position) * p_values[index], 1.0))
+        adjusted[index] = running
+    return adjusted
+
+
+def _is_time(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and value > 0
+
+
+def run_samples(result: dict) -> Dict[str, List[float]]:
+    """
+    Per-run timings of a result as {"cpu.calculate_primes": [seconds, ...]}.
+    Results without recorded samples fall back to the median of each scored timing
+    metric as one observation.
+    """
+    samples = {}
+    for subsystem, metrics in (result.get("samples") or {}).items():
+        for metric, runs in (metrics or {}).items():
+            runs = [v for v in runs or [] if _is_time(v)]
+            if runs:
+                samples[f"{subsystem}.{metric}"] = runs
+    if not samples:
+        for subsystem, metrics in SUBSYSTEM_METRICS.items():
+            for metric, (keys, _) in metrics.items():
+                value = metric_value(result.get(subsystem), keys)
+                if value is not None:
+                    samples[f"{subsystem}.{metric}"] = [value]
+    return samples
+
+
+def history_samples(store: ResultsStore, current: dict, metrics: List[str], source: Optional[str] = None) -> Dict[str, List[float]]:
+    """
+    Pool the timings of earlier runs with the same hardware fingerprint and profile.
+
+    :param store: Results store holding the history.
+    :param current: The run being compared; it is excluded from the history.
+    :param metrics: Metric names ("cpu.calculate_primes", ...) to collect.
+    :param source: Path of the file `current` was loaded from, if any.
+    :return: {metric: [seconds, ...]} for metrics with at least one observation.
+    """
+    sample_columns = [f"samples.{metric}" for metric in metrics]
+    history = store.query(
+        columns=["uuid", "source", "timestamp"] + metrics + sample_columns,
+        end=current.get("timestamp") or (timestamp_from_filename(source) if source else None),
+        config_name=current.get("config_name"),
+        fingerprint=hardware_fingerprint(current.get("system_info", {})),
+    )
+    if current.get("uuid"):
+        history = history[history["uuid"] != current["uuid"]]
+    if source:
+        history = history[history["source"].isna() | (history["source"].map(
+            lambda s: not isinstance(s, str) or os.path.abspath(s) != os.path.abspath(source)))]
+
+    pooled: Dict[str, List[float]] = {metric: [] for metric in metrics}
+    for _, row in history.iterrows():
+        for metric in metrics:
+            runs = json.loads(row[f"samples.{metric}"]) if isinstance(row[f"samples.{metric}"], str) else None
+            if runs:
+                pooled[metric].extend(v for v in runs if _is_time(v))
+            elif _is_time(row[metric]):
+                pooled[metric].append(float(row[metric]))
+    return {metric: values for metric, values in pooled.items() if values}
+
+
+def compare_samples(
+    current: Dict[str, List[float]],
+    baseline: Dict[str, List[float]],
+    alpha: float = DEFAULT_ALPHA,
+    min_change: float = DEFAULT_MIN_CHANGE,
+) -> List[dict]:
+    """
+    Test every metric present in both `current` and `baseline` for a shift in timings.
+
+    Returns:
+        list: One dict per metric with 'metric', 'current' and 'baseline' medians,
+              'change' (relative change of the median; positive is slower), 'effect'
+              (rank-biserial), 'p_value' (Holm-corrected), 'n_current', 'n_baseline'
+              and 'verdict' ('regression', 'improvement' or 'unchanged'), ordered with
+              regressions first, then improvements, each by decreasing effect size.
+    """
+    rows = []
+    for metric in sorted(set(current) & set(baseline)):
+        effect, p_value = mann_whitney_u(current[metric], baseline[metric])
+        current_median = statistics.median(current[metric])
+        baseline_median = statistics.median(baseline[metric])
+        rows.append({
+            "metric": metric,
+            "current": current_median,
+            "baseline": baseline_median,
+            "change": current_median / baseline_median - 1,
+            "effect": effect,
+            "p_value": p_value,
+            "n_current": len(current[metric]),
+            "n_baseline": len(baseline[metric]),
+        })
+
+    for row, adjusted in zip(rows, holm_correction([row["p_value"] for row in rows])):
+        row["p_value"] = adjusted
+        if adjusted < alpha and abs(row["change"]) >= min_change:
+            row["verdict"] = "regression" if row["change"] > 0 else "improvement"
+        else:
+            row["verdict"] = "unchanged"
+
+    priority = {"regression": 0, "improvement": 1, "unchanged": 2}
+    rows.sort(key=lambda row: (priority[row["verdict"]], -abs(row["effect"]), -abs(row["change"])))
+    return rows
+
+
+def print_comparison(rows: List[dict], show_all: bool = False):
+    """
+    Print the comparison as a table. Unchanged metrics are only counted unless `show_all`.
+    """
+    shown = [row for row in rows if show_all or row["verdict"] != "unchanged"]
+    if not shown:
+        print(f"No significant changes across {len(rows)} metric(s).")
+        return
+    header = f"{'Metric':<40} {'Baseline':>11} {'Current':>11} {'Change':>8} {'Effect':>7} {'p':>8}  Verdict"
+    print(header)
+    print("-" * len(header))
+    for row in shown:
+        print(
+            f"{row['metric']:<40} {row['baseline']:>10.4f}s {row['current']:>10.4f}s "
+            f"{row['change']:>+8.1%} {row['effect']:>+7.2f} {row['p_value']:>8.3g}  {row['verdict']}"
+        )
+    hidden = len(rows) - len(shown)
+    if hidden:
+        print(f"({hidden} metric(s) without a significant change)")
+
+
+def latest_result_file(results_dir: str) -> Optional[str]:
+    """
+    Path of the newest 'benchmark_*.json' file in `results_dir`, by name.
+    """
+    files = sorted(
+        name for name in os.listdir(results_dir)
+        if name.endswith(".json") and timestamp_from_filename(name)
+    )
+    return os.path.join(results_dir, files[-1]) if files else None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare a run against earlier runs on the same hardware.")
+    parser.add_argument("result", nargs="?", help="Result JSON to compare (default: the newest file in --results-dir).")
+    parser.add_argument("--results-dir", default="results", help="Directory holding earlier results.")
+    parser.add_argument("--alpha", type=float, default=DEFAULT_ALPHA, help="Significance level after Holm correction.")
+    parser.add_argument("--min-change", type=float, default=DEFAULT_MIN_CHANGE, help="Smallest relative change to report.")
+    parser.add_argument("--all", action="store_true", help="Also list metrics without a significant change.")
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(args.results_dir):
+        print(f"Results directory '{args.results_dir}' does not exist.")
+        return 1
+    path = args.result or latest_result_file(args.results_dir)
+    if not path:
+        print(f"No results found in '{args.results_dir}'.")
+        return 1
+    with open(path, "r") as f:
+        current = json.load(f)
+
+    store = ResultsStore(os.path.join(args.results_dir, DEFAULT_STORE_NAME))
+    try:
+        store.sync_directory(args.results_dir)
+        current_samples = run_samples(current)
+        baseline = history_samples(store, current, list(current_samples), source=path)
+    finally:
+        store.close()
+
+    print(f"Comparing {os.path.basename(path)} ({current.get('config_name', 'standard')} profile) "
+          f"against earlier runs on hardware {hardware_fingerprint(current.get('system_info', {}))}")
+    if not baseline:
+        print("No earlier runs of this profile on the same hardware.")
+        return 0
+    print_comparison(compare_samples(current_samples, baseline, args.alpha, args.min_change), show_all=args.all)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
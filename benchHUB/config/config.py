@@ -11,6 +11,12 @@ CONFIG_PROFILES = {
         "GPU_MATRIX_SHAPE": (4096, 4096),       # 4k matrix
         "ML_N_SAMPLES": 5000,
         "ML_N_FEATURES": 10,
+        "TORCH_CPU_MATRIX_SIZE": 512,           # 512x512 CPU matmul
+        "TORCH_CPU_BATCH_SIZE": 64,
+        "PANDAS_N_ROWS": 200_000,               # 200k row DataFrame
+        "PLOT_SCATTER_POINTS": 50_000,          # Scatter plot points
+        "PLOT_N_FRAMES": 50,                    # Animation frames
+        "PLOT_IMAGE_SHAPE": (2000, 2000),       # 2k image render
     },
     "standard": {
         "N_RUNS": 3,
@@ -20,6 +26,12 @@ CONFIG_PROFILES = {
         "GPU_MATRIX_SHAPE": (8192, 8192),       # 8k matrix
         "ML_N_SAMPLES": 10000,
         "ML_N_FEATURES": 20,
+        "TORCH_CPU_MATRIX_SIZE": 1024,          # 1024x1024 CPU matmul
+        "TORCH_CPU_BATCH_SIZE": 128,
+        "PANDAS_N_ROWS": 1_000_000,             # 1M row DataFrame
+        "PLOT_SCATTER_POINTS": 100_000,         # Scatter plot points
+        "PLOT_N_FRAMES": 100,                   # Animation frames
+        "PLOT_IMAGE_SHAPE": (4000, 4000),       # 4k image render
     },
     "heavy": {
         "N_RUNS": 5,
@@ -29,6 +41,12 @@ CONFIG_PROFILES = {
         "GPU_MATRIX_SHAPE": (10000, 10000),      # 10k matrix
         "ML_N_SAMPLES": 20000,
         "ML_N_FEATURES": 50,
+        "TORCH_CPU_MATRIX_SIZE": 2048,          # 2048x2048 CPU matmul
+        "TORCH_CPU_BATCH_SIZE": 256,
+        "PANDAS_N_ROWS": 5_000_000,             # 5M row DataFrame
+        "PLOT_SCATTER_POINTS": 250_000,         # Scatter plot points
+        "PLOT_N_FRAMES": 200,                   # Animation frames
+        "PLOT_IMAGE_SHAPE": (6000, 6000),       # 6k image render
     },
 }
 
@@ -0,0 +1,40 @@
+# config/reference_machine.py
+# Metric values of the reference machine that each scoring version normalizes against.
+# A machine that matches these values on every metric scores exactly REFERENCE_SCORE.
+#
+# Version 2.0 reference: Apple M4 Max (14 cores, 36 GB). The light values come from a
+# light-profile run of that machine (results/benchmark_20250712_133444.json), with the
+# GPU and plot timings re-estimated for the synchronised accelerator benchmark and
+# in-memory rendering. Standard and heavy values are scaled from light by workload size.
+# All values are seconds (lower is better).
+
+REFERENCE_SCORE = 1000.0
+
+REFERENCE_MACHINES = {
+    "2.0": {
+        "light": {
+            "cpu": {"calculate_primes": 0.0063, "parallel_processing": 0.77},
+            "memory": {"memory_bandwidth": 0.035},
+            "gpu": {"gpu_tensor_operations": 0.0125, "gpu_tiny_training_loop": 0.0027},
+            "disk": {"disk_write_read": 0.0126},
+            "ml": {"train_random_forest": 0.40},
+            "plot": {"generate_scatter_plot": 0.05, "animate_sine_wave": 0.25, "render_large_image": 0.08},
+        },
+        "standard": {
+            "cpu": {"calculate_primes": 0.025, "parallel_processing": 0.77},
+            "memory": {"memory_bandwidth": 0.0875},
+            "gpu": {"gpu_tensor_operations": 0.1, "gpu_tiny_training_loop": 0.0027},
+            "disk": {"disk_write_read": 0.0252},
+            "ml": {"train_random_forest": 1.15},
+            "plot": {"generate_scatter_plot": 0.1, "animate_sine_wave": 0.5, "render_large_image": 0.32},
+        },
+        "heavy": {
+            "cpu": {"calculate_primes": 0.07, "parallel_processing": 0.77},
+            "memory": {"memory_bandwidth": 0.175},
+            "gpu": {"gpu_tensor_operations": 0.182, "gpu_tiny_training_loop": 0.0027},
+            "disk": {"disk_write_read": 0.0504},
+            "ml": {"train_random_forest": 3.6},
+            "plot": {"generate_scatter_plot": 0.25, "animate_sine_wave": 1.0, "render_large_image": 0.72},
+        },
+    },
+}
@@ -10,13 +10,15 @@ def cpu_task(_):
     """
     return sum([i**2 for i in range(10000)])
 
-def cpu_benchmark(config: dict):
+def cpu_benchmark(config: dict, samples: dict = None):
     """
     Run CPU benchmarks using parameters from a configuration dictionary.
 
     Args:
         config (dict): A dictionary containing benchmark parameters.
                        Expected keys: 'CPU_PRIME_LIMIT', 'N_RUNS'.
+        samples (dict): Optional dictionary that receives the individual run times
+                        of each benchmark, keyed like the returned timings.
 
     Returns:
         dict: A dictionary with timing results for each benchmark.
@@ -25,7 +27,7 @@ def cpu_benchmark(config: dict):
     timing_results = {}
 
     # Create local, decorated versions of the functions
-    @timing_decorator(timings=timing_results)
+    @timing_decorator(timings=timing_results, samples=samples)
     def calculate_primes(max_number: int):
         primes = []
         for num in range(2, max_number + 1):
@@ -38,7 +40,7 @@ def cpu_benchmark(config: dict):
                 primes.append(num)
         return primes
 
-    @timing_decorator(timings=timing_results)
+    @timing_decorator(timings=timing_results, samples=samples)
     def parallel_processing():
         with Pool(cpu_count()) as pool:
             pool.map(cpu_task, range(cpu_count()))
@@ -8,14 +8,96 @@ in a SQLite database. Adjust as needed for your own environment.
 
 import sqlite3
 import json
+from collections.abc import Mapping
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterable, Iterator, List, Optional
+
+# Columns holding a JSON blob per benchmark component.
+JSON_COLUMNS = ("system_info", "cpu", "memory", "gpu", "disk", "ml", "plot")
+
+# Schema migrations, applied in order. The schema version is kept in SQLite's
+# `user_version` pragma, so each step runs exactly once per database file.
+MIGRATIONS = [
+    # 1: initial table
+    [
+        """
+        CREATE TABLE IF NOT EXISTS benchmarks (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            timestamp TEXT NOT NULL,
+            system_info TEXT NOT NULL,
+            cpu TEXT,
+            memory TEXT,
+            gpu TEXT,
+            disk TEXT,
+            ml TEXT,
+            plot TEXT,
+            notes TEXT,
+            config_name TEXT,
+            uuid TEXT
+        )
+        """,
+    ],
+    # 2: lookup indexes
+    [
+        "CREATE INDEX IF NOT EXISTS idx_benchmarks_uuid ON benchmarks (uuid)",
+        "CREATE INDEX IF NOT EXISTS idx_benchmarks_config_name ON benchmarks (config_name)",
+        "CREATE INDEX IF NOT EXISTS idx_benchmarks_timestamp ON benchmarks (timestamp)",
+    ],
+]
+
+INSERT_QUERY = """
+INSERT INTO benchmarks (
+    timestamp,
+    system_info,
+    cpu,
+    memory,
+    gpu,
+    disk,
+    ml,
+    plot,
+    notes,
+    config_name,
+    uuid
+)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+class BenchmarkRow(Mapping):
+    """
+    A read-only view of one row in 'benchmarks'. JSON columns are decoded on first
+    access, so callers that only look at a few fields never parse the rest.
+    """
+
+    def __init__(self, row: sqlite3.Row):
+        self._row = row
+        self._decoded = {}
+
+    def __getitem__(self, key):
+        if key in JSON_COLUMNS:
+            if key not in self._decoded:
+                raw = self._row[key]
+                self._decoded[key] = json.loads(raw) if raw else None
+            return self._decoded[key]
+        try:
+            return self._row[key]
+        except IndexError:
+            raise KeyError(key)
+
+    def __iter__(self):
+        return iter(self._row.keys())
+
+    def __len__(self):
+        return len(self._row.keys())
 
 
 class BenchmarkDB:
     """
     A small class to manage SQLite database operations for benchmark results.
     You can store results, retrieve them, or drop the table if needed.
+
+    A single connection in WAL mode is kept open for the lifetime of the object;
+    call `close()` or use it as a context manager when done.
     """
 
     def __init__(self, db_path: str = "benchmark_results.db"):
@@ -23,34 +105,52 @@ class BenchmarkDB:
         :param db_path: Path to the SQLite database file.
         """
         self.db_path = db_path
+        self._conn = sqlite3.connect(db_path)
+        self._conn.row_factory = sqlite3.Row
+        if db_path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
         self._init_db()
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
     def _init_db(self):
         """
-        Create the 'benchmarks' table if it doesn't exist yet.
+        Bring the 'benchmarks' table up to the latest schema version.
         The table stores each component of the benchmark results as a JSON blob,
-        plus a timestamp and optional notes.
+        plus a timestamp and optional notes. Existing rows are kept.
         """
-        query = """
-        CREATE TABLE IF NOT EXISTS benchmarks (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            timestamp TEXT NOT NULL,
-            system_info TEXT NOT NULL,
-            cpu TEXT,
-            memory TEXT,
-            gpu TEXT,
-            disk TEXT,
-            ml TEXT,
-            plot TEXT,
-            notes TEXT,
-            config_name TEXT,
-            uuid TEXT
-        )
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        for number, statements in enumerate(MIGRATIONS[version:], start=version + 1):
+            with self._conn:
+                for statement in statements:
+                    self._conn.execute(statement)
+                self._conn.execute(f"PRAGMA user_version = {number}")
+
+    def schema_version(self) -> int:
+        """
+        :return: The schema version the database has been migrated to.
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("DROP TABLE IF EXISTS benchmarks") # Ensure table is fresh
-            conn.execute(query)
-            conn.commit()
+        return self._conn.execute("PRAGMA user_version").fetchone()[0]
+
+    def _row(self, results: Dict[str, Any], notes: str, config_name: str, uuid: Optional[str]) -> list:
+        # Ensure required field "system_info" is present
+        if "system_info" not in results:
+            raise ValueError("Results must contain 'system_info' key.")
+
+        now_str = datetime.utcnow().isoformat()
+        return [
+            now_str,
+            json.dumps(results["system_info"]),
+            *(json.dumps(results.get(column, {})) for column in JSON_COLUMNS[1:]),
+            notes,
+            config_name,
+            uuid,
+        ]
 
     def store_results(
         self,
@@ -67,55 +167,63 @@ class BenchmarkDB:
         :param notes:   Optional notes about the run (machine name, environment, etc.).
         :return:        The ID of the newly inserted record.
         """
+        with self._conn:
+            cursor = self._conn.execute(INSERT_QUERY, self._row(results, notes, config_name, uuid))
+        return cursor.lastrowid
 
-        # Ensure required field "system_info" is present
-        if "system_info" not in results:
-            raise ValueError("Results must contain 'system_info' key.")
+    def store_many(self, runs: Iterable[Dict[str, Any]], notes: str = "", config_name: str = "standard") -> int:
+        """
+        Store several result sets in one transaction with a single batched insert.
 
-        # Prepare data
-        now_str = datetime.utcnow().isoformat()
-        system_info_json = json.dumps(results["system_info"]) if "system_info" in results else ""
-        cpu_json = json.dumps(results.get("cpu", {}))
-        memory_json = json.dumps(results.get("memory", {}))
-        gpu_json = json.dumps(results.get("gpu", {}))
-        disk_json = json.dumps(results.get("disk", {}))
-        ml_json = json.dumps(results.get("ml", {}))
-        plot_json = json.dumps(results.get("plot", {}))
-
-        query = """
-        INSERT INTO benchmarks (
-            timestamp,
-            system_info,
-            cpu,
-            memory,
-            gpu,
-            disk,
-            ml,
-            plot,
-            notes,
-            config_name,
-            uuid
-        )
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """
-
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute(query, [
-                now_str,
-                system_info_json,
-                cpu_json,
-                memory_json,
-                gpu_json,
-                disk_json,
-                ml_json,
-                plot_json,
-                notes,
-                config_name,
-                uuid
-            ])
-            conn.commit()
-            return cursor.lastrowid
+        :param runs:        Result dictionaries as accepted by `store_results`. A run's own
+                            'notes', 'config_name' and 'uuid' keys override the defaults.
+        :param notes:       Default notes for runs without their own.
+        :param config_name: Default profile name for runs without their own.
+        :return:            The number of rows inserted.
+        """
+        rows = [
+            self._row(run, run.get("notes", notes), run.get("config_name", config_name), run.get("uuid"))
+            for run in runs
+        ]
+        with self._conn:
+            self._conn.executemany(INSERT_QUERY, rows)
+        return len(rows)
+
+    def iter_results(
+        self,
+        limit: Optional[int] = None,
+        config_name: Optional[str] = None,
+        batch_size: int = 500,
+    ) -> Iterator[BenchmarkRow]:
+        """
+        Stream results from the database, newest first, without loading the whole
+        table into memory. JSON columns are decoded lazily on access.
+
+        :param limit:       Maximum number of rows to yield.
+        :param config_name: Only rows for this profile.
+        :param batch_size:  Rows fetched from SQLite per round trip.
+        :return: An iterator of `BenchmarkRow` mappings.
+        """
+        query = "SELECT * FROM benchmarks"
+        params: list = []
+        if config_name is not None:
+            query += " WHERE config_name = ?"
+            params.append(config_name)
+        query += " ORDER BY id DESC"
+        if limit:
+            query += " LIMIT ?"
+            params.append(int(limit))
+
+        cursor = self._conn.execute(query, params)
+        try:
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                for row in rows:
+                    yield BenchmarkRow(row)
+        finally:
+            cursor.close()
 
     def fetch_results(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
@@ -125,37 +233,19 @@ class BenchmarkDB:
         :param limit: Maximum number of rows to fetch.
         :return: A list of dictionaries, each representing one row in 'benchmarks'.
         """
-        query = "SELECT * FROM benchmarks ORDER BY id DESC"
-        if limit:
-            query += f" LIMIT {limit}"
-
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            rows = conn.execute(query).fetchall()
-
-        results = []
-        for row in rows:
-            # Convert JSON fields back to Python objects
-            results.append({
-                "id": row["id"],
-                "timestamp": row["timestamp"],
-                "system_info": json.loads(row["system_info"]),
-                "cpu": json.loads(row["cpu"]) if row["cpu"] else None,
-                "memory": json.loads(row["memory"]) if row["memory"] else None,
-                "gpu": json.loads(row["gpu"]) if row["gpu"] else None,
-                "disk": json.loads(row["disk"]) if row["disk"] else None,
-                "ml": json.loads(row["ml"]) if row["ml"] else None,
-                "plot": json.loads(row["plot"]) if row["plot"] else None,
-                "notes": row["notes"],
-                "config_name": row["config_name"],
-                "uuid": row["uuid"]
-            })
-        return results
+        return [dict(row) for row in self.iter_results(limit=limit)]
 
     def drop_table(self):
         """
         Drop the 'benchmarks' table. Use with caution!
+        The next `BenchmarkDB` opened on this file recreates it.
+        """
+        with self._conn:
+            self._conn.execute("DROP TABLE IF EXISTS benchmarks")
+            self._conn.execute("PRAGMA user_version = 0")
+
+    def close(self):
+        """
+        Close the underlying connection.
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("DROP TABLE IF EXISTS benchmarks")
-            conn.commit()
+        self._conn.close()
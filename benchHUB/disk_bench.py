@@ -6,13 +6,14 @@ import time
 import statistics
 from benchHUB.utils.timing import timing_decorator
 
-def disk_benchmark(config: dict):
+def disk_benchmark(config: dict, samples: dict = None):
     """
     Run the disk write/read benchmark multiple times using parameters from a configuration dictionary.
+    Individual run times are stored in `samples` when it is given.
     """
     timing_results = {}
 
-    @timing_decorator(timings=timing_results)
+    @timing_decorator(timings=timing_results, samples=samples)
     def disk_write_read(file_size: int):
         file_name = "temp_benchmark_file"
         if psutil.disk_usage(".").free < file_size:
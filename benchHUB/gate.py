@@ -0,0 +1,268 @@
+#gate.py
+"""
+gate.py
+
+Non-interactive performance gate for CI pipelines. Runs the selected benchmarks,
+compares every timing metric with a pinned baseline result file and exits non-zero
+if any metric's median time regressed by more than its threshold.
+
+Only the scored timing metrics (reference_index.SUBSYSTEM_METRICS: cpu, memory, gpu,
+disk, ml and plot) are gated. The torch_cpu and pandas benchmarks report throughputs
+rather than timings, so the gate neither runs nor offers them.
+
+Usage:
+    python -m benchHUB.main gate --baseline baseline.json [--threshold 0.10]
+        [--benchmarks cpu memory] [--report-json gate.json] [--junit-xml gate.xml]
+
+Exit codes: 0 = passed, 1 = at least one regression or missing metric, 2 = the gate could not run.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import xml.etree.ElementTree as ET
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from benchHUB.compare import DEFAULT_ALPHA, compare_samples, run_samples
+from benchHUB.reference_index import SUBSYSTEM_METRICS, metric_value
+
+DEFAULT_THRESHOLD = 0.10
+
+EXIT_PASSED = 0
+EXIT_REGRESSED = 1
+EXIT_ERROR = 2
+
+# Benchmarks with timing metrics to gate, in the order main.py runs them
+GATED_BENCHMARKS = ("cpu", "memory", "gpu", "disk", "ml", "plot")
+
+# Row statuses that fail the gate: a regression, or a baseline metric the run did not produce
+FAILING_STATUSES = ("failed", "missing")
+
+
+def parse_metric_thresholds(values: Optional[List[str]]) -> Dict[str, float]:
+    """
+    Parse repeated 'metric=threshold' options, e.g. 'gpu.gpu_tensor_operations=0.25'.
+    """
+    thresholds = {}
+    for value in values or []:
+        metric, sep, threshold = value.partition("=")
+        if not sep:
+            raise ValueError(f"Expected METRIC=THRESHOLD, got '{value}'")
+        thresholds[metric.strip()] = float(threshold)
+    return thresholds
+
+
+def is_failure(row: dict) -> bool:
+    return row["status"] in FAILING_STATUSES
+
+
+def scored_value(result: dict, metric: str) -> Optional[float]:
+    """
+    The reported timing of "subsystem.metric" in `result`, or None if it is absent or not positive.
+    """
+    subsystem, _, name = metric.partition(".")
+    keys = SUBSYSTEM_METRICS.get(subsystem, {}).get(name, ((name,), None))[0]
+    return metric_value(result.get(subsystem), keys)
+
+
+def evaluate_gate(
+    current: dict,
+    baseline: dict,
+    threshold: float = DEFAULT_THRESHOLD,
+    metric_thresholds: Optional[Dict[str, float]] = None,
+    benchmarks: Optional[List[str]] = None,
+) -> List[dict]:
+    """
+    Compare a result with the baseline, metric by metric.
+
+    A metric fails when its median time is more than `threshold` (a relative change,
+    0.10 = 10% slower) above the baseline; `metric_thresholds` overrides the
+    threshold per metric. A baseline metric that the run did not report, or reported
+    as zero (e.g. a crashed benchmark), fails as 'missing', unless its subsystem was
+    left out with `benchmarks`. Metrics only the run has are not gated.
+
+    Returns:
+        list: The rows of `compare.compare_samples`, each with an added 'threshold'
+              and a 'status' of 'passed' or 'failed', after one 'missing' row (with
+              no current timing or change) per missing baseline metric.
+    """
+    metric_thresholds = metric_thresholds or {}
+    current_samples = run_samples(current)
+    baseline_samples = run_samples(baseline)
+    missing = []
+    for metric in sorted(set(baseline_samples) - set(current_samples)):
+        if benchmarks is not None and metric.partition(".")[0] not in benchmarks:
+            continue
+        value = scored_value(current, metric)
+        if value is not None:
+            # Reported without per-run samples: gate its single timing
+            current_samples[metric] = [value]
+        else:
+            missing.append(metric)
+
+    rows = compare_samples(current_samples, baseline_samples, alpha=DEFAULT_ALPHA)
+    for row in rows:
+        row["threshold"] = metric_thresholds.get(row["metric"], threshold)
+        row["status"] = "failed" if row["change"] > row["threshold"] else "passed"
+    rows.sort(key=lambda row: (row["status"] != "failed", -row["change"]))
+    return [
+        {
+            "metric": metric,
+            "current": None,
+            "baseline": statistics.median(baseline_samples[metric]),
+            "change": None,
+            "threshold": metric_thresholds.get(metric, threshold),
+            "status": "missing",
+        }
+        for metric in missing
+    ] + rows
+
+
+def write_json_report(path: str, rows: List[dict], context: dict):
+    """
+    Write the gate outcome and every compared metric as JSON.
+    """
+    report = dict(context)
+    report["passed"] = not any(is_failure(row) for row in rows)
+    report["failures"] = sum(is_failure(row) for row in rows)
+    report["missing"] = sum(row["status"] == "missing" for row in rows)
+    report["metrics"] = rows
+    with open(path, "w") as f:
+        json.dump(report, f, indent=4)
+
+
+def write_junit_report(path: str, rows: List[dict], context: dict):
+    """
+    Write one JUnit test case per metric, so CI systems can display failed metrics natively.
+    """
+    root = ET.Element("testsuites", name="benchHUB")
+    suite = ET.SubElement(
+        root,
+        "testsuite",
+        name=f"benchHUB gate ({context.get('profile')})",
+        tests=str(len(rows)),
+        failures=str(sum(is_failure(row) for row in rows)),
+        errors="0",
+        timestamp=context.get("timestamp", ""),
+    )
+    for row in rows:
+        subsystem, _, metric = row["metric"].partition(".")
+        if row["status"] == "missing":
+            case = ET.SubElement(suite, "testcase", classname=f"benchHUB.{subsystem}", name=metric, time="0")
+            failure = ET.SubElement(case, "failure", message=f"{row['metric']} was not reported by this run", type="missing")
+            failure.text = f"baseline median {row['baseline']:.6f}s; the run reported no timing or zero"
+            continue
+        case = ET.SubElement(suite, "testcase", classname=f"benchHUB.{subsystem}", name=metric, time=f"{row['current']:.6f}")
+        summary = (
+            f"median {row['current']:.6f}s vs baseline {row['baseline']:.6f}s "
+            f"({row['change']:+.1%}, threshold {row['threshold']:+.1%}, effect {row['effect']:+.2f}, p={row['p_value']:.3g})"
+        )
+        if row["status"] == "failed":
+            failure = ET.SubElement(case, "failure", message=f"{row['metric']} regressed {row['change']:+.1%}", type="regression")
+            failure.text = summary
+        else:
+            ET.SubElement(case, "system-out").text = summary
+    tree = ET.ElementTree(root)
+    ET.indent(tree)
+    tree.write(path, encoding="utf-8", xml_declaration=True)
+
+
+def print_gate(rows: List[dict]):
+    """
+    Print every gated metric, failures first.
+    """
+    header = f"{'Metric':<40} {'Baseline':>11} {'Current':>11} {'Change':>8} {'Limit':>7}  Status"
+    print(header)
+    print("-" * len(header))
+    for row in rows:
+        if row["status"] == "missing":
+            print(f"{row['metric']:<40} {row['baseline']:>10.4f}s {'-':>11} {'-':>8} {row['threshold']:>+7.1%}  MISSING")
+            continue
+        print(
+            f"{row['metric']:<40} {row['baseline']:>10.4f}s {row['current']:>10.4f}s "
+            f"{row['change']:>+8.1%} {row['threshold']:>+7.1%}  {row['status'].upper()}"
+        )
+
+
+def main(argv=None):
+    from benchHUB.main import run_all_benchmarks
+
+    parser = argparse.ArgumentParser(description="Run benchmarks non-interactively and fail on regressions against a baseline.")
+    parser.add_argument("--baseline", required=True, help="Pinned baseline result JSON.")
+    parser.add_argument("--profile", help="Benchmark profile (default: the baseline's profile).")
+    parser.add_argument("--benchmarks", nargs="+", choices=GATED_BENCHMARKS, default=list(GATED_BENCHMARKS), help="Benchmarks to run and gate (default: all of them).")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Largest allowed relative slowdown per metric (default: 0.10).")
+    parser.add_argument("--metric-threshold", action="append", metavar="METRIC=THRESHOLD", help="Per-metric threshold override; may be repeated.")
+    parser.add_argument("--gpu-device", choices=["cpu", "cuda", "mps"], default=None, help="Device for the accelerator benchmark; cpu runs only the unscored TFLOPS sweep.")
+    parser.add_argument("--report-json", help="Write a JSON report to this path.")
+    parser.add_argument("--junit-xml", help="Write a JUnit XML report to this path.")
+    parser.add_argument("--save-result", help="Also save the full result JSON (e.g. to pin as the next baseline).")
+    args = parser.parse_args(argv)
+
+    try:
+        metric_thresholds = parse_metric_thresholds(args.metric_threshold)
+        with open(args.baseline, "r") as f:
+            baseline = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Gate error: {e}")
+        return EXIT_ERROR
+
+    from benchHUB.config import config
+    from benchHUB.config.system_info import get_system_info
+    from benchHUB.cpu_bench import cpu_benchmark
+    from benchHUB.memory_bench import memory_benchmark
+    from benchHUB.gpu_bench import gpu_benchmark
+    from benchHUB.disk_bench import disk_benchmark
+    from benchHUB.ml_bench import ml_benchmark
+    from benchHUB.plot_bench import plot_benchmark
+    from benchHUB.torch_cpu_bench import torch_cpu_benchmark
+    from benchHUB.pandas_bench import pandas_benchmark
+    from benchHUB.utils.print_config import print_configuration
+
+    profile = args.profile or baseline.get("config_name") or "standard"
+    if profile != (baseline.get("config_name") or "standard"):
+        print(f"Warning: baseline was recorded with the '{baseline.get('config_name')}' profile, running '{profile}'.")
+    current = run_all_benchmarks(
+        profile, config, get_system_info, cpu_benchmark, memory_benchmark, gpu_benchmark, disk_benchmark,
+        ml_benchmark, plot_benchmark, print_configuration, torch_cpu_benchmark, pandas_benchmark,
+        gpu_device=args.gpu_device, benchmarks=args.benchmarks,
+    )
+    if not current:
+        return EXIT_ERROR
+    if args.save_result:
+        with open(args.save_result, "w") as f:
+            json.dump(current, f, indent=4, default=str)
+        print(f"\nResult saved to: {args.save_result}")
+
+    rows = evaluate_gate(current, baseline, args.threshold, metric_thresholds, args.benchmarks)
+    if not rows:
+        print("Gate error: the run and the baseline have no timing metric in common.")
+        return EXIT_ERROR
+
+    context = {
+        "baseline": os.path.abspath(args.baseline),
+        "baseline_uuid": baseline.get("uuid"),
+        "uuid": current.get("uuid"),
+        "profile": profile,
+        "threshold": args.threshold,
+        "metric_thresholds": metric_thresholds,
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+    }
+    if args.report_json:
+        write_json_report(args.report_json, rows, context)
+    if args.junit_xml:
+        write_junit_report(args.junit_xml, rows, context)
+
+    print()
+    print_gate(rows)
+    failures = sum(is_failure(row) for row in rows)
+    missing = sum(row["status"] == "missing" for row in rows)
+    print(f"\nGate {'FAILED' if failures else 'passed'}: {failures - missing} of {len(rows)} metric(s) regressed, {missing} missing.")
+    return EXIT_REGRESSED if failures else EXIT_PASSED
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,60 +1,148 @@
 # gpu_bench.py
-from benchHUB.utils.timing import timing_decorator
+import statistics
+import time
 
-def gpu_benchmark(config: dict):
+SWEEP_DIVISORS = (4, 2, 1)  # Matrix sizes swept: GPU_MATRIX_SHAPE / 4, / 2 and full size
+
+
+def detect_device():
     """
-    Perform GPU benchmarks using parameters from a configuration dictionary.
+    Return the name of the best available accelerator: 'cuda', 'mps' or 'cpu'.
     """
-    timing_results = {}
+    import torch
+    if torch.cuda.is_available():
+        return 'cuda'
+    if hasattr(torch.backends, 'mps') and torch.backends.mps.is_available():
+        return 'mps'
+    return 'cpu'
 
-    @timing_decorator(timings=timing_results)
-    def gpu_tensor_operations(matrix_shape):
-        import torch
-        device = (
-            torch.device('cuda') if torch.cuda.is_available()
-            else torch.device('mps') if hasattr(torch.backends, 'mps') and torch.backends.mps.is_available()
-            else torch.device('cpu')
-        )
-        if device.type == 'cpu':
-            raise RuntimeError("No GPU backend available (CUDA or MPS).")
-        x = torch.rand(matrix_shape, device=device)
-        y = torch.rand(matrix_shape, device=device)
-        _ = torch.matmul(x, y)
-
-    @timing_decorator(timings=timing_results)
-    def gpu_tiny_training_loop(epochs: int = 2):
+
+def _synchronize(device):
+    """
+    Block until all queued work on the device has finished.
+    """
+    import torch
+    if device.type == 'cuda':
+        torch.cuda.synchronize(device)
+    elif device.type == 'mps':
+        torch.mps.synchronize()
+
+
+def device_times(func, device, n_runs: int = 3) -> list:
+    """
+    Time `func` on `device` and return every elapsed time in seconds.
+
+    One untimed warm-up call absorbs kernel compilation and library initialisation.
+    CUDA work is timed with device events; MPS and CPU work are bracketed by
+    synchronisation so that asynchronous kernels are measured to completion.
+    """
+    import torch
+    func()
+    _synchronize(device)
+
+    times = []
+    for _ in range(n_runs):
+        if device.type == 'cuda':
+            start = torch.cuda.Event(enable_timing=True)
+            end = torch.cuda.Event(enable_timing=True)
+            start.record()
+            func()
+            end.record()
+            end.synchronize()
+            times.append(start.elapsed_time(end) / 1000.0)
+        else:
+            _synchronize(device)
+            start = time.perf_counter()
+            func()
+            _synchronize(device)
+            times.append(time.perf_counter() - start)
+    return times
+
+
+def gpu_benchmark(config: dict, device: str = None, samples: dict = None):
+    """
+    Perform accelerator benchmarks using parameters from a configuration dictionary.
+
+    Args:
+        config (dict): A dictionary containing benchmark parameters.
+                       Expected keys: 'GPU_MATRIX_SHAPE', 'N_RUNS'.
+        device (str): 'cpu', 'cuda' or 'mps'. When omitted the best accelerator is
+                      detected, and the benchmark is skipped if there is none.
+                      On 'cpu' only the TFLOPS sweep runs, as a diagnostic.
+        samples (dict): Optional dictionary that receives the individual run times
+                        of the timed benchmarks, keyed like the returned timings.
+
+    Returns:
+        dict: 'gpu_tensor_operations' and 'gpu_tiny_training_loop' timings in seconds,
+              'tflops_<rows>x<cols>' for each swept matrix size and 'peak_tflops'.
+              On 'cpu' the two timings are left out, so CPU times are never scored
+              as the GPU subsystem.
+    """
+    empty_results = {"tensor_operations": 0, "tiny_training_loop": 0}
+    try:
         import torch
-        device = (
-            torch.device('cuda') if torch.cuda.is_available()
-            else torch.device('mps') if hasattr(torch.backends, 'mps') and torch.backends.mps.is_available()
-            else torch.device('cpu')
-        )
-        if device.type == 'cpu':
-            return
-        model = torch.nn.Linear(100, 1).to(device)
-        optimizer = torch.optim.Adam(model.parameters(), lr=0.001)
-        criterion = torch.nn.MSELoss()
-        X = torch.rand(1000, 100, device=device)
-        y = torch.rand(1000, 1, device=device)
+    except ImportError as e:
+        print(f"GPU benchmark failed: {e}")
+        return empty_results
+
+    if device is None:
+        device = detect_device()
+        if device == 'cpu':
+            print("GPU benchmark failed: No GPU backend available (CUDA or MPS).")
+            return empty_results
+    device = torch.device(device)
+
+    matrix_shape = config.get("GPU_MATRIX_SHAPE", (4096, 4096))
+    n_runs = config.get("N_RUNS", 3)
+    timing_results = {}
+    if samples is None:
+        samples = {}
+
+    print(f"Starting tensor operations benchmark on '{device.type}'...")
+    rows, cols = matrix_shape
+    peak_tflops = 0.0
+    for divisor in SWEEP_DIVISORS:
+        m, k = max(rows // divisor, 1), max(cols // divisor, 1)
+        # Allocation happens outside the timed region.
+        x = torch.rand((m, k), device=device)
+        y = torch.rand((k, m), device=device)
+        times = device_times(lambda: torch.matmul(x, y), device, n_runs)
+        elapsed = statistics.median(times)
+        tflops = (2 * m * k * m) / elapsed / 1e12 if elapsed > 0 else 0.0
+        timing_results[f"tflops_{m}x{k}"] = tflops
+        peak_tflops = max(peak_tflops, tflops)
+        print(f"  {m}x{k}: {elapsed:.6f} s, {tflops:.3f} TFLOPS")
+        if divisor == 1 and device.type != 'cpu':
+            timing_results["gpu_tensor_operations"] = elapsed
+            samples["gpu_tensor_operations"] = times
+        del x, y
+    timing_results["peak_tflops"] = peak_tflops
+    if device.type == 'cpu':
+        return timing_results
+
+    print("Starting training loop benchmark...")
+    model = torch.nn.Linear(100, 1).to(device)
+    optimizer = torch.optim.Adam(model.parameters(), lr=0.001)
+    criterion = torch.nn.MSELoss()
+    X = torch.rand(1000, 100, device=device)
+    y = torch.rand(1000, 1, device=device)
+
+    def tiny_training_loop(epochs: int = 2):
         for _ in range(epochs):
             optimizer.zero_grad()
-            pred = model(X)
-            loss = criterion(pred, y)
+            loss = criterion(model(X), y)
             loss.backward()
             optimizer.step()
 
-    matrix_shape = config.get("GPU_MATRIX_SHAPE", (4096, 4096))
-    n_runs = config.get("N_RUNS", 3)
+    samples["gpu_tiny_training_loop"] = device_times(tiny_training_loop, device, n_runs)
+    timing_results["gpu_tiny_training_loop"] = statistics.median(samples["gpu_tiny_training_loop"])
+    print(f"gpu_tiny_training_loop executed in {timing_results['gpu_tiny_training_loop']:.6f} seconds")
 
-    gpu_tensor_operations.n_runs = n_runs
-    gpu_tiny_training_loop.n_runs = n_runs
+    return timing_results
 
-    try:
-        print("Starting GPU tensor operations benchmark...")
-        gpu_tensor_operations(matrix_shape)
-        print("Starting GPU training loop benchmark...")
-        gpu_tiny_training_loop()
-        return timing_results
-    except (ImportError, RuntimeError) as e:
-        print(f"GPU benchmark failed: {e}")
-        return {"tensor_operations": 0, "tiny_training_loop": 0}
\ No newline at end of file
+
+if __name__ == "__main__":
+    from benchHUB.config import config
+    results = gpu_benchmark(config.CONFIG_PROFILES[config.DEFAULT_CONFIG_NAME], device='cpu')
+    print("\nAccelerator Benchmark Results:")
+    print(results)
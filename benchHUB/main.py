@@ -1,6 +1,7 @@
 import argparse
 import json
 import os
+import sqlite3
 import sys
 import uuid
 from datetime import datetime
@@ -9,6 +10,8 @@ import threading
 import time
 import itertools
 
+BENCHMARK_NAMES = ('cpu', 'memory', 'gpu', 'disk', 'ml', 'plot', 'torch_cpu', 'pandas')
+
 def spinning_cursor(stop_event):
     """A simple spinning cursor animation."""
     spinner = itertools.cycle(['-', '/', '|', '\\'])
@@ -19,6 +22,23 @@ def spinning_cursor(stop_event):
         sys.stdout.write('\b')
 
 def main():
+    # `compare` only reads saved results, so skip the benchmark imports entirely
+    if len(sys.argv) > 1 and sys.argv[1] == 'compare':
+        from benchHUB.compare import main as compare_main
+        sys.exit(compare_main(sys.argv[2:]))
+    # `gate` runs non-interactively for CI and exits non-zero on regressions
+    if len(sys.argv) > 1 and sys.argv[1] == 'gate':
+        from benchHUB.gate import main as gate_main
+        sys.exit(gate_main(sys.argv[2:]))
+    # `submit` uploads saved result files in batches, e.g. collected from a fleet of hosts
+    if len(sys.argv) > 1 and sys.argv[1] == 'submit':
+        from benchHUB.submit import main as submit_main
+        sys.exit(submit_main(sys.argv[2:]))
+    # `loadtest` measures the leaderboard API in-process (needs the API requirements and httpx)
+    if len(sys.argv) > 1 and sys.argv[1] == 'loadtest':
+        from benchHUB.api_loadtest import main as loadtest_main
+        sys.exit(loadtest_main(sys.argv[2:]))
+
     # --- Start Animation ---
     stop_animation_event = threading.Event()
     animation_thread = threading.Thread(target=spinning_cursor, args=(stop_animation_event,))
@@ -35,6 +55,8 @@ def main():
     from benchHUB.disk_bench import disk_benchmark
     from benchHUB.ml_bench import ml_benchmark
     from benchHUB.plot_bench import plot_benchmark
+    from benchHUB.torch_cpu_bench import torch_cpu_benchmark
+    from benchHUB.pandas_bench import pandas_benchmark
     from benchHUB.utils.print_config import print_configuration
 
     # --- Stop Animation ---
@@ -56,6 +78,7 @@ def main():
     )
     parser.add_argument('--share', help='Share anonymized results to the online leaderboard.', action='store_true')
     parser.add_argument('--no-share', help='Do not share results to the online leaderboard.', action='store_true')
+    parser.add_argument('--gpu-device', help='Device for the accelerator benchmark (default: auto-detect CUDA or MPS). On cpu only the unscored TFLOPS sweep runs.', choices=['cpu', 'cuda', 'mps'], default=None)
     args = parser.parse_args()
 
     # --- Interactive Prompts ---
@@ -92,12 +115,15 @@ def main():
                 print("Invalid input. Please enter 'y' or 'n'.")
 
     # --- Run Benchmarks ---
-    results = run_all_benchmarks(profile, config, get_system_info, cpu_benchmark, memory_benchmark, gpu_benchmark, disk_benchmark, ml_benchmark, plot_benchmark, print_configuration)
+    results = run_all_benchmarks(profile, config, get_system_info, cpu_benchmark, memory_benchmark, gpu_benchmark, disk_benchmark, ml_benchmark, plot_benchmark, print_configuration, torch_cpu_benchmark, pandas_benchmark, gpu_device=args.gpu_device)
     if results:
         save_and_submit_results(results, share_results, requests)
 
-def run_all_benchmarks(profile_name, config, get_system_info, cpu_benchmark, memory_benchmark, gpu_benchmark, disk_benchmark, ml_benchmark, plot_benchmark, print_configuration):
-    """Orchestrate all benchmarks based on the selected profile."""
+def run_all_benchmarks(profile_name, config, get_system_info, cpu_benchmark, memory_benchmark, gpu_benchmark, disk_benchmark, ml_benchmark, plot_benchmark, print_configuration, torch_cpu_benchmark, pandas_benchmark, gpu_device=None, benchmarks=None):
+    """
+    Orchestrate all benchmarks based on the selected profile.
+    `benchmarks` optionally limits the run to a subset of BENCHMARK_NAMES; skipped ones report {}.
+    """
     selected_config = config.CONFIG_PROFILES.get(profile_name)
     if not selected_config:
         print(f"Error: Profile '{profile_name}' not found.")
@@ -110,29 +136,59 @@ def run_all_benchmarks(profile_name, config, get_system_info, cpu_benchmark, mem
     system_info = get_system_info()
     print("System info gathered.")
 
-    print("\nRunning CPU benchmark...")
-    cpu_results = cpu_benchmark(selected_config)
-    print("CPU benchmark complete.")
+    # Individual run times per subsystem, used for the reference index confidence interval.
+    samples = {name: {} for name in ('cpu', 'memory', 'gpu', 'disk', 'ml', 'plot')}
+
+    def name_selected(name):
+        return benchmarks is None or name in benchmarks
+
+    cpu_results = {}
+    if name_selected('cpu'):
+        print("\nRunning CPU benchmark...")
+        cpu_results = cpu_benchmark(selected_config, samples=samples['cpu'])
+        print("CPU benchmark complete.")
+
+    memory_results = {}
+    if name_selected('memory'):
+        print("\nRunning Memory benchmark...")
+        memory_results = memory_benchmark(selected_config, samples=samples['memory'])
+        print("Memory benchmark complete.")
 
-    print("\nRunning Memory benchmark...")
-    memory_results = memory_benchmark(selected_config)
-    print("Memory benchmark complete.")
+    gpu_results = {}
+    if name_selected('gpu'):
+        print("\nRunning GPU benchmark...")
+        gpu_results = gpu_benchmark(selected_config, device=gpu_device, samples=samples['gpu'])
+        print("GPU benchmark complete.")
 
-    print("\nRunning GPU benchmark...")
-    gpu_results = gpu_benchmark(selected_config)
-    print("GPU benchmark complete.")
+    disk_results = {}
+    if name_selected('disk'):
+        print("\nRunning Disk benchmark...")
+        disk_results = disk_benchmark(selected_config, samples=samples['disk'])
+        print("Disk benchmark complete.")
 
-    print("\nRunning Disk benchmark...")
-    disk_results = disk_benchmark(selected_config)
-    print("Disk benchmark complete.")
+    ml_results = {}
+    if name_selected('ml'):
+        print("\nRunning Machine Learning benchmark...")
+        ml_results = ml_benchmark(selected_config, samples=samples['ml'])
+        print("Machine Learning benchmark complete.")
 
-    print("\nRunning Machine Learning benchmark...")
-    ml_results = ml_benchmark(selected_config)
-    print("Machine Learning benchmark complete.")
+    plot_results = {}
+    if name_selected('plot'):
+        print("\nRunning Plotting benchmark...")
+        plot_results = plot_benchmark(selected_config, samples=samples['plot'])
+        print("Plotting benchmark complete.")
 
-    print("\nRunning Plotting benchmark...")
-    plot_results = plot_benchmark(selected_config)
-    print("Plotting benchmark complete.")
+    torch_cpu_results = {}
+    if name_selected('torch_cpu'):
+        print("\nRunning PyTorch CPU benchmark...")
+        torch_cpu_results = torch_cpu_benchmark(selected_config)
+        print("PyTorch CPU benchmark complete.")
+
+    pandas_results = {}
+    if name_selected('pandas'):
+        print("\nRunning pandas benchmark...")
+        pandas_results = pandas_benchmark(selected_config)
+        print("pandas benchmark complete.")
 
     results = {
         'system_info': system_info,
@@ -142,23 +198,39 @@ def run_all_benchmarks(profile_name, config, get_system_info, cpu_benchmark, mem
         'disk': disk_results,
         'ml': ml_results,
         'plot': plot_results,
+        'torch_cpu': torch_cpu_results,
+        'pandas': pandas_results,
+        'samples': samples,
         'config_name': profile_name,
         'uuid': str(uuid.uuid4()),
         'timestamp': datetime.now().isoformat()
     }
 
     try:
-        from benchHUB.reference_index import calculate_reference_index, score_cpu, score_gpu, score_memory
-        cpu_score = score_cpu(cpu_results)
-        gpu_score = score_gpu(gpu_results)
-        memory_score = score_memory(memory_results)
-        results['reference_index'] = calculate_reference_index(cpu_score, gpu_score, memory_score)
-    except (ImportError, KeyError, TypeError) as e:
+        from benchHUB.reference_index import score_results, bootstrap_reference_index
+        scores = score_results(results)
+        results['reference_index'] = scores['index']
+        interval = bootstrap_reference_index(results, samples, scores['version'])
+        results['reference_index_low'], results['reference_index_high'] = interval if interval else (None, None)
+        results['scoring_version'] = scores['version']
+        results['scores'] = scores
+        if scores['missing']:
+            print(f"Subsystems not scored: {', '.join(scores['missing'])}")
+        if interval:
+            print(f"Reference index: {scores['index']:.1f} (95% CI {interval[0]:.1f} - {interval[1]:.1f})")
+    except (ImportError, KeyError, TypeError, ValueError) as e:
         print(f"Could not calculate reference index: {e}")
         results['reference_index'] = 0.0
 
     return results
 
+def to_serializable(val):
+    """Convert results to plain JSON types for submission; anything else becomes a string."""
+    if isinstance(val, dict): return {k: to_serializable(v) for k, v in val.items()}
+    if isinstance(val, list): return [to_serializable(i) for i in val]
+    if isinstance(val, (int, float, str, bool)) or val is None: return val
+    return str(val)
+
 def save_and_submit_results(results, share_publicly, requests):
     """Save results locally and optionally submit to the leaderboard."""
     RESULTS_DIR = "results"
@@ -172,15 +244,17 @@ def save_and_submit_results(results, share_publicly, requests):
         json.dump(results, f, indent=4)
     print(f"\nResults saved locally to: {local_filename}")
 
+    try:
+        from benchHUB.results_store import ResultsStore, DEFAULT_STORE_NAME
+        store = ResultsStore(os.path.join(RESULTS_DIR, DEFAULT_STORE_NAME))
+        store.ingest(results, source=local_filename)
+        store.close()
+    except (ImportError, sqlite3.Error) as e:
+        print(f"Could not add results to the local results store: {e}")
+
     if share_publicly:
         print("\nSubmitting results to the online leaderboard...")
         try:
-            def to_serializable(val):
-                if isinstance(val, dict): return {k: to_serializable(v) for k, v in val.items()}
-                if isinstance(val, list): return [to_serializable(i) for i in val]
-                if isinstance(val, (int, float, str, bool)) or val is None: return val
-                return str(val)
-
             serializable_results = to_serializable(results)
             response = requests.post(f"{API_URL}/api/submit", json=serializable_results)
             
@@ -2,17 +2,19 @@
 import numpy as np
 from benchHUB.utils.timing import timing_decorator
 
-def memory_benchmark(config: dict):
+def memory_benchmark(config: dict, samples: dict = None):
     """
     Run memory bandwidth benchmark using parameters from a configuration dictionary.
     
     Args:
         config (dict): A dictionary containing benchmark parameters.
                        Expected keys: 'MEMORY_ARRAY_SIZE_MB', 'N_RUNS'.
+        samples (dict): Optional dictionary that receives the individual run times
+                        of each benchmark, keyed like the returned timings.
     """
     timing_results = {}
 
-    @timing_decorator(timings=timing_results)
+    @timing_decorator(timings=timing_results, samples=samples)
     def memory_bandwidth(array_size_mb):
         num_elements = int((array_size_mb * 1024 * 1024) / 8)
         source_array = np.random.rand(num_elements)
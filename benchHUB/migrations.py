@@ -0,0 +1,213 @@
+#migrations.py
+"""
+migrations.py
+
+Versioned schema migrations for the leaderboard database. Each migration runs once
+per database, in order, and the versions applied so far are recorded in the
+`schema_migrations` table, so checking an up-to-date database costs two queries
+instead of inspecting every table, column and index.
+
+To change the schema, update the models and append a migration to MIGRATIONS;
+never edit or reorder one that has shipped. Migrations must tolerate changes that
+are already present, since databases created before versioning run all of them.
+
+Usage:
+    upgrade_schema(engine)                      # From a script
+    await conn.run_sync(apply_migrations)       # Inside an open async transaction
+"""
+
+import json
+from datetime import datetime
+
+from sqlalchemy import Column, Integer, MetaData, String, Table, func, inspect, select, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import sessionmaker
+
+from benchHUB.models import JSON_FIELDS, Base, BenchmarkResult, Hardware, get_or_create_hardware, typed_metrics
+from benchHUB.utils.hardware import hardware_summary
+
+# Arbitrary key for the PostgreSQL advisory lock held while migrating
+MIGRATION_LOCK_KEY = 4_210_517
+
+migration_metadata = MetaData()
+schema_migrations = Table(
+    "schema_migrations",
+    migration_metadata,
+    Column("version", Integer, primary_key=True),
+    Column("name", String, nullable=False),
+    Column("applied_at", String, nullable=False),
+)
+
+
+def add_columns(conn, table_name: str, columns):
+    """
+    Add (name, SQL type) columns that `table_name` does not have yet.
+    """
+    existing = {column["name"] for column in inspect(conn).get_columns(table_name)}
+    for name, column_type in columns:
+        if name not in existing:
+            conn.execute(text(f"ALTER TABLE {table_name} ADD COLUMN {name} {column_type}"))
+
+
+def create_indexes(conn, table, names):
+    """
+    Create the indexes declared on `table` under `names`, skipping existing ones.
+    PostgreSQL-only indexes are skipped elsewhere by their `ddl_if`.
+    """
+    for index in table.indexes:
+        if index.name in names:
+            index.create(conn, checkfirst=True)
+
+
+def add_confidence_interval(conn):
+    add_columns(conn, "results", [
+        ("reference_index_low", "FLOAT"),
+        ("reference_index_high", "FLOAT"),
+        ("scoring_version", "VARCHAR"),
+    ])
+
+
+def add_hardware_and_typed_metrics(conn):
+    Hardware.__table__.create(conn, checkfirst=True)
+    add_columns(conn, "results", [
+        ("hardware_id", "INTEGER REFERENCES hardware(id)"),
+        ("operating_system", "VARCHAR"),
+        ("cpu_calculate_primes", "FLOAT"),
+        ("cpu_parallel_processing", "FLOAT"),
+        ("gpu_tensor_operations", "FLOAT"),
+        ("gpu_tiny_training_loop", "FLOAT"),
+        ("memory_bandwidth", "FLOAT"),
+        ("disk_write_read", "FLOAT"),
+        ("ml_train_random_forest", "FLOAT"),
+        ("plot_generate_scatter_plot", "FLOAT"),
+        ("plot_animate_sine_wave", "FLOAT"),
+        ("plot_render_large_image", "FLOAT"),
+    ])
+
+
+def convert_json_columns(conn):
+    """
+    On PostgreSQL, convert JSON columns created as TEXT to JSONB in place.
+    """
+    if conn.dialect.name != "postgresql":
+        return
+    column_types = {column["name"]: column["type"] for column in inspect(conn).get_columns("results")}
+    for name in JSON_FIELDS:
+        if name in column_types and not isinstance(column_types[name], JSONB):
+            conn.execute(text(f"ALTER TABLE results ALTER COLUMN {name} TYPE JSONB USING NULLIF({name}, '')::jsonb"))
+
+
+def add_leaderboard_indexes(conn):
+    create_indexes(conn, BenchmarkResult.__table__, {
+        "ix_results_config_score",
+        "ix_results_score",
+        "ix_results_hardware_score",
+        "ix_results_hardware_id",
+        *(f"ix_results_{name}_gin" for name in JSON_FIELDS),
+    })
+
+
+def add_rank_cohort_index(conn):
+    create_indexes(conn, BenchmarkResult.__table__, {"ix_results_config_score_hardware"})
+
+
+def add_coverage(conn):
+    add_columns(conn, "results", [
+        ("coverage", "FLOAT"),
+        ("missing_subsystems", "VARCHAR"),
+    ])
+
+
+# (version, name, migration); each runs inside the caller's transaction
+MIGRATIONS = [
+    (1, "confidence interval and scoring version", add_confidence_interval),
+    (2, "hardware table and typed metric columns", add_hardware_and_typed_metrics),
+    (3, "JSONB columns on PostgreSQL", convert_json_columns),
+    (4, "leaderboard and JSON indexes", add_leaderboard_indexes),
+    (5, "rank cohort index", add_rank_cohort_index),
+    (6, "scoring coverage", add_coverage),
+]
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+
+def apply_migrations(conn) -> list:
+    """
+    Apply pending migrations on `conn`, which must be in a transaction. A new database
+    is created from the models directly and recorded as up to date.
+
+    Returns:
+        list: The names of the migrations applied, empty if the schema was current.
+    """
+    if conn.dialect.name == "postgresql":
+        # API workers starting together would otherwise migrate concurrently
+        conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": MIGRATION_LOCK_KEY})
+
+    inspector = inspect(conn)
+    if inspector.has_table(schema_migrations.name):
+        version = conn.execute(select(func.max(schema_migrations.c.version))).scalar() or 0
+        pending = [migration for migration in MIGRATIONS if migration[0] > version]
+    else:
+        schema_migrations.create(conn)
+        if inspector.has_table(BenchmarkResult.__tablename__):
+            # Created before migrations were versioned
+            pending = MIGRATIONS
+        else:
+            Base.metadata.create_all(conn)
+            record_migrations(conn, MIGRATIONS)
+            return ["create tables"]
+
+    for _, _, migrate in pending:
+        migrate(conn)
+    record_migrations(conn, pending)
+    return [name for _, name, _ in pending]
+
+
+def record_migrations(conn, migrations):
+    applied_at = datetime.utcnow().isoformat()
+    for version, name, _ in migrations:
+        conn.execute(schema_migrations.insert().values(version=version, name=name, applied_at=applied_at))
+
+
+def upgrade_schema(bind) -> list:
+    """
+    Bring the database behind engine `bind` up to the current models. Safe to run repeatedly.
+    Rows stored before the typed columns existed are filled in by `backfill_typed_columns`.
+
+    Returns:
+        list: The names of the migrations applied.
+    """
+    with bind.begin() as conn:
+        return apply_migrations(conn)
+
+
+def backfill_typed_columns(bind, chunk_size: int = 1000) -> int:
+    """
+    Link existing results to their hardware row and fill the typed metric columns
+    from the JSON columns, in id-ordered chunks.
+
+    Returns:
+        int: The number of rows updated.
+    """
+    SessionFactory = sessionmaker(autocommit=False, autoflush=False, bind=bind)
+    updated, last_id, known = 0, 0, {}
+    with SessionFactory() as db:
+        while True:
+            rows = (
+                db.query(BenchmarkResult)
+                .filter(BenchmarkResult.hardware_id.is_(None), BenchmarkResult.id > last_id)
+                .order_by(BenchmarkResult.id)
+                .limit(chunk_size)
+                .all()
+            )
+            if not rows:
+                break
+            for row in rows:
+                decoded = {name: json.loads(getattr(row, name)) if getattr(row, name) else {} for name in JSON_FIELDS}
+                row.hardware_id = get_or_create_hardware(db, decoded["system_info"], known).id
+                row.operating_system = hardware_summary(decoded["system_info"])["os"]
+                for column, value in typed_metrics(decoded).items():
+                    setattr(row, column, value)
+            db.commit()
+            updated += len(rows)
+            last_id = rows[-1].id
+    return updated
@@ -5,19 +5,20 @@ from sklearn.model_selection import train_test_split
 from sklearn.metrics import accuracy_score
 from benchHUB.utils.timing import timing_decorator
 
-def ml_benchmark(config: dict):
+def ml_benchmark(config: dict, samples: dict = None):
     """
     Run the complete ML benchmark pipeline using parameters from a configuration dictionary.
     Returns a dictionary with timing results and model accuracy.
+    Individual run times are stored in `samples` when it is given.
     """
     timing_results = {}
 
-    @timing_decorator(timings=timing_results)
+    @timing_decorator(timings=timing_results, samples=samples)
     def create_dataset(n_samples, n_features):
         X, y = make_classification(n_samples=n_samples, n_features=n_features, n_classes=2, random_state=42)
         return train_test_split(X, y, test_size=0.2, random_state=42)
 
-    @timing_decorator(timings=timing_results)
+    @timing_decorator(timings=timing_results, samples=samples)
     def train_random_forest(X_train, y_train):
         clf = RandomForestClassifier(n_estimators=100, max_depth=10, random_state=42)
         clf.fit(X_train, y_train)
@@ -0,0 +1,147 @@
+#models.py
+"""
+models.py
+
+SQLAlchemy models of the leaderboard database. Importing this module does no
+database work, so maintenance scripts can use the models without the API; see
+`benchHUB.migrations` for schema setup.
+"""
+
+import json
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import Column, Float, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, declarative_base
+from sqlalchemy.types import TypeDecorator
+
+from benchHUB.reference_index import SUBSYSTEM_METRICS, metric_value
+from benchHUB.utils.hardware import hardware_fingerprint, hardware_summary
+
+Base = declarative_base()
+
+class JSONDocument(TypeDecorator):
+    """
+    A JSON document stored as TEXT, or as JSONB on PostgreSQL so it can be indexed
+    and queried there. Python code always reads and writes the serialized string.
+    """
+    impl = Text
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(JSONB())
+        return dialect.type_descriptor(Text())
+
+    def process_bind_param(self, value, dialect):
+        if dialect.name == "postgresql" and isinstance(value, str):
+            return json.loads(value) if value else None
+        return value
+
+    def process_result_value(self, value, dialect):
+        if dialect.name == "postgresql" and value is not None and not isinstance(value, str):
+            return json.dumps(value)
+        return value
+
+JSON_FIELDS = ("system_info", "cpu", "memory", "gpu", "disk", "ml", "plot")
+
+class Hardware(Base):
+    """One row per distinct machine, deduplicated by `hardware_fingerprint`."""
+    __tablename__ = "hardware"
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    fingerprint = Column(String(16), unique=True, nullable=False)
+    cpu_model = Column(String, index=True)
+    cpu_cores = Column(Integer, nullable=True)
+    memory_gb = Column(Float, nullable=True, index=True)
+    gpu_model = Column(String, index=True)
+
+class BenchmarkResult(Base):
+    __tablename__ = "results"
+    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    system_info = Column(JSONDocument)
+    cpu = Column(JSONDocument)
+    memory = Column(JSONDocument)
+    gpu = Column(JSONDocument)
+    disk = Column(JSONDocument)
+    ml = Column(JSONDocument)
+    plot = Column(JSONDocument)
+    reference_index = Column(Float)
+    reference_index_low = Column(Float, nullable=True)
+    reference_index_high = Column(Float, nullable=True)
+    scoring_version = Column(String, nullable=True)
+    # Share of the subsystem weights scored, and the comma-separated subsystems left out
+    # (None for results stored before they were recorded, or scored with scoring v1.0)
+    coverage = Column(Float, nullable=True)
+    missing_subsystems = Column(String, nullable=True)
+    config_name = Column(Text, nullable=True)
+    uuid = Column(String, unique=True, nullable=False)
+    timestamp = Column(String, default=datetime.utcnow().isoformat)
+    hardware_id = Column(Integer, ForeignKey("hardware.id"), nullable=True, index=True)
+    operating_system = Column(String, nullable=True)
+    # Typed copies of the scored timings (seconds), see METRIC_COLUMNS
+    cpu_calculate_primes = Column(Float, nullable=True)
+    cpu_parallel_processing = Column(Float, nullable=True)
+    gpu_tensor_operations = Column(Float, nullable=True)
+    gpu_tiny_training_loop = Column(Float, nullable=True)
+    memory_bandwidth = Column(Float, nullable=True)
+    disk_write_read = Column(Float, nullable=True)
+    ml_train_random_forest = Column(Float, nullable=True)
+    plot_generate_scatter_plot = Column(Float, nullable=True)
+    plot_animate_sine_wave = Column(Float, nullable=True)
+    plot_render_large_image = Column(Float, nullable=True)
+
+    __table_args__ = (
+        Index("ix_results_config_score", "config_name", "reference_index", "id"),
+        Index("ix_results_score", "reference_index", "id"),
+        Index("ix_results_hardware_score", "hardware_id", "config_name", "reference_index"),
+        # Covers rank counts within hardware cohorts, which filter on the joined hardware row
+        Index("ix_results_config_score_hardware", "config_name", "reference_index", "id", "hardware_id"),
+        *(
+            Index(f"ix_results_{name}_gin", name, postgresql_using="gin", postgresql_ops={name: "jsonb_path_ops"}).ddl_if(dialect="postgresql")
+            for name in JSON_FIELDS
+        ),
+    )
+
+def metric_column_name(subsystem: str, metric: str) -> str:
+    return metric if metric.startswith(f"{subsystem}_") else f"{subsystem}_{metric}"
+
+# Typed metric column -> (subsystem, accepted result keys), from the scoring engine's metric list
+METRIC_COLUMNS = {
+    metric_column_name(subsystem, metric): (subsystem, keys)
+    for subsystem, metrics in SUBSYSTEM_METRICS.items()
+    for metric, (keys, _) in metrics.items()
+}
+
+def typed_metrics(results: dict) -> dict:
+    """Values for the typed metric columns of a result dict (None where missing)."""
+    return {column: metric_value(results.get(subsystem), keys) for column, (subsystem, keys) in METRIC_COLUMNS.items()}
+
+def get_or_create_hardware(db: Session, system_info: dict, known: Optional[dict] = None) -> Hardware:
+    """
+    Return the hardware row for `system_info`, inserting it if it is new.
+    `known` optionally caches fingerprint -> Hardware across calls.
+    """
+    fingerprint = hardware_fingerprint(system_info)
+    if known is not None and fingerprint in known:
+        return known[fingerprint]
+    hardware = db.query(Hardware).filter_by(fingerprint=fingerprint).first()
+    if hardware is None:
+        summary = hardware_summary(system_info)
+        hardware = Hardware(
+            fingerprint=fingerprint,
+            cpu_model=summary["cpu_model"],
+            cpu_cores=summary["cpu_cores"],
+            memory_gb=summary["memory_gb"],
+            gpu_model=summary["gpu_model"],
+        )
+        try:
+            with db.begin_nested():
+                db.add(hardware)
+        except IntegrityError:
+            # Inserted concurrently by another request
+            hardware = db.query(Hardware).filter_by(fingerprint=fingerprint).one()
+    if known is not None:
+        known[fingerprint] = hardware
+    return hardware
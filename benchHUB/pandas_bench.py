@@ -0,0 +1,81 @@
+# pandas_bench.py
+import numpy as np
+import pandas as pd
+from benchHUB.utils.timing import record_throughput
+
+N_KEYS = 1000        # Distinct groupby / merge keys
+N_CATEGORIES = 10    # Distinct pivot columns
+ROLLING_WINDOW = 50
+
+
+def make_frame(n_rows: int, seed: int = 42) -> pd.DataFrame:
+    """
+    Generate a synthetic analytics frame with integer keys, float values and strings.
+    """
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "key": rng.integers(0, N_KEYS, n_rows),
+        "category": rng.integers(0, N_CATEGORIES, n_rows),
+        "value": rng.random(n_rows),
+        "quantity": rng.integers(1, 100, n_rows),
+        "name": pd.Series(rng.integers(0, 100_000, n_rows)).map("item_{}".format),
+    })
+
+
+def _operations(df: pd.DataFrame, lookup: pd.DataFrame):
+    """
+    Return the benchmarked operations as zero-argument callables over `df`.
+    """
+    return {
+        "groupby_agg": lambda: df.groupby("key").agg({"value": ["mean", "sum"], "quantity": "max"}),
+        "merge": lambda: df.merge(lookup, on="key", how="left"),
+        "sort_values": lambda: df.sort_values(["category", "value"]),
+        "string_ops": lambda: df["name"].str.upper().str.contains("_1"),
+        "pivot": lambda: df.pivot_table(index="key", columns="category", values="value", aggfunc="mean"),
+        "rolling": lambda: df["value"].rolling(ROLLING_WINDOW).mean(),
+    }
+
+
+def pandas_benchmark(config: dict):
+    """
+    Run pandas DataFrame benchmarks using parameters from a configuration dictionary.
+
+    Args:
+        config (dict): A dictionary containing benchmark parameters.
+                       Expected keys: 'PANDAS_N_ROWS', 'N_RUNS'.
+
+    Returns:
+        dict: Rows/sec per operation under 'numpy' (default dtypes) and, when pyarrow
+              is installed, under 'pyarrow' together with the per-operation
+              'pyarrow_speedup' over the NumPy dtypes.
+    """
+    n_rows = config.get("PANDAS_N_ROWS", 1_000_000)
+    n_runs = config.get("N_RUNS", 3)
+
+    print(f"Generating a {n_rows:,} row DataFrame...")
+    frames = {"numpy": make_frame(n_rows)}
+    lookup = pd.DataFrame({"key": np.arange(N_KEYS), "label": [f"key_{i}" for i in range(N_KEYS)]})
+    lookups = {"numpy": lookup}
+    try:
+        import pyarrow  # noqa: F401
+        frames["pyarrow"] = frames["numpy"].convert_dtypes(dtype_backend="pyarrow")
+        lookups["pyarrow"] = lookup.convert_dtypes(dtype_backend="pyarrow")
+    except ImportError:
+        print("pyarrow not installed, skipping the pyarrow dtype comparison.")
+
+    results = {"n_rows": n_rows}
+    for backend, df in frames.items():
+        print(f"Running pandas operations with {backend} dtypes...")
+        backend_results = {}
+        for name, operation in _operations(df, lookups[backend]).items():
+            backend_results[f"{name}_rows_per_sec"] = record_throughput(operation, n_rows, n_runs)
+            print(f"  {name}: {backend_results[f'{name}_rows_per_sec']:,.0f} rows/sec")
+        results[backend] = backend_results
+
+    if "pyarrow" in results:
+        results["pyarrow_speedup"] = {
+            key.replace("_rows_per_sec", ""): (results["pyarrow"][key] / value if value else 0.0)
+            for key, value in results["numpy"].items()
+        }
+
+    return results
@@ -1,169 +1,149 @@
 import pandas as pd
 import os
 import json
+from concurrent.futures import ProcessPoolExecutor
+from benchHUB.utils.hardware import hardware_summary
+
+# Canonical column -> flattened result keys, in priority order. Older result files used
+# different key names; the first key present wins, otherwise the column is 0.0.
+METRIC_ALIASES = {
+    "cpu_floating_point_operations": ("cpu_floating_point", "cpu_floating_point_operations"),
+    "cpu_calculate_primes": ("cpu_calculate_primes",),
+    "cpu_parallel_processing": ("cpu_parallel_processing",),
+    "memory_allocation": ("memory_allocation",),
+    "memory_bandwidth": ("memory_memory_bandwidth", "memory_bandwidth"),
+    "gpu_tensor_operations": ("gpu_matrix_multiplication", "gpu_tensor_operations", "gpu_gpu_tensor_operations"),
+    "gpu_tiny_training_loop": ("gpu_tiny_training_loop", "gpu_gpu_tiny_training_loop"),
+    "disk_write_time": ("disk_write_time",),
+    "disk_read_time": ("disk_read_time",),
+    "disk_write_read": ("disk_disk_write_read",),
+    "ml_create_dataset": ("ml_timings_create_dataset", "ml_create_dataset"),
+    "ml_run_grid_search": ("ml_grid_search_time", "ml_timings_run_grid_search"),
+    "ml_train_random_forest": ("ml_train_random_forest",),
+    "ml_best_score": ("ml_best_score", "ml_model_accuracy"),
+    "plot_generate_scatter_plot": ("plot_scatter_plot_time", "plot_generate_scatter_plot"),
+    "plot_animate_sine_wave": ("plot_animation_time", "plot_animate_sine_wave"),
+    "plot_render_large_image": ("plot_large_image_time", "plot_render_large_image"),
+    "reference_index": ("reference_index",),
+}
+
+GROUP_COLUMNS = ["system_id", "OS", "CPU_Model", "CPU_Cores", "GPU_Names", "Memory_Total_GB", "timestamp"]
+
+# Below this many new files, a process pool costs more than it saves.
+PARALLEL_THRESHOLD = 64
+
+# Parsed records keyed by absolute file path, with the (mtime, size) they were parsed at.
+_parse_cache = {}
+
+
+def _timestamp_from_filename(file: str):
+    # Handle both 'benchmark_' and 'public_benchmark_' prefixes
+    stem = file.replace("public_benchmark_", "").replace("benchmark_", "").replace(".json", "")
+    try:
+        return pd.to_datetime(stem, format="%Y%m%d_%H%M%S")
+    except ValueError:
+        return pd.NaT  # Not a Time (missing timestamp)
+
+
+def parse_result_file(filepath: str):
+    """
+    Read one JSON result file into a record for `pd.json_normalize`: the benchmark
+    sections unchanged, plus the hardware columns and the file timestamp.
+    Returns None if the file cannot be parsed.
+    """
+    try:
+        with open(filepath, "r") as f:
+            result = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Error reading {os.path.basename(filepath)}: {e}")
+        return None
+    if not isinstance(result, dict):
+        return None
+
+    hardware = hardware_summary(result.get("system_info", {}))
+    cpu_cores = hardware["cpu_cores"]
+    memory_gb = hardware["memory_gb"] if hardware["memory_gb"] is not None else "Unknown"
+
+    # Per-run samples and free-form metadata are not aggregated.
+    record = {k: v for k, v in result.items() if k not in ("system_info", "samples", "scores", "timestamp", "uuid")}
+    record.update({
+        "timestamp": _timestamp_from_filename(os.path.basename(filepath)),
+        "system_id": f"{hardware['os']} | {hardware['cpu_model']} ({cpu_cores or 'Unknown'} cores) | {hardware['gpu_model']} | {memory_gb}GB RAM",
+        "OS": hardware["os"],
+        "CPU_Model": hardware["cpu_model"],
+        "CPU_Cores": cpu_cores,
+        "Memory_Total_GB": memory_gb,
+        "GPU_Names": hardware["gpu_model"],
+    })
+    return record
+
+
+def _parse_files(paths, max_workers=None):
+    if len(paths) < PARALLEL_THRESHOLD:
+        return [parse_result_file(path) for path in paths]
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(parse_result_file, paths, chunksize=16))
+
+
+def apply_aliases(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Add the canonical metric columns from METRIC_ALIASES to a flattened DataFrame.
+    """
+    for column, keys in METRIC_ALIASES.items():
+        value = pd.Series(float("nan"), index=df.index)
+        for key in keys:
+            if key in df.columns:
+                value = value.combine_first(pd.to_numeric(df[key], errors="coerce"))
+        df[column] = value.fillna(0.0)
+    return df
+
 
-def parse_benchmark_results(results_dir: str) -> pd.DataFrame:
+def parse_benchmark_results(results_dir: str, verbose: bool = False, max_workers: int = None) -> pd.DataFrame:
     """
     Parse benchmark results from JSON files, aggregate repeated results, and return a DataFrame.
 
+    Files are parsed in parallel and cached by path, modification time and size, so
+    repeated calls only read new or changed files.
+
     Args:
         results_dir (str): Path to the directory containing JSON benchmark results.
+        verbose (bool): Print per-file progress and intermediate DataFrames.
+        max_workers (int): Process pool size (default: one per CPU).
 
     Returns:
         pd.DataFrame: A DataFrame with aggregated benchmark results (medians).
     """
-    data = []
-
-    # Iterate through JSON files
-    for file in os.listdir(results_dir):
-        if file.endswith(".json"):
-            filepath = os.path.join(results_dir, file)
-            row = {} # Initialize row here
-            # Extract timestamp from filename (e.g., benchmark_YYYYMMDD_HHMMSS.json or public_benchmark_YYYYMMDD_HHMMSS.json)
-            try:
-                # Handle both 'benchmark_' and 'public_benchmark_' prefixes
-                if file.startswith("benchmark_"):
-                    timestamp_str = file.replace("benchmark_", "").replace(".json", "")
-                elif file.startswith("public_benchmark_"):
-                    timestamp_str = file.replace("public_benchmark_", "").replace(".json", "")
-                else:
-                    timestamp_str = file.replace(".json", "") # Fallback for other formats
-
-                row["timestamp"] = pd.to_datetime(timestamp_str, format="%Y%m%d_%H%M%S")
-            except ValueError:
-                row["timestamp"] = pd.NaT # Not a Time (missing timestamp)
-            with open(filepath, "r") as f:
-                try:
-                    result = json.load(f)
-
-                    # Add system info
-                    system_info = result.get("system_info", {})
-                    
-                    # Extract detailed CPU info
-                    cpu_model = "Unknown CPU"
-                    cpu_cores = "Unknown Cores"
-                    if isinstance(system_info, dict):
-                        cpu_info = system_info.get("cpu", {})
-                        if isinstance(cpu_info, dict):
-                            cpu_model = cpu_info.get("model", "Unknown CPU")
-                            cpu_cores = cpu_info.get("cores", "Unknown Cores")
-
-                    # Extract detailed GPU info
-                    gpu_names = "Unknown GPU"
-                    if isinstance(system_info, dict):
-                        gpu_list = system_info.get("gpus", [])
-                        if isinstance(gpu_list, list):
-                            gpu_names = ", ".join([gpu.get("name", "Unknown GPU") for gpu in gpu_list])
-                        elif isinstance(gpu_list, str):
-                            gpu_names = gpu_list # Handle cases where gpu info is a string error message
-                        
-                        if not gpu_names or gpu_names == "Unknown GPU": # Fallback for older GPU info or if pynvml failed
-                            torch_gpus = system_info.get("torch_gpus", {})
-                            if isinstance(torch_gpus, dict):
-                                gpu_names = ", ".join(torch_gpus.get("device_names", ["Unknown GPU"]))
-                            elif isinstance(torch_gpus, str):
-                                gpu_names = torch_gpus
-
-                    # Extract detailed Memory info
-                    total_memory_gb = "Unknown"
-                    if isinstance(system_info, dict):
-                        memory_info = system_info.get("memory", {})
-                        if isinstance(memory_info, dict):
-                            total_memory_gb = memory_info.get("total_gb", "Unknown")
-
-                    # Create a unique system_id
-                    row["system_id"] = f"{system_info.get("os", "Unknown OS")} | {cpu_model} ({cpu_cores} cores) | {gpu_names} | {total_memory_gb}GB RAM"
-
-                    # Add other system info to row
-                    row["OS"] = system_info.get("os", "Unknown")
-                    row["CPU_Model"] = cpu_model
-                    try:
-                        row["CPU_Cores"] = int(cpu_cores)
-                    except ValueError:
-                        row["CPU_Cores"] = None # Or 0, depending on desired behavior for unknown cores
-                    row["Memory_Total_GB"] = total_memory_gb
-                    row["GPU_Names"] = gpu_names
-
-                    # Add benchmarks
-                    # Explicitly extract and flatten benchmark results
-                    # CPU
-                    cpu_results = result.get("cpu", {})
-                    row["cpu_floating_point_operations"] = cpu_results.get("floating_point_operations", 0.0)
-                    row["cpu_parallel_processing"] = cpu_results.get("parallel_processing", 0.0)
-                    # Handle older 'floating_point' key if present
-                    if "floating_point" in cpu_results:
-                        row["cpu_floating_point_operations"] = cpu_results.get("floating_point", 0.0)
-
-                    # Memory
-                    memory_results = result.get("memory", {})
-                    row["memory_allocation"] = memory_results.get("allocation", 0.0)
-
-                    # GPU
-                    gpu_results = result.get("gpu", {})
-                    row["gpu_tensor_operations"] = gpu_results.get("tensor_operations", 0.0)
-                    row["gpu_tiny_training_loop"] = gpu_results.get("tiny_training_loop", 0.0)
-                    # Handle older 'matrix_multiplication' key if present
-                    if "matrix_multiplication" in gpu_results:
-                        row["gpu_tensor_operations"] = gpu_results.get("matrix_multiplication", 0.0)
-
-                    # Disk
-                    disk_results = result.get("disk", {})
-                    row["disk_write_time"] = disk_results.get("write_time", 0.0)
-                    row["disk_read_time"] = disk_results.get("read_time", 0.0)
-
-                    # ML
-                    ml_results = result.get("ml", {})
-                    row["ml_create_dataset"] = ml_results.get("timings", {}).get("create_dataset", 0.0)
-                    row["ml_run_grid_search"] = ml_results.get("timings", {}).get("run_grid_search", 0.0)
-                    row["ml_best_score"] = ml_results.get("best_score", 0.0)
-                    # Handle older 'grid_search_time' key if present
-                    if "grid_search_time" in ml_results:
-                        row["ml_run_grid_search"] = ml_results.get("grid_search_time", 0.0)
-
-                    # Flatten ml_timings and ml_best_params if they exist
-                    if "timings" in ml_results and isinstance(ml_results["timings"], dict):
-                        for timing_key, timing_value in ml_results["timings"].items():
-                            row[f"ml_timings_{timing_key}"] = timing_value
-                    if "best_params" in ml_results and isinstance(ml_results["best_params"], dict):
-                        for param_key, param_value in ml_results["best_params"].items():
-                            row[f"ml_best_params_{param_key}"] = param_value
-
-                    # Plot
-                    plot_results = result.get("plot", {})
-                    row["plot_generate_scatter_plot"] = plot_results.get("generate_scatter_plot", 0.0)
-                    row["plot_animate_sine_wave"] = plot_results.get("animate_sine_wave", 0.0)
-                    row["plot_render_large_image"] = plot_results.get("render_large_image", 0.0)
-                    # Handle older 'scatter_plot_time', 'animation_time', 'large_image_time' keys if present
-                    if "scatter_plot_time" in plot_results:
-                        row["plot_generate_scatter_plot"] = plot_results.get("scatter_plot_time", 0.0)
-                    if "animation_time" in plot_results:
-                        row["plot_animate_sine_wave"] = plot_results.get("animation_time", 0.0)
-                    if "large_image_time" in plot_results:
-                        row["plot_render_large_image"] = plot_results.get("large_image_time", 0.0)
-
-                    # Reference Index (if present)
-                    row["reference_index"] = result.get("reference_index", 0.0)
-
-                    # Append to data list
-                    print(f"Processing file: {file}")
-                    print(f"Row before append: {row}")
-                    data.append(row)
-
-                except Exception as e:
-                    print(f"Error reading {file}: {e}")
-
-    # Convert to DataFrame
-    df = pd.DataFrame(data)
-    print(f"DataFrame before aggregation: {df.head()}")
+    current = {}
+    for entry in os.scandir(results_dir):
+        if entry.name.endswith(".json") and entry.is_file():
+            stat = entry.stat()
+            current[os.path.abspath(entry.path)] = (stat.st_mtime, stat.st_size)
+
+    stale = [path for path, key in current.items() if _parse_cache.get(path, (None, None, None))[:2] != key]
+    for path, record in zip(stale, _parse_files(stale, max_workers)):
+        _parse_cache[path] = current[path] + (record,)
+        if verbose:
+            print(f"Processing file: {os.path.basename(path)}")
+    for path in set(_parse_cache) - set(current):
+        if os.path.dirname(path) == os.path.abspath(results_dir):
+            del _parse_cache[path]
+
+    records = [_parse_cache[path][2] for path in sorted(current) if _parse_cache[path][2] is not None]
+    df = apply_aliases(pd.json_normalize(records, sep="_"))
+    if verbose:
+        print(f"DataFrame before aggregation: {df.head()}")
+    if df.empty:
+        return df
 
     # Aggregate by system configuration (median of repeated results)
-    group_cols = ["system_id", "OS", "CPU_Model", "CPU_Cores", "GPU_Names", "Memory_Total_GB", "timestamp"]
-    agg_df = df.groupby(group_cols).median().reset_index()
-    print(f"DataFrame after aggregation: {agg_df.head()}")
-    print(f"DataFrame dtypes after aggregation: {agg_df.dtypes}")
+    numeric_cols = [c for c in df.select_dtypes("number").columns if c not in GROUP_COLUMNS]
+    agg_df = df.groupby(GROUP_COLUMNS, dropna=False)[numeric_cols].median().reset_index()
+    if verbose:
+        print(f"DataFrame after aggregation: {agg_df.head()}")
+        print(f"DataFrame dtypes after aggregation: {agg_df.dtypes}")
 
     return agg_df
-    
+
 if __name__ == "__main__":
     # Define the path to your test results directory
     results_dir = "./results"  # Replace with the actual path to your directory
@@ -173,15 +153,14 @@ if __name__ == "__main__":
     else:
         try:
             # Call the function and store the DataFrame
-            df = parse_benchmark_results(results_dir)
-            
+            df = parse_benchmark_results(results_dir, verbose=True)
+
             # Print the DataFrame to debug
             print("Parsed and Aggregated DataFrame:")
             print(df)
-            
+
             # Optional: Save the DataFrame to a CSV for inspection
             df.to_csv("debug_output.csv", index=False)
             print("DataFrame saved to 'debug_output.csv'")
         except Exception as e:
             print(f"An error occurred: {e}")
-
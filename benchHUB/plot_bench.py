@@ -1,94 +1,144 @@
 #plot_bench.py
-from benchHUB.utils.timing import timing_decorator
+import io
 import numpy as np
+import statistics
+from benchHUB.utils.timing import record_times
 
 # Suppress matplotlib font cache building message
 import logging
 logging.getLogger('matplotlib.font_manager').setLevel(logging.ERROR)
 
-import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation, FFMpegWriter, PillowWriter
+from matplotlib.figure import Figure
 
-# Timing storage
-timing_results = {}
+RENDER_DPI = 100
 
-@timing_decorator(n_runs=3, use_median=True, timings=timing_results)
-def generate_scatter_plot(points: int):
-    """
-    Generate and render a scatter plot with the given number of points.
-    """
-    x = np.random.rand(points)
-    y = np.random.rand(points)
-    plt.scatter(x, y)
-    plt.title("Scatter Plot Benchmark")
-    plt.close()
-
-@timing_decorator(n_runs=3, use_median=True, timings=timing_results)
-def animate_sine_wave(n_frames: int = 100):
+
+def available_canvases():
     """
-    Create a simple sine wave animation and force it to render by saving.
+    Return the canvas classes to benchmark, keyed by backend name.
+    Agg is always available; Cairo is included when pycairo or cairocffi is installed.
     """
-    # Use non-interactive backend for this function
-    plt.switch_backend("Agg")
-
-    fig, ax = plt.subplots()
-    x = np.linspace(0, 2 * np.pi, 1000)
-    line, = ax.plot(x, np.sin(x))
-
-    def update(frame):
-        line.set_ydata(np.sin(x + frame / 10))
-        return line,
-
-    # Select writer based on availability
-    if FFMpegWriter.isAvailable():
-        writer = FFMpegWriter(fps=20)
-        extension = "mp4"
-    else:
-        writer = PillowWriter(fps=20)
-        extension = "gif"
-
-    # Save the animation
-    ani = FuncAnimation(fig, update, frames=n_frames, blit=True)
-    ani.save(f"temp_animation.{extension}", writer=writer)
-    plt.close(fig)
-
-@timing_decorator(n_runs=3, use_median=True, timings=timing_results)
-def render_large_image(shape=(4000, 4000)):
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    canvases = {"agg": FigureCanvasAgg}
+    try:
+        from matplotlib.backends.backend_cairo import FigureCanvasCairo
+        canvases["cairo"] = FigureCanvasCairo
+    except ImportError:
+        pass
+    return canvases
+
+
+def render(canvas):
     """
-    Render a large random image and save to file to ensure actual rendering.
+    Rasterise the figure into memory, without touching the disk.
     """
-    # Use non-interactive backend for this function
-    plt.switch_backend("Agg")
-    image = np.random.rand(*shape)
-
-    fig, ax = plt.subplots()
-    ax.imshow(image, cmap="gray")
-    fig.savefig("temp_image.png", dpi=80)  # Force rendering
-    plt.close(fig)
-
-def plot_benchmark(
-    n_runs: int = 3, 
-    points: int = 100000, 
-    n_frames: int = 100, 
-    image_shape=(4000, 4000),
-):
+    if hasattr(canvas, "buffer_rgba"):
+        canvas.draw()
+        return canvas.buffer_rgba()
+    buffer = io.BytesIO()
+    canvas.print_raw(buffer)
+    return buffer
+
+
+def _megapixels(fig: Figure) -> float:
+    width, height = fig.get_size_inches() * fig.dpi
+    return width * height / 1e6
+
+
+def plot_benchmark(config: dict, samples: dict = None):
     """
-    Run various plotting benchmarks, returning the timing results in a dictionary.
+    Run plotting benchmarks using parameters from a configuration dictionary.
+
+    Every backend renders the same figures into in-memory buffers, so the results
+    measure rasterisation only.
+
+    Args:
+        config (dict): A dictionary containing benchmark parameters.
+                       Expected keys: 'PLOT_SCATTER_POINTS', 'PLOT_N_FRAMES',
+                       'PLOT_IMAGE_SHAPE', 'N_RUNS'.
+        samples (dict): Optional dictionary that receives the individual Agg run times,
+                        keyed like the returned timings.
+
+    Returns:
+        dict: Agg timings in seconds ('generate_scatter_plot', 'animate_sine_wave',
+              'render_large_image') and, per backend, frames/sec and megapixels/sec.
     """
-    print("Running scatter plot benchmark...")
-    generate_scatter_plot(points=points)
+    points = config.get("PLOT_SCATTER_POINTS", 100_000)
+    n_frames = config.get("PLOT_N_FRAMES", 100)
+    image_shape = config.get("PLOT_IMAGE_SHAPE", (4000, 4000))
+    n_runs = config.get("N_RUNS", 3)
+
+    rng = np.random.default_rng(42)
+    scatter_x, scatter_y = rng.random(points), rng.random(points)
+    image = rng.random(image_shape)
+    wave_x = np.linspace(0, 2 * np.pi, 1000)
+
+    results = {}
+    for backend, canvas_class in available_canvases().items():
+        print(f"Running plotting benchmarks with the {backend} backend...")
+
+        def generate_scatter_plot():
+            fig = Figure(dpi=RENDER_DPI)
+            canvas = canvas_class(fig)
+            ax = fig.add_subplot()
+            ax.scatter(scatter_x, scatter_y)
+            ax.set_title("Scatter Plot Benchmark")
+            render(canvas)
+            return fig
+
+        scatter_fig = generate_scatter_plot()
+        scatter_times = record_times(generate_scatter_plot, n_runs)
+        scatter_time = statistics.median(scatter_times)
+
+        anim_fig = Figure(dpi=RENDER_DPI)
+        anim_canvas = canvas_class(anim_fig)
+        line, = anim_fig.add_subplot().plot(wave_x, np.sin(wave_x))
+
+        def animate_sine_wave():
+            for frame in range(n_frames):
+                line.set_ydata(np.sin(wave_x + frame / 10))
+                render(anim_canvas)
+
+        animation_times = record_times(animate_sine_wave, n_runs)
+        animation_time = statistics.median(animation_times)
+
+        # One image pixel per output pixel, so megapixels/sec tracks the image size.
+        height, width = image_shape
+        image_fig = Figure(figsize=(width / RENDER_DPI, height / RENDER_DPI), dpi=RENDER_DPI)
+        image_canvas = canvas_class(image_fig)
+        image_ax = image_fig.add_axes([0, 0, 1, 1])
+        image_ax.set_axis_off()
+        image_ax.imshow(image, cmap="gray")
+
+        def render_large_image():
+            render(image_canvas)
+
+        image_times = record_times(render_large_image, n_runs)
+        image_time = statistics.median(image_times)
+
+        results[backend] = {
+            "scatter_points_per_sec": points / scatter_time if scatter_time > 0 else 0.0,
+            "scatter_megapixels_per_sec": _megapixels(scatter_fig) / scatter_time if scatter_time > 0 else 0.0,
+            "animation_frames_per_sec": n_frames / animation_time if animation_time > 0 else 0.0,
+            "animation_megapixels_per_sec": n_frames * _megapixels(anim_fig) / animation_time if animation_time > 0 else 0.0,
+            "image_megapixels_per_sec": _megapixels(image_fig) / image_time if image_time > 0 else 0.0,
+        }
+        if backend == "agg":
+            results["generate_scatter_plot"] = scatter_time
+            results["animate_sine_wave"] = animation_time
+            results["render_large_image"] = image_time
+            if samples is not None:
+                samples["generate_scatter_plot"] = scatter_times
+                samples["animate_sine_wave"] = animation_times
+                samples["render_large_image"] = image_times
+        print(f"  {results[backend]['animation_frames_per_sec']:.1f} frames/sec, "
+              f"{results[backend]['image_megapixels_per_sec']:.1f} megapixels/sec")
 
-    print("Running sine wave animation benchmark...")
-    animate_sine_wave(n_frames=n_frames)
+    return results
 
-    print("Running large image rendering benchmark...")
-    render_large_image(shape=image_shape)
 
-    # Return all captured timing results
-    return timing_results
-    
-    
 if __name__ == "__main__":
-    results = plot_benchmark(n_runs=3, points=100000, n_frames=100, image_shape=(4000, 4000))
+    from benchHUB.config import config
+    results = plot_benchmark(config.CONFIG_PROFILES[config.DEFAULT_CONFIG_NAME])
     print("\nPlot Benchmark Results:")
-    print(results)
\ No newline at end of file
+    print(results)
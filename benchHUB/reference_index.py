@@ -1,4 +1,134 @@
 # benchHUB/reference_index.py
+import math
+import random
+import statistics
+
+from benchHUB.config.reference_machine import REFERENCE_MACHINES, REFERENCE_SCORE
+
+# Version stamped on new results. Submissions carry the version they were scored with,
+# so the API can verify older clients against the formula they actually used.
+SCORING_VERSION = "2.0"
+LEGACY_SCORING_VERSION = "1.0"
+
+# Bootstrap settings for the reference index confidence interval. The seed is fixed so
+# that the client and the API derive the same interval from the same samples.
+BOOTSTRAP_RESAMPLES = 1000
+BOOTSTRAP_CONFIDENCE = 0.95
+BOOTSTRAP_SEED = 0
+
+# --- Version 2.0 ---
+
+# Share of the reference index carried by each subsystem.
+SUBSYSTEM_WEIGHTS = {
+    "cpu": 0.25,
+    "gpu": 0.20,
+    "memory": 0.15,
+    "ml": 0.15,
+    "disk": 0.10,
+    "plot": 0.15,
+}
+
+# Subsystems a complete run may lack: machines without an accelerator are still ranked.
+# Any other missing subsystem makes a run partial, and the API rejects it.
+OPTIONAL_SUBSYSTEMS = ("gpu",)
+
+# Metrics scored per subsystem: canonical key -> (accepted result keys, weight).
+SUBSYSTEM_METRICS = {
+    "cpu": {
+        "calculate_primes": (("calculate_primes",), 0.5),
+        "parallel_processing": (("parallel_processing",), 0.5),
+    },
+    "gpu": {
+        "gpu_tensor_operations": (("gpu_tensor_operations", "tensor_operations"), 0.7),
+        "gpu_tiny_training_loop": (("gpu_tiny_training_loop", "tiny_training_loop"), 0.3),
+    },
+    "memory": {
+        "memory_bandwidth": (("memory_bandwidth", "bandwidth"), 1.0),
+    },
+    "disk": {
+        "disk_write_read": (("disk_write_read",), 1.0),
+    },
+    "ml": {
+        "train_random_forest": (("train_random_forest",), 1.0),
+    },
+    "plot": {
+        "generate_scatter_plot": (("generate_scatter_plot",), 1 / 3),
+        "animate_sine_wave": (("animate_sine_wave",), 1 / 3),
+        "render_large_image": (("render_large_image",), 1 / 3),
+    },
+}
+
+
+def metric_value(subsystem_results, keys):
+    """
+    Return the first positive numeric value found under `keys`, or None.
+    Zero, negative and non-numeric values count as missing.
+    """
+    if not isinstance(subsystem_results, dict):
+        return None
+    for key in keys:
+        value = subsystem_results.get(key)
+        if isinstance(value, (int, float)) and not isinstance(value, bool) and value > 0:
+            return float(value)
+    return None
+
+
+def weighted_geometric_mean(values_and_weights):
+    """
+    Weighted geometric mean of (value, weight) pairs; weights are renormalized.
+    Returns None for an empty input.
+    """
+    pairs = [(v, w) for v, w in values_and_weights if v is not None and w > 0]
+    total_weight = sum(w for _, w in pairs)
+    if not pairs or total_weight <= 0:
+        return None
+    return math.exp(sum(w * math.log(v) for v, w in pairs) / total_weight)
+
+
+def score_subsystem(subsystem, subsystem_results, reference):
+    """
+    Score one subsystem as the weighted geometric mean of reference/measured time ratios,
+    so 1.0 means "as fast as the reference machine". Returns None if no metric is present.
+    """
+    ratios = []
+    for name, (keys, weight) in SUBSYSTEM_METRICS[subsystem].items():
+        value = metric_value(subsystem_results, keys)
+        reference_value = reference.get(name)
+        if value is not None and reference_value:
+            ratios.append((reference_value / value, weight))
+    return weighted_geometric_mean(ratios)
+
+
+def score_results_v2(results):
+    """
+    Score a full result dict against the stored reference machine for its profile.
+
+    Subsystems with no usable metric (e.g. no GPU) are listed under 'missing' and
+    excluded, and the remaining subsystem weights are renormalized; 'coverage' is the
+    share of the total weight that was actually scored.
+    """
+    profile = results.get("config_name") or "standard"
+    references = REFERENCE_MACHINES["2.0"]
+    if profile not in references:
+        raise ValueError(f"No reference machine for profile '{profile}'")
+    reference = references[profile]
+
+    subsystems = {}
+    for subsystem in SUBSYSTEM_WEIGHTS:
+        subsystems[subsystem] = score_subsystem(subsystem, results.get(subsystem), reference.get(subsystem, {}))
+
+    missing = [name for name, score in subsystems.items() if score is None]
+    combined = weighted_geometric_mean((score, SUBSYSTEM_WEIGHTS[name]) for name, score in subsystems.items())
+    return {
+        "version": "2.0",
+        "index": combined * REFERENCE_SCORE if combined is not None else 0.0,
+        "subsystems": {name: (score * REFERENCE_SCORE if score is not None else None) for name, score in subsystems.items()},
+        "missing": missing,
+        "coverage": sum(weight for name, weight in SUBSYSTEM_WEIGHTS.items() if name not in missing),
+    }
+
+
+# --- Version 1.0 (legacy) ---
 
 # Define weights for the reference index calculation
 CPU_WEIGHT = 0.4
@@ -26,7 +156,7 @@ def score_cpu(cpu_results):
         if time is None or time == 0:
             return 0
         return (1.0 / time) * CPU_WEIGHT
-    except (TypeError, KeyError):
+    except (TypeError, KeyError, AttributeError):
         return 0
 
 def score_gpu(gpu_results):
@@ -57,5 +187,86 @@ def score_memory(memory_results):
         if time is None or time == 0:
             return 0
         return (1.0 / time) * MEMORY_WEIGHT
-    except (TypeError, KeyError):
-        return 0
\ No newline at end of file
+    except (TypeError, KeyError, AttributeError):
+        return 0
+
+def score_results_v1(results):
+    """
+    Score a full result dict with the legacy inverse-seconds formula.
+    """
+    subsystems = {
+        "cpu": score_cpu(results.get("cpu")),
+        "gpu": score_gpu(results.get("gpu")),
+        "memory": score_memory(results.get("memory")),
+    }
+    return {
+        "version": "1.0",
+        "index": calculate_reference_index(subsystems["cpu"], subsystems["gpu"], subsystems["memory"]),
+        "subsystems": subsystems,
+        "missing": [name for name, score in subsystems.items() if not score],
+        "coverage": None,
+    }
+
+
+SCORERS = {
+    "1.0": score_results_v1,
+    "2.0": score_results_v2,
+}
+
+
+def score_results(results, version=SCORING_VERSION):
+    """
+    Score a full result dict with the given scoring version.
+
+    Returns:
+        dict: 'version', 'index', per-subsystem 'subsystems' scores, the 'missing'
+              subsystems and the weight 'coverage' (None for the legacy formula).
+
+    Raises:
+        ValueError: If the scoring version is unknown.
+    """
+    scorer = SCORERS.get(version)
+    if scorer is None:
+        raise ValueError(f"Unknown scoring version '{version}'. Supported: {', '.join(SCORERS)}")
+    return scorer(results)
+
+
+def bootstrap_reference_index(results, samples, version=SCORING_VERSION, n_resamples=BOOTSTRAP_RESAMPLES,
+                              confidence=BOOTSTRAP_CONFIDENCE, seed=BOOTSTRAP_SEED):
+    """
+    Bootstrap a confidence interval for the reference index from per-run samples.
+
+    Each resample draws every metric's runs with replacement, replaces the metric by
+    the median of the draw (matching how benchmarks report it) and re-scores the result.
+
+    Args:
+        results (dict): Full result dict, as passed to `score_results`.
+        samples (dict): Per-run times as {subsystem: {metric: [seconds, ...]}}.
+
+    Returns:
+        tuple: (low, high) bounds of the interval, or None without usable samples.
+    """
+    usable = {
+        subsystem: {metric: runs for metric, runs in metrics.items()
+                    if isinstance(runs, list) and runs and metric in (results.get(subsystem) or {})}
+        for subsystem, metrics in (samples or {}).items() if isinstance(metrics, dict)
+    }
+    usable = {subsystem: metrics for subsystem, metrics in usable.items() if metrics}
+    if not usable:
+        return None
+
+    rng = random.Random(seed)
+    indices = []
+    for _ in range(n_resamples):
+        resampled = dict(results)
+        for subsystem, metrics in usable.items():
+            resampled[subsystem] = dict(results[subsystem])
+            for metric, runs in metrics.items():
+                resampled[subsystem][metric] = statistics.median(rng.choices(runs, k=len(runs)))
+        indices.append(score_results(resampled, version)["index"])
+
+    indices.sort()
+    tail = (1 - confidence) / 2
+    low = indices[int(tail * (n_resamples - 1))]
+    high = indices[int(round((1 - tail) * (n_resamples - 1)))]
+    return low, high
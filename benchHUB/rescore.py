@@ -0,0 +1,209 @@
+# benchHUB/rescore.py
+"""
+Bulk re-scoring of stored results.
+
+Rows are streamed from the `results` table in id-ordered chunks, their JSON metric
+columns are decoded into NumPy arrays and a whole chunk is scored at once with the
+same weights and reference machine as `reference_index.score_results`. Scores are
+written back with one batched UPDATE per chunk.
+"""
+import json
+import math
+import time
+
+import numpy as np
+from sqlalchemy import text
+
+from benchHUB.config.reference_machine import REFERENCE_MACHINES, REFERENCE_SCORE
+from benchHUB.reference_index import (
+    SCORING_VERSION, SUBSYSTEM_METRICS, SUBSYSTEM_WEIGHTS,
+    CPU_WEIGHT, GPU_WEIGHT, MEMORY_WEIGHT,
+)
+
+SUBSYSTEMS = ("cpu", "memory", "gpu", "disk", "ml", "plot")
+DEFAULT_CHUNK_SIZE = 5000
+
+
+def _decode(value):
+    if not value:
+        return {}
+    if isinstance(value, dict):  # JSONB columns come back already decoded on PostgreSQL
+        return value
+    try:
+        decoded = json.loads(value)
+    except (TypeError, ValueError):
+        return {}
+    return decoded if isinstance(decoded, dict) else {}
+
+
+def metric_column(rows, keys):
+    """
+    Extract one metric from a list of decoded subsystem dicts as a float array.
+    Like `reference_index.metric_value`, the first positive number under `keys` wins
+    and anything else becomes NaN.
+    """
+    column = np.full(len(rows), np.nan)
+    for i, row in enumerate(rows):
+        for key in keys:
+            value = row.get(key)
+            if isinstance(value, (int, float)) and not isinstance(value, bool) and value > 0:
+                column[i] = value
+                break
+    return column
+
+
+def _weighted_log_mean(logs, weights):
+    """
+    Row-wise weighted mean of a (rows, columns) log matrix, ignoring NaN entries.
+    Returns NaN for rows without any finite entry.
+    """
+    present = ~np.isnan(logs)
+    w = np.where(present, weights, 0.0)
+    total = w.sum(axis=1)
+    summed = (np.where(present, logs, 0.0) * w).sum(axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(total > 0, summed / total, np.nan)
+
+
+def score_columns_v2(config_names, decoded):
+    """
+    Vectorized equivalent of `reference_index.score_results_v2`.
+
+    Args:
+        config_names (list): Profile name per row (None means 'standard').
+        decoded (dict): {subsystem: [decoded dict per row]}.
+
+    Returns:
+        tuple: (reference index per row, NaN for rows with an unknown profile;
+                weight coverage per row; list of missing subsystems per row), like
+                the 'index', 'coverage' and 'missing' of `score_results_v2`.
+    """
+    n = len(config_names)
+    profiles = np.array([name or "standard" for name in config_names], dtype=object)
+    references = REFERENCE_MACHINES["2.0"]
+    known = np.isin(profiles, list(references))
+
+    subsystem_logs = np.full((n, len(SUBSYSTEM_WEIGHTS)), np.nan)
+    for j, subsystem in enumerate(SUBSYSTEM_WEIGHTS):
+        metrics = SUBSYSTEM_METRICS[subsystem]
+        metric_logs = np.full((n, len(metrics)), np.nan)
+        metric_weights = np.array([weight for _, weight in metrics.values()])
+        for k, (name, (keys, _)) in enumerate(metrics.items()):
+            reference = np.full(n, np.nan)
+            for profile, machine in references.items():
+                value = machine.get(subsystem, {}).get(name)
+                if value:
+                    reference[profiles == profile] = value
+            with np.errstate(invalid="ignore", divide="ignore"):
+                metric_logs[:, k] = np.log(reference / metric_column(decoded[subsystem], keys))
+        subsystem_logs[:, j] = _weighted_log_mean(metric_logs, metric_weights)
+
+    subsystem_weights = np.array(list(SUBSYSTEM_WEIGHTS.values()))
+    combined = _weighted_log_mean(subsystem_logs, subsystem_weights)
+    scores = np.where(np.isnan(combined), 0.0, np.exp(combined) * REFERENCE_SCORE)
+    scored = ~np.isnan(subsystem_logs)
+    coverage = np.where(scored, subsystem_weights, 0.0).sum(axis=1)
+    missing = [[name for name, present in zip(SUBSYSTEM_WEIGHTS, row) if not present] for row in scored]
+    return np.where(known, scores, np.nan), coverage, missing
+
+
+def score_columns_v1(config_names, decoded):
+    """
+    Vectorized equivalent of `reference_index.score_results_v1`, which records no
+    coverage: returns (reference index per row, None, None).
+    """
+    def inverse(column, weight):
+        return np.where(np.isnan(column), 0.0, weight / column)
+
+    cpu = inverse(metric_column(decoded["cpu"], ("calculate_primes",)), CPU_WEIGHT)
+    gpu = inverse(metric_column(decoded["gpu"], ("tensor_operations", "gpu_tensor_operations")), GPU_WEIGHT)
+    memory = inverse(metric_column(decoded["memory"], ("bandwidth", "memory_bandwidth")), MEMORY_WEIGHT)
+    return np.minimum((cpu + gpu + memory) * 0.5, 999.9), None, None
+
+
+COLUMN_SCORERS = {
+    "1.0": score_columns_v1,
+    "2.0": score_columns_v2,
+}
+
+
+def keeps_interval(row, score, version) -> bool:
+    """
+    Whether a row's stored confidence interval still describes its new score: only
+    when neither the scoring version nor the score itself changes.
+    """
+    return (
+        row.scoring_version == version
+        and row.reference_index is not None
+        and math.isclose(row.reference_index, score, rel_tol=1e-9)
+    )
+
+
+def rescore_results(engine, version=SCORING_VERSION, chunk_size=DEFAULT_CHUNK_SIZE, dry_run=False):
+    """
+    Recompute `reference_index` for every stored result with the given scoring version.
+
+    Rows whose score changes lose their confidence interval, since the per-run
+    samples it was derived from are not stored; an unchanged score at the same
+    scoring version keeps it. The scoring coverage and missing subsystems are
+    rewritten too (NULL under the legacy formula), as the API stores them.
+
+    Args:
+        engine: SQLAlchemy engine bound to the leaderboard database.
+        version (str): Scoring version to apply.
+        chunk_size (int): Rows fetched, scored and updated per batch.
+        dry_run (bool): Score without writing anything back.
+
+    Returns:
+        dict: 'scanned', 'updated' and 'skipped' (unknown profile) row counts and 'seconds'.
+    """
+    scorer = COLUMN_SCORERS.get(version)
+    if scorer is None:
+        raise ValueError(f"Unknown scoring version '{version}'. Supported: {', '.join(COLUMN_SCORERS)}")
+
+    select_chunk = text(
+        f"SELECT id, config_name, scoring_version, reference_index, {', '.join(SUBSYSTEMS)} FROM results "
+        "WHERE id > :last_id ORDER BY id LIMIT :chunk_size"
+    )
+    update_scores = text(
+        "UPDATE results SET reference_index = :score, scoring_version = :version, "
+        "coverage = :coverage, missing_subsystems = :missing_subsystems, "
+        "reference_index_low = CASE WHEN :keep_interval = 1 THEN reference_index_low END, "
+        "reference_index_high = CASE WHEN :keep_interval = 1 THEN reference_index_high END "
+        "WHERE id = :id"
+    )
+
+    stats = {"scanned": 0, "updated": 0, "skipped": 0}
+    started = time.perf_counter()
+    last_id = 0
+    while True:
+        with engine.connect() as conn:
+            rows = conn.execute(select_chunk, {"last_id": last_id, "chunk_size": chunk_size}).fetchall()
+        if not rows:
+            break
+        last_id = rows[-1].id
+
+        decoded = {subsystem: [_decode(getattr(row, subsystem)) for row in rows] for subsystem in SUBSYSTEMS}
+        scores, coverage, missing = scorer([row.config_name for row in rows], decoded)
+
+        updates = [
+            {
+                "id": row.id,
+                "score": float(scores[i]),
+                "version": version,
+                "keep_interval": int(keeps_interval(row, scores[i], version)),
+                "coverage": float(coverage[i]) if coverage is not None else None,
+                "missing_subsystems": ",".join(missing[i]) if missing is not None else None,
+            }
+            for i, row in enumerate(rows) if not np.isnan(scores[i])
+        ]
+        stats["scanned"] += len(rows)
+        stats["skipped"] += len(rows) - len(updates)
+        if updates and not dry_run:
+            with engine.begin() as conn:
+                conn.execute(update_scores, updates)
+        stats["updated"] += len(updates)
+        print(f"  Re-scored {stats['scanned']} rows...")
+
+    stats["seconds"] = time.perf_counter() - started
+    return stats
@@ -0,0 +1,231 @@
+#results_store.py
+"""
+results_store.py
+
+A local, indexed store for benchmark runs. Each run is ingested once into a SQLite
+file as one row of flattened columns ("cpu.calculate_primes", "plot.agg.animation_frames_per_sec", ...),
+so queries read only the columns and time range they need instead of re-parsing
+every JSON file in the results directory.
+"""
+
+import json
+import os
+import sqlite3
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+from benchHUB.utils.hardware import hardware_fingerprint, hardware_summary
+
+DEFAULT_STORE_NAME = "results.db"
+
+
+def _quote(column: str) -> str:
+    return '"' + column.replace('"', '""') + '"'
+
+
+def flatten_result(result: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+    """
+    Flatten a nested result dict into dot-separated keys.
+    Lists (e.g. per-run samples) are kept as JSON text in a single column.
+    """
+    flat = {}
+    for key, value in result.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten_result(value, f"{name}."))
+        elif isinstance(value, (list, tuple)):
+            flat[name] = json.dumps(value)
+        elif value is None or isinstance(value, (int, float, str)):
+            flat[name] = value
+        else:
+            flat[name] = str(value)
+    return flat
+
+
+def timestamp_from_filename(filename: str) -> Optional[str]:
+    """
+    Parse the run time from 'benchmark_YYYYMMDD_HHMMSS.json' style names.
+    """
+    stem = os.path.basename(filename).replace("public_benchmark_", "").replace("benchmark_", "").replace(".json", "")
+    try:
+        return datetime.strptime(stem, "%Y%m%d_%H%M%S").isoformat()
+    except ValueError:
+        return None
+
+
+class ResultsStore:
+    """
+    Append-only store of benchmark runs in an indexed SQLite file.
+    """
+
+    def __init__(self, db_path: str = os.path.join("results", DEFAULT_STORE_NAME)):
+        """
+        :param db_path: Path to the SQLite store file.
+        """
+        self.db_path = db_path
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(db_path)
+        self._init_db()
+
+    def _init_db(self):
+        """
+        Create the 'runs' and 'ingested_files' tables and their indexes if needed.
+        """
+        with self._conn:
+            self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS runs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                uuid TEXT UNIQUE,
+                timestamp TEXT,
+                config_name TEXT,
+                fingerprint TEXT,
+                reference_index REAL,
+                source TEXT
+            )
+            """)
+            self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS ingested_files (
+                path TEXT PRIMARY KEY,
+                mtime REAL NOT NULL,
+                size INTEGER NOT NULL
+            )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_runs_timestamp ON runs (timestamp)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_runs_fingerprint ON runs (fingerprint, timestamp)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_runs_config ON runs (config_name, timestamp)")
+        self._columns = self._existing_columns()
+
+    def _existing_columns(self) -> List[str]:
+        return [row[1] for row in self._conn.execute("PRAGMA table_info(runs)")]
+
+    def _ensure_columns(self, row: Dict[str, Any]):
+        for column, value in row.items():
+            if column not in self._columns:
+                column_type = "REAL" if isinstance(value, (int, float)) and not isinstance(value, bool) else "TEXT"
+                self._conn.execute(f"ALTER TABLE runs ADD COLUMN {_quote(column)} {column_type}")
+                self._columns.append(column)
+
+    def _row(self, result: Dict[str, Any], source: Optional[str]) -> Dict[str, Any]:
+        row = flatten_result({k: v for k, v in result.items() if k != "system_info"})
+        system_info = result.get("system_info", {})
+        row.update({f"hardware.{key}": value for key, value in hardware_summary(system_info).items()})
+        row["fingerprint"] = hardware_fingerprint(system_info)
+        row["timestamp"] = result.get("timestamp") or (timestamp_from_filename(source) if source else None)
+        row["source"] = source
+        return row
+
+    def ingest(self, result: Dict[str, Any], source: Optional[str] = None) -> bool:
+        """
+        Store one run. Runs are keyed by uuid, so ingesting the same run twice is a no-op.
+
+        :param result: A full result dict as produced by `run_all_benchmarks`.
+        :param source: Optional path of the JSON file the run came from.
+        :return: True if a new row was inserted.
+        """
+        return self.ingest_many([(result, source)]) > 0
+
+    def ingest_many(self, results: Iterable) -> int:
+        """
+        Store several runs in one transaction.
+
+        :param results: Iterable of (result dict, source path or None) pairs.
+        :return: The number of new rows inserted.
+        """
+        inserted = 0
+        with self._conn:
+            for result, source in results:
+                row = self._row(result, source)
+                self._ensure_columns(row)
+                columns = ", ".join(_quote(c) for c in row)
+                placeholders = ", ".join("?" for _ in row)
+                cursor = self._conn.execute(
+                    f"INSERT OR IGNORE INTO runs ({columns}) VALUES ({placeholders})", list(row.values())
+                )
+                inserted += cursor.rowcount
+                if source and os.path.isfile(source):
+                    # Remember the file so sync_directory does not parse it again
+                    stat = os.stat(source)
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO ingested_files (path, mtime, size) VALUES (?, ?, ?)",
+                        (os.path.abspath(source), stat.st_mtime, stat.st_size),
+                    )
+        return inserted
+
+    def sync_directory(self, results_dir: str) -> int:
+        """
+        Ingest JSON result files that are new or changed since the last sync.
+
+        :param results_dir: Directory containing 'benchmark_*.json' files.
+        :return: The number of new runs ingested.
+        """
+        seen = {path: (mtime, size) for path, mtime, size in self._conn.execute("SELECT path, mtime, size FROM ingested_files")}
+        pending = []
+        for entry in os.scandir(results_dir):
+            if not entry.name.endswith(".json") or not entry.is_file():
+                continue
+            stat = entry.stat()
+            if seen.get(os.path.abspath(entry.path)) == (stat.st_mtime, stat.st_size):
+                continue
+            try:
+                with open(entry.path, "r") as f:
+                    result = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"Error reading {entry.name}: {e}")
+                continue
+            if isinstance(result, dict):
+                pending.append((result, entry.path))
+        return self.ingest_many(pending)
+
+    def columns(self, prefix: str = "") -> List[str]:
+        """
+        List the stored columns, optionally only those starting with `prefix` (e.g. "cpu.").
+        """
+        return [c for c in self._columns if c.startswith(prefix)]
+
+    def query(
+        self,
+        columns: Optional[List[str]] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        config_name: Optional[str] = None,
+        fingerprint: Optional[str] = None,
+    ):
+        """
+        Read runs into a DataFrame, touching only the requested columns and time range.
+
+        :param columns: Columns to read (default: all). Unknown columns come back as NULL.
+        :param start: Inclusive ISO timestamp lower bound.
+        :param end: Exclusive ISO timestamp upper bound.
+        :param config_name: Only runs of this profile.
+        :param fingerprint: Only runs from this hardware fingerprint.
+        :return: A pandas DataFrame ordered by timestamp.
+        """
+        import pandas as pd
+
+        wanted = columns or self._columns
+        select = ", ".join(_quote(c) if c in self._columns else f"NULL AS {_quote(c)}" for c in wanted)
+        conditions, params = [], []
+        for column, operator, value in (
+            ("timestamp", ">=", start), ("timestamp", "<", end),
+            ("config_name", "=", config_name), ("fingerprint", "=", fingerprint),
+        ):
+            if value is not None:
+                conditions.append(f"{column} {operator} ?")
+                params.append(value)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        return pd.read_sql_query(f"SELECT {select} FROM runs{where} ORDER BY timestamp", self._conn, params=params)
+
+    def close(self):
+        self._conn.close()
+
+
+if __name__ == "__main__":
+    results_dir = "./results"
+    if not os.path.exists(results_dir):
+        print(f"Results directory '{results_dir}' does not exist.")
+    else:
+        store = ResultsStore(os.path.join(results_dir, DEFAULT_STORE_NAME))
+        print(f"Ingested {store.sync_directory(results_dir)} new run(s) into {store.db_path}")
+        store.close()
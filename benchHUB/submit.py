@@ -0,0 +1,99 @@
+#submit.py
+"""
+submit.py
+
+Upload saved result files to the online leaderboard in batches, e.g. results
+collected from a fleet of hosts. Each request carries up to `--batch-size`
+results; results already on the leaderboard (same uuid) are reported as
+duplicates, so an interrupted upload can simply be run again.
+
+Usage:
+    python -m benchHUB.main submit results/*.json [--batch-size 100]
+"""
+
+import argparse
+import gzip
+import json
+import os
+from typing import List
+
+from benchHUB.main import to_serializable
+
+DEFAULT_BATCH_SIZE = 100
+
+
+def load_results(paths: List[str]) -> List[dict]:
+    """
+    Load result JSON files, skipping (and reporting) those that cannot be read or have no uuid.
+    """
+    results = []
+    for path in paths:
+        try:
+            with open(path, "r") as f:
+                result = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Skipping {path}: {e}")
+            continue
+        if not isinstance(result, dict) or not result.get("uuid"):
+            print(f"Skipping {path}: not a benchHUB result")
+            continue
+        results.append(result)
+    return results
+
+
+def submit_batches(results: List[dict], api_url: str, batch_size: int = DEFAULT_BATCH_SIZE, session=None) -> dict:
+    """
+    Post results to `/api/submit/batch`, `batch_size` at a time, gzip-compressed.
+
+    Returns:
+        dict: Counts of 'created', 'duplicate', 'rejected' and 'failed' (batches the
+              API did not accept, counted per result).
+    """
+    import requests
+    session = session or requests.Session()
+    totals = {"created": 0, "duplicate": 0, "rejected": 0, "failed": 0}
+    for start in range(0, len(results), batch_size):
+        batch = results[start:start + batch_size]
+        try:
+            body = gzip.compress(json.dumps([to_serializable(r) for r in batch]).encode())
+            response = session.post(
+                f"{api_url}/api/submit/batch",
+                data=body,
+                headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+            )
+        except requests.exceptions.RequestException as e:
+            print(f"Could not connect to the leaderboard API. Error: {e}")
+            totals["failed"] += len(batch)
+            continue
+        if response.status_code != 200:
+            print(f"Error submitting results {start + 1}-{start + len(batch)}. Status: {response.status_code}, Details: {response.text}")
+            totals["failed"] += len(batch)
+            continue
+        for item in response.json()["items"]:
+            totals[item["status"]] += 1
+            if item["status"] == "rejected":
+                label = item.get("uuid") or f"item {start + item['index'] + 1}"
+                print(f"Rejected {label}: {item['detail']}")
+    return totals
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Upload saved results to the online leaderboard in batches.")
+    parser.add_argument("files", nargs="+", help="Result JSON files.")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Results per request (at most 100).")
+    parser.add_argument("--api-url", default=os.environ.get("API_URL", "https://benchhub-api.onrender.com"), help="Leaderboard API URL.")
+    args = parser.parse_args(argv)
+
+    results = load_results(args.files)
+    if not results:
+        print("No results to submit.")
+        return 1
+    print(f"Submitting {len(results)} result(s) to {args.api_url}...")
+    totals = submit_batches(results, args.api_url, max(1, min(args.batch_size, DEFAULT_BATCH_SIZE)))
+    print(f"Created {totals['created']}, already submitted {totals['duplicate']}, "
+          f"rejected {totals['rejected']}, failed {totals['failed']}.")
+    return 1 if totals["rejected"] or totals["failed"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
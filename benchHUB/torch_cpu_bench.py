@@ -0,0 +1,123 @@
+# torch_cpu_bench.py
+import os
+from benchHUB.utils.timing import record_throughput
+
+
+def _thread_counts(max_threads: int):
+    """
+    Return the thread counts to sweep: powers of two up to, and including, max_threads.
+    """
+    counts = []
+    t = 1
+    while t < max_threads:
+        counts.append(t)
+        t *= 2
+    counts.append(max_threads)
+    return counts
+
+
+def torch_cpu_benchmark(config: dict):
+    """
+    Run PyTorch benchmarks on the CPU using parameters from a configuration dictionary.
+
+    Covers fp32/bf16 matmul, an MLP and a conv training step and batched inference,
+    swept over `torch.set_num_threads`, plus the `torch.compile` speed-up when available.
+
+    Args:
+        config (dict): A dictionary containing benchmark parameters.
+                       Expected keys: 'TORCH_CPU_MATRIX_SIZE', 'TORCH_CPU_BATCH_SIZE', 'N_RUNS'.
+
+    Returns:
+        dict: Throughput results (GFLOPS for matmul, samples/sec otherwise). The top-level
+              metrics are measured with all threads; 'thread_sweep' holds one entry per
+              thread count.
+    """
+    try:
+        import torch
+    except ImportError as e:
+        print(f"Torch CPU benchmark skipped: {e}")
+        return {}
+
+    matrix_size = config.get("TORCH_CPU_MATRIX_SIZE", 1024)
+    batch_size = config.get("TORCH_CPU_BATCH_SIZE", 128)
+    n_runs = config.get("N_RUNS", 3)
+
+    device = torch.device("cpu")
+    torch.manual_seed(42)
+
+    # Models and data are built once, outside the timed regions.
+    mlp = torch.nn.Sequential(
+        torch.nn.Linear(256, 512), torch.nn.ReLU(),
+        torch.nn.Linear(512, 512), torch.nn.ReLU(),
+        torch.nn.Linear(512, 10),
+    ).to(device)
+    conv = torch.nn.Sequential(
+        torch.nn.Conv2d(3, 16, 3, padding=1), torch.nn.ReLU(), torch.nn.MaxPool2d(2),
+        torch.nn.Conv2d(16, 32, 3, padding=1), torch.nn.ReLU(), torch.nn.MaxPool2d(2),
+        torch.nn.Flatten(), torch.nn.Linear(32 * 8 * 8, 10),
+    ).to(device)
+    mlp_optimizer = torch.optim.SGD(mlp.parameters(), lr=0.01)
+    conv_optimizer = torch.optim.SGD(conv.parameters(), lr=0.01)
+    criterion = torch.nn.CrossEntropyLoss()
+
+    a = torch.rand(matrix_size, matrix_size, device=device)
+    b = torch.rand(matrix_size, matrix_size, device=device)
+    mlp_X = torch.rand(batch_size, 256, device=device)
+    conv_X = torch.rand(batch_size, 3, 32, 32, device=device)
+    y = torch.randint(0, 10, (batch_size,), device=device)
+    matmul_flops = 2 * matrix_size ** 3
+
+    def matmul(x, w):
+        torch.matmul(x, w)
+
+    def train_step(model, optimizer, X):
+        optimizer.zero_grad()
+        loss = criterion(model(X), y)
+        loss.backward()
+        optimizer.step()
+
+    def inference(model, X):
+        with torch.inference_mode():
+            model(X)
+
+    def throughput(func, work, *args):
+        return record_throughput(func, work, n_runs, True, *args)
+
+    def run_suite():
+        suite = {
+            'matmul_fp32_gflops': throughput(matmul, matmul_flops, a, b) / 1e9,
+            'mlp_train_samples_per_sec': throughput(train_step, batch_size, mlp, mlp_optimizer, mlp_X),
+            'conv_train_samples_per_sec': throughput(train_step, batch_size, conv, conv_optimizer, conv_X),
+            'inference_samples_per_sec': throughput(inference, batch_size, mlp, mlp_X),
+        }
+        try:
+            suite['matmul_bf16_gflops'] = throughput(matmul, matmul_flops, a.bfloat16(), b.bfloat16()) / 1e9
+        except RuntimeError as e:
+            print(f"bf16 matmul not supported on this CPU: {e}")
+        return suite
+
+    default_threads = torch.get_num_threads()
+    max_threads = os.cpu_count() or default_threads
+    results = {'num_threads': max_threads, 'thread_sweep': {}}
+
+    try:
+        for n_threads in _thread_counts(max_threads):
+            print(f"Running torch CPU suite with {n_threads} thread(s)...")
+            torch.set_num_threads(n_threads)
+            results['thread_sweep'][str(n_threads)] = run_suite()
+        results.update(results['thread_sweep'][str(max_threads)])
+
+        results['compile_speedup'] = None
+        if hasattr(torch, "compile"):
+            print("Measuring torch.compile speed-up...")
+            try:
+                compiled_mlp = torch.compile(mlp)
+                compiled = throughput(inference, batch_size, compiled_mlp, mlp_X)
+                if results['inference_samples_per_sec'] > 0:
+                    results['compile_speedup'] = compiled / results['inference_samples_per_sec']
+            except Exception as e:  # compile backends fail in many platform-specific ways
+                print(f"torch.compile unavailable: {e}")
+    finally:
+        torch.set_num_threads(default_threads)
+
+    return results
@@ -0,0 +1,58 @@
+import hashlib
+
+
+def _gpu_names(system_info: dict) -> str:
+    gpus = system_info.get("gpus")
+    if isinstance(gpus, list) and gpus:
+        return ", ".join(str(gpu.get("name", "N/A")) for gpu in gpus if isinstance(gpu, dict))
+    torch_gpus = system_info.get("torch_gpus")
+    if isinstance(torch_gpus, dict):
+        return ", ".join(torch_gpus.get("device_names", ["N/A"]))
+    return "N/A"
+
+
+def hardware_summary(system_info) -> dict:
+    """
+    Extract the fields that identify a machine from a `system_info` dict.
+
+    Handles both the current layout (nested 'cpu' and 'memory' dicts) and the older
+    one ('cpu_count' and a "36.0 GB" memory string).
+
+    Returns:
+        dict: 'os', 'cpu_model', 'cpu_cores', 'memory_gb' and 'gpu_model'.
+    """
+    if not isinstance(system_info, dict):
+        system_info = {}
+    cpu = system_info.get("cpu") if isinstance(system_info.get("cpu"), dict) else {}
+    memory = system_info.get("memory")
+
+    cores = cpu.get("cores", system_info.get("cpu_count"))
+    if isinstance(memory, dict):
+        memory_gb = memory.get("total_gb")
+    elif isinstance(memory, str):
+        try:
+            memory_gb = float(memory.split()[0])
+        except (ValueError, IndexError):
+            memory_gb = None
+    else:
+        memory_gb = None
+
+    return {
+        "os": system_info.get("os", "Unknown"),
+        "cpu_model": cpu.get("model", "Unknown CPU"),
+        "cpu_cores": cores if isinstance(cores, int) else None,
+        "memory_gb": float(memory_gb) if isinstance(memory_gb, (int, float)) else None,
+        "gpu_model": _gpu_names(system_info) or "N/A",
+    }
+
+
+def hardware_fingerprint(system_info) -> str:
+    """
+    Return a short, stable hash of CPU model, core count, RAM and GPU, so that runs
+    from the same hardware can be grouped across OS updates and driver changes.
+    """
+    summary = hardware_summary(system_info)
+    # Round RAM to whole GB: the reported total varies slightly between OS versions.
+    memory_gb = round(summary["memory_gb"]) if summary["memory_gb"] is not None else None
+    key = f"{summary['cpu_model']}|{summary['cpu_cores']}|{memory_gb}|{summary['gpu_model']}"
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
@@ -1,30 +1,42 @@
 #/utils/timing.py
 import time
 import statistics
-from typing import Callable, Dict
+from typing import Callable, Dict, List
 
-def record_time(func: Callable, n_runs: int = 3, use_median: bool = True, *args, **kwargs) -> float:
+def record_times(func: Callable, n_runs: int = 3, *args, **kwargs) -> List[float]:
     """
-    Execute a function multiple times and return the median (or mean) elapsed time.
+    Execute a function multiple times and return every elapsed time.
     """
     times = []
     for _ in range(n_runs):
         start = time.time()
         func(*args, **kwargs)
         times.append(time.time() - start)
+    return times
+
+def record_time(func: Callable, n_runs: int = 3, use_median: bool = True, *args, **kwargs) -> float:
+    """
+    Execute a function multiple times and return the median (or mean) elapsed time.
+    """
+    times = record_times(func, n_runs, *args, **kwargs)
     return statistics.median(times) if use_median else statistics.mean(times)
 
-def timing_decorator(n_runs: int = 3, use_median: bool = True, timings: Dict = None):
+def timing_decorator(n_runs: int = 3, use_median: bool = True, timings: Dict = None, samples: Dict = None):
     """
     A decorator to measure the execution time of a function over multiple runs
     and optionally store the results in a dictionary.
+
+    The number of runs can be changed after decoration by setting `n_runs` on the
+    decorated function. When `samples` is given, the individual run times are stored
+    in it as a list under the function name.
     """
     def decorator(func: Callable):
         def wrapper(*args, **kwargs):
+            runs = wrapper.n_runs
             times = []
             # On stocke le résultat de la fonction
             result = None
-            for _ in range(n_runs):
+            for _ in range(runs):
                 start = time.time()
                 result = func(*args, **kwargs)  # APPEL DE LA FONCTION
                 times.append(time.time() - start)
@@ -33,11 +45,25 @@ def timing_decorator(n_runs: int = 3, use_median: bool = True, timings: Dict = N
             # Store in dictionary if provided
             if timings is not None:
                 timings[func.__name__] = elapsed_time
+            if samples is not None:
+                samples[func.__name__] = times
             
             print(f"{func.__name__} executed in {elapsed_time:.6f} seconds "
-                  f"(average of {n_runs} runs)")
+                  f"(average of {runs} runs)")
             
             # On retourne le résultat de la fonction décorée
             return result
+        wrapper.n_runs = n_runs
         return wrapper
     return decorator
+
+
+def record_throughput(func: Callable, work: float, n_runs: int = 3, warmup: bool = True, *args, **kwargs) -> float:
+    """
+    Execute a function multiple times and return its throughput (work units per second),
+    based on the median elapsed time. An optional untimed warm-up call runs first.
+    """
+    if warmup:
+        func(*args, **kwargs)
+    elapsed = record_time(func, n_runs, True, *args, **kwargs)
+    return work / elapsed if elapsed > 0 else 0.0
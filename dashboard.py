@@ -1,9 +1,9 @@
+import html
 import logging
 import streamlit as st
-import pandas as pd
 import requests
-import json
 import os
+from urllib.parse import quote
 
 # Configure logging
 logging.getLogger('matplotlib').setLevel(logging.ERROR)
@@ -13,6 +13,10 @@ st.set_page_config(layout="wide", page_title="benchHUB Leaderboard")
 
 # --- Environment and Constants ---
 API_URL = os.environ.get("API_URL", "https://benchhub-api.onrender.com")
+PAGE_SIZE = 50
+CACHE_TTL = 60  # Seconds an API response is reused across reruns and sessions
+REQUEST_TIMEOUT = 30
+PROFILE_ORDER = ["heavy", "standard", "light"]
 
 # --- Custom CSS for Styling ---
 def load_css():
@@ -45,6 +49,17 @@ def load_css():
             background-color: #273346; /* A neutral blue highlight */
         }
 
+        /* Columns of an entry: rank, hardware, score */
+        .entry {
+            display: flex;
+            align-items: center;
+            gap: 1rem;
+        }
+        .entry-rank { flex: 1; }
+        .entry-info { flex: 4; }
+        .entry-score { flex: 2; }
+        .entry p { margin: 0; }
+
         /* Rank styling */
         .rank {
             font-size: 2em;
@@ -112,115 +127,171 @@ with col2:
 st.title("Leaderboard")
 
 # --- Leaderboard Section ---
-try:
-    response = requests.get(f"{API_URL}/api/leaderboard")
+# Responses are cached per set of arguments, so reruns (every widget interaction) and
+# other sessions reuse them until CACHE_TTL runs out instead of calling the API again.
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def fetch_page(config_name, cursor=None, limit=PAGE_SIZE):
+    """One leaderboard page of a configuration, best score first."""
+    params = {"config_name": config_name, "limit": limit}
+    if cursor:
+        params["cursor"] = cursor
+    response = requests.get(f"{API_URL}/api/leaderboard", params=params, timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
+    return response.json()
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def fetch_profile_counts():
+    """Number of results per configuration, in PROFILE_ORDER."""
+    params = {"metric": "reference_index", "bins": 1}
+    response = requests.get(f"{API_URL}/api/stats", params=params, timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
+    counts = {group["config_name"]: group["metrics"]["reference_index"]["count"] for group in response.json()["groups"]}
+    return {profile: counts[profile] for profile in PROFILE_ORDER if profile in counts}
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def fetch_rank(uuid):
+    """
+    Rank of the result whose UUID is or starts with `uuid`. With no single match
+    (404 or 409) it raises HTTPError, which is not cached, so a result submitted
+    after an unsuccessful search is found by the next one.
+    """
+    # Quoted as one path segment, so input such as "../stats" cannot reach another endpoint
+    response = requests.get(f"{API_URL}/api/rank/{quote(uuid, safe='')}", timeout=REQUEST_TIMEOUT)
     response.raise_for_status()
-    leaderboard_data = response.json()
+    return response.json()
+
+# --- Display Functions ---
+MEDALS = {1: "🥇", 2: "🥈", 3: "🥉"}
+PODIUM_CLASSES = {1: "podium-1", 2: "podium-2", 3: "podium-3"}
+COLOR_CLASSES = {1: "gold", 2: "silver", 3: "bronze"}
+
+def has_interval(record):
+    return record.get("reference_index_low") is not None and record.get("reference_index_high") is not None
+
+def is_tied(record, other):
+    # Two results are tied when their confidence intervals overlap
+    if other is None or not has_interval(record) or not has_interval(other):
+        return False
+    return record["reference_index_low"] <= other["reference_index_high"] and other["reference_index_low"] <= record["reference_index_high"]
+
+def entry_html(rank, record, is_highlighted=False, tied=False):
+    item_class = "list-item " + PODIUM_CLASSES.get(rank, "")
+    if is_highlighted:
+        item_class += " highlighted-item"
+
+    if rank <= 3:
+        rank_html = f'<p class="podium-rank {COLOR_CLASSES[rank]}">{MEDALS[rank]}</p>'
+    else:
+        rank_html = f'<p class="rank">#{rank}</p>'
+
+    memory_gb = record.get("memory_gb")
+    # Hardware names come from submissions, so they are escaped
+    cpu_model = html.escape(str(record.get("cpu_model") or "Unknown CPU"))
+    gpu_model = html.escape(str(record.get("gpu_model") or "N/A"))
+    uuid = html.escape(str(record.get("uuid") or "N/A")[:8])
+    date = html.escape(str(record.get("timestamp") or "N/A")[:10])
+
+    score_formatted = f"{int(record['reference_index']):,}".replace(",", " ")
+    score_display = f"{score_formatted} 🔥" if rank == 1 else score_formatted
+    score_label = "Score"
+    if has_interval(record):
+        score_label += f" (95% CI {int(record['reference_index_low'])}–{int(record['reference_index_high'])})"
+    if record.get("missing_subsystems"):
+        # Only runs without a GPU score may be partial
+        score_label += f" · no {html.escape(record['missing_subsystems'].replace(',', ', ').upper())} score"
+    if tied:
+        score_label = "≈ tied with the rank above · " + score_label
+
+    # No indentation: Markdown would render indented lines as code
+    return (
+        f'<div class="{item_class}"><div class="entry">'
+        f'<div class="entry-rank">{rank_html}</div>'
+        f'<div class="entry-info"><div class="system-info">'
+        f'<b>CPU:</b> {cpu_model}<br><b>GPU:</b> {gpu_model}<br>'
+        f'<b>RAM:</b> {memory_gb if memory_gb is not None else "N/A"} GB</div>'
+        f'<div class="uuid">UUID: {uuid} | {date}</div></div>'
+        f'<div class="entry-score"><p class="score">{score_display}</p>'
+        f'<p class="score-label" style="text-align: right; opacity: 0.7;">{score_label}</p></div>'
+        f'</div></div>'
+    )
 
-    if not leaderboard_data:
+def display_page(records, first_rank, highlighted_uuid=None, previous=None):
+    """
+    Render a page of entries as a single HTML block, ranked from `first_rank`.
+    `previous` is the record ranked just above the page, so a tie across the page
+    boundary is shown too; without it the first entry is never marked as tied.
+    """
+    entries = []
+    for offset, record in enumerate(records):
+        rank = first_rank + offset
+        entries.append(entry_html(rank, record, is_highlighted=record.get("uuid") == highlighted_uuid, tied=is_tied(record, previous)))
+        previous = record
+    st.markdown("".join(entries), unsafe_allow_html=True)
+
+def display_profile(profile, total):
+    """
+    One configuration's leaderboard, a page at a time. The cursors of the pages
+    before the current one are kept in the session state so "Previous" works.
+    """
+    cursors = st.session_state.setdefault(f"cursors_{profile}", [None])
+    page = fetch_page(profile, cursors[-1])
+    # The page before is cached from when it was shown
+    previous_items = fetch_page(profile, cursors[-2])["items"] if len(cursors) > 1 else []
+    previous = previous_items[-1] if previous_items else None
+    display_page(page["items"], first_rank=(len(cursors) - 1) * PAGE_SIZE + 1, previous=previous)
+
+    pages = max(1, -(-total // PAGE_SIZE))
+    col1, col2, col3 = st.columns([1, 3, 1])
+    with col1:
+        st.button("← Previous", key=f"previous_{profile}", disabled=len(cursors) == 1, on_click=cursors.pop)
+    with col2:
+        st.markdown(f'<p style="text-align: center;">Page {len(cursors)} of {pages} · {total} results</p>', unsafe_allow_html=True)
+    with col3:
+        st.button("Next →", key=f"next_{profile}", disabled=not page["next_cursor"],
+                  on_click=cursors.append, args=(page["next_cursor"],))
+
+def display_search_result(uuid_filter):
+    try:
+        result = fetch_rank(uuid_filter.strip())
+    except requests.exceptions.HTTPError as e:
+        if e.response.status_code not in (404, 409):
+            raise
+        st.warning(f"No single result found for this UUID ({e.response.json()['detail']}). Enter at least its first 8 characters.")
+        return
+
+    profile = result["config_name"] or "standard"
+    ranks = result["profile"]
+    st.markdown(f'<div class="category-header"><h2>Search Result in \'{html.escape(profile.capitalize())}\'</h2></div>', unsafe_allow_html=True)
+    cohort_lines = [f"Rank **#{ranks['rank']}** of {ranks['total']} in this configuration, ahead of {ranks['percentile']}% of the others."]
+    for cohort, model in (("cpu_cohort", "cpu_model"), ("gpu_cohort", "gpu_model")):
+        if result[cohort] and result[cohort][model]:
+            cohort_lines.append(f"#{result[cohort]['rank']} of {result[cohort]['total']} with {result[cohort][model]}.")
+    st.info(" ".join(cohort_lines))
+
+    page = fetch_page(profile, result["leaderboard_cursor"])
+    display_page(page["items"], first_rank=ranks["rank"], highlighted_uuid=result["uuid"])
+
+# --- Main Display Logic ---
+try:
+    profile_counts = fetch_profile_counts()
+
+    if not profile_counts:
         st.info("The leaderboard is currently empty. Submit your benchmark to get started!")
     else:
-        # Process data
-        processed_data = []
-        for record in leaderboard_data:
-            system_info = json.loads(record.get("system_info", "{}"))
-            cpu_info = system_info.get("cpu", {})
-            mem_info = system_info.get("memory", {})
-            gpu_model = "N/A"
-            if "gpus" in system_info and isinstance(system_info["gpus"], list) and system_info["gpus"]:
-                gpu_model = ", ".join([gpu.get("name", "N/A") for gpu in system_info["gpus"]])
-            elif "torch_gpus" in system_info and isinstance(system_info["torch_gpus"], dict):
-                gpu_model = ", ".join(system_info["torch_gpus"].get("device_names", ["N/A"]))
-
-            processed_data.append({
-                "id": record["id"], "reference_index": record["reference_index"],
-                "config_name": record.get("config_name", "standard"), "uuid": record.get("uuid", "N/A"),
-                "cpu_model": cpu_info.get("model", "Unknown CPU"), "gpu_model": gpu_model,
-                "memory_total": f"{mem_info.get('total_gb', 'N/A')} GB", "timestamp": record.get("timestamp", "N/A")
-            })
-        
-        leaderboard_df = pd.DataFrame(processed_data)
-        
         # --- Sidebar ---
         st.sidebar.header("Filters")
-        profile_order = ["heavy", "standard", "light"]
-        present_profiles = leaderboard_df['config_name'].unique()
-        available_profiles = [p for p in profile_order if p in present_profiles]
-        config_profiles = ["All"] + available_profiles
-        selected_config = st.sidebar.selectbox("Configuration", config_profiles)
+        selected_config = st.sidebar.selectbox("Configuration", ["All"] + list(profile_counts))
         uuid_filter = st.sidebar.text_input("Search by UUID")
 
-        # --- Display Functions ---
-        def display_entry(rank, data_row, is_highlighted=False):
-            medals = {"1": "🥇", "2": "🥈", "3": "🥉"}
-            podium_classes = {1: "podium-1", 2: "podium-2", 3: "podium-3"}
-            color_classes = {1: "gold", 2: "silver", 3: "bronze"}
-            
-            item_class = "list-item " + podium_classes.get(rank, "")
-            if is_highlighted:
-                item_class += " highlighted-item"
-
-            score_formatted = f"{int(data_row['reference_index']):,}".replace(",", " ")
-            
-            st.markdown(f'<div class="{item_class}">', unsafe_allow_html=True)
-            col1, col2, col3 = st.columns([1, 4, 2])
-
-            with col1:
-                if rank <= 3:
-                    st.markdown(f'<p class="podium-rank {color_classes.get(rank, "")}">{medals.get(str(rank), rank)}</p>', unsafe_allow_html=True)
-                else:
-                    st.markdown(f'<p class="rank">#{rank}</p>', unsafe_allow_html=True)
-
-            with col2:
-                st.markdown(f"""
-                    <div class="system-info">
-                        <b>CPU:</b> {data_row['cpu_model']}<br>
-                        <b>GPU:</b> {data_row['gpu_model']}<br>
-                        <b>RAM:</b> {data_row['memory_total']}
-                    </div>
-                    <div class="uuid">UUID: {data_row['uuid'][:8]} | {pd.to_datetime(data_row['timestamp']).strftime('%Y-%m-%d')}</div>
-                """, unsafe_allow_html=True)
-
-            with col3:
-                score_display = f"{score_formatted} 🔥" if rank == 1 else score_formatted
-                st.markdown(f'<p class="score">{score_display}</p>', unsafe_allow_html=True)
-                st.markdown('<p class="score-label" style="text-align: right; opacity: 0.7;">Score</p>', unsafe_allow_html=True)
-
-            st.markdown('</div>', unsafe_allow_html=True)
-
-        def display_leaderboard(df):
-            for i, row in df.iterrows():
-                display_entry(rank=i + 1, data_row=row)
-
-        # --- Main Display Logic ---
         if uuid_filter:
-            search_result_df = leaderboard_df[leaderboard_df['uuid'].str.startswith(uuid_filter, na=False)]
-            if not search_result_df.empty:
-                result_row = search_result_df.iloc[0]
-                result_config = result_row['config_name']
-                
-                st.markdown(f'<div class="category-header"><h2>Search Result in \'{result_config.capitalize()}\'</h2></div>', unsafe_allow_html=True)
-                config_df = leaderboard_df[leaderboard_df['config_name'] == result_config].sort_values(by='reference_index', ascending=False).reset_index(drop=True)
-                result_index = config_df[config_df['uuid'] == result_row['uuid']].index[0]
-                
-                display_entry(rank=result_index + 1, data_row=result_row, is_highlighted=True)
-                
-                st.info("The full leaderboard for this configuration is shown below.")
-                display_leaderboard(config_df)
-            else:
-                st.warning("No results found for this UUID.")
-        
-        elif selected_config == "All":
-            for i, profile in enumerate(available_profiles):
+            display_search_result(uuid_filter)
+        else:
+            profiles = list(profile_counts) if selected_config == "All" else [selected_config]
+            for i, profile in enumerate(profiles):
                 st.markdown(f'<div class="category-header"><h2>{profile.capitalize()} Configuration</h2></div>', unsafe_allow_html=True)
-                profile_df = leaderboard_df[leaderboard_df['config_name'] == profile].sort_values(by='reference_index', ascending=False).reset_index(drop=True)
-                display_leaderboard(profile_df)
-                if i < len(available_profiles) - 1:
+                display_profile(profile, profile_counts[profile])
+                if i < len(profiles) - 1:
                     st.divider()
-        else:
-            st.markdown(f'<div class="category-header"><h2>{selected_config.capitalize()} Configuration</h2></div>', unsafe_allow_html=True)
-            display_df = leaderboard_df[leaderboard_df['config_name'] == selected_config].sort_values(by='reference_index', ascending=False).reset_index(drop=True)
-            display_leaderboard(display_df)
 
 except requests.exceptions.RequestException as e:
     st.error(f"Could not connect to the leaderboard API. Please ensure it's running. Error: {e}")
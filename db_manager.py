@@ -9,7 +9,8 @@ import sys
 import argparse
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
-from benchHUB.api import BenchmarkResult, Base
+from benchHUB.migrations import backfill_typed_columns, upgrade_schema
+from benchHUB.models import BenchmarkResult, Base
 
 def get_database_connection():
     """Get database connection from environment or fallback to local"""
@@ -30,6 +31,8 @@ def get_database_connection():
 
 def show_database_stats(engine, session_factory):
     """Show current database statistics"""
+    from benchHUB.api import aggregate_statistics
+
     print("📈 Database Statistics:")
     print("-" * 50)
     
@@ -43,25 +46,13 @@ def show_database_stats(engine, session_factory):
                 print("ℹ️  Database is empty")
                 return
             
-            # By category with score ranges
-            categories = session.execute(text("""
-                SELECT 
-                    config_name,
-                    COUNT(*) as count,
-                    MIN(reference_index) as min_score,
-                    MAX(reference_index) as max_score,
-                    AVG(reference_index) as avg_score
-                FROM results 
-                WHERE reference_index > 0
-                GROUP BY config_name
-                ORDER BY config_name
-            """)).fetchall()
-            
+            # By category with score ranges, computed the same way as GET /api/stats
             print("\nBy configuration:")
-            for row in categories:
-                config, count, min_score, max_score, avg_score = row
-                print(f"  {config or 'unknown'}: {count} results")
-                print(f"    Range: {min_score:.1f} - {max_score:.1f} (avg: {avg_score:.1f})")
+            for group in aggregate_statistics(session, metrics=["reference_index"]):
+                score = group["metrics"]["reference_index"]
+                print(f"  {group['config_name'] or 'unknown'}: {score['count']} results")
+                print(f"    Range: {score['min']:.1f} - {score['max']:.1f} (avg: {score['mean']:.1f}, median: {score['median']:.1f})")
+                print(f"    5th-95th percentile: {score['p5']:.1f} - {score['p95']:.1f}")
             
             # Score distribution
             print("\nScore distribution:")
@@ -227,15 +218,49 @@ def limit_scores_per_category(engine, session_factory, limit=2000):
         except Exception as e:
             print(f"❌ Error limiting scores: {e}")
 
+def rescore_all(engine, version=None, chunk_size=5000, dry_run=False):
+    """Recompute reference_index for every stored result"""
+    from benchHUB.reference_index import SCORING_VERSION
+    from benchHUB.rescore import rescore_results
+
+    version = version or SCORING_VERSION
+    print(f"🔄 Re-scoring all results with scoring v{version}{' (dry run)' if dry_run else ''}...")
+    try:
+        stats = rescore_results(engine, version=version, chunk_size=chunk_size, dry_run=dry_run)
+        print(f"✅ Re-scored {stats['updated']} of {stats['scanned']} results in {stats['seconds']:.1f}s")
+        if stats['skipped']:
+            print(f"⚠️  Skipped {stats['skipped']} results with an unknown configuration")
+    except Exception as e:
+        print(f"❌ Error re-scoring results: {e}")
+
+def migrate_schema(engine, chunk_size=1000):
+    """Upgrade the schema and fill hardware links and typed metric columns for existing rows"""
+    print("🧱 Migrating database schema...")
+    try:
+        applied = upgrade_schema(engine)
+        for name in applied:
+            print(f"  Applied: {name}")
+        print("✅ Schema is up to date")
+        updated = backfill_typed_columns(engine, chunk_size=chunk_size)
+        print(f"✅ Filled typed columns for {updated} results")
+    except Exception as e:
+        print(f"❌ Error migrating schema: {e}")
+
 def main():
     parser = argparse.ArgumentParser(description="Manage benchHUB database")
     parser.add_argument('action', choices=[
-        'stats', 'clear-all', 'clear-zero', 'clear-high', 'limit'
+        'stats', 'clear-all', 'clear-zero', 'clear-high', 'limit', 'rescore', 'migrate'
     ], help='Action to perform')
     parser.add_argument('--limit', type=int, default=2000,
                        help='Number of top scores to keep per category (default: 2000)')
     parser.add_argument('--threshold', type=int, default=1000,
                        help='Score threshold for clearing high scores (default: 1000)')
+    parser.add_argument('--scoring-version', default=None,
+                       help='Scoring version to apply when re-scoring (default: current)')
+    parser.add_argument('--chunk-size', type=int, default=5000,
+                       help='Rows re-scored or migrated per batch (default: 5000)')
+    parser.add_argument('--dry-run', action='store_true',
+                       help='Compute new scores without writing them')
     
     args = parser.parse_args()
     
@@ -252,6 +277,10 @@ def main():
             clear_high_scores(engine, session_factory, args.threshold)
         elif args.action == 'limit':
             limit_scores_per_category(engine, session_factory, args.limit)
+        elif args.action == 'rescore':
+            rescore_all(engine, args.scoring_version, args.chunk_size, args.dry_run)
+        elif args.action == 'migrate':
+            migrate_schema(engine, args.chunk_size)
             
     except Exception as e:
         print(f"❌ Fatal error: {e}")
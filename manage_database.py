@@ -9,7 +9,8 @@ import os
 import sys
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
-from benchHUB.api import BenchmarkResult, Base
+from benchHUB.migrations import migration_metadata, upgrade_schema
+from benchHUB.models import BenchmarkResult, Base
 
 def get_database_connection():
     """Get database connection based on environment"""
@@ -123,7 +124,8 @@ def reset_database_schema(engine):
     confirm = input("This will DELETE ALL DATA and recreate tables. Type 'RESET' to confirm: ")
     if confirm == 'RESET':
         Base.metadata.drop_all(bind=engine)
-        Base.metadata.create_all(bind=engine)
+        migration_metadata.drop_all(bind=engine)
+        upgrade_schema(engine)
         print("✅ Database schema reset complete")
     else:
         print("❌ Operation cancelled")
@@ -14,11 +14,11 @@ st.write(
     The benchmark suite is composed of several micro-tests, each designed to stress a specific component of your system. The time taken to complete each test is measured precisely.
     - **CPU (Prime Calculation)**: A pure computational task that calculates a large number of prime numbers. It's designed to be CPU-bound with low memory usage, testing single-core processing power.
     - **CPU (Parallel Processing)**: Tests the CPU's ability to handle multiple tasks simultaneously, crucial for modern applications.
-    - **GPU (Tensor Operations)**: Stresses the GPU with matrix multiplications, a fundamental operation in machine learning and 3D graphics.
+    - **GPU (Tensor Operations)**: Stresses the GPU with matrix multiplications at several sizes, a fundamental operation in machine learning and 3D graphics. Tensors are allocated before timing starts and the device is synchronised, so the result is reported in TFLOPS of completed work rather than kernel-launch time.
     - **Memory (Bandwidth)**: Measures the speed of data movement in system memory by timing large array copy operations, a more practical metric than simple allocation.
     - **Disk (Read/Write)**: Tests the sequential read and write speed of your primary storage drive using a moderately sized file.
     - **Machine Learning (Training)**: Simulates a real-world ML model training task (Random Forest) to evaluate a combination of CPU, GPU, and memory performance.
-    - **Plotting (Complex Visuals)**: Measures the time to generate and render complex data visualizations.
+    - **Plotting (Complex Visuals)**: Measures how fast complex data visualizations are rasterised into memory, in frames per second and megapixels per second, for each available Matplotlib backend (Agg, and Cairo when installed).
     """
 )
 
@@ -27,23 +27,22 @@ st.write(
     """
     A single, simple score is more useful for comparison than a dozen different timings. The **Reference Score** is a weighted composite of the most critical performance metrics.
     
-    **Current Formula (v1.0.1+):**
+    **Current Formula (scoring v2.0):**
     ```
-    CPU_Score = (1 / CPU_Time) × 0.4
-    GPU_Score = (1 / GPU_Time) × 0.4  
-    Memory_Score = (1 / Memory_Time) × 0.2
-    
-    Raw_Score = CPU_Score + GPU_Score + Memory_Score
-    Final_Score = min(Raw_Score × 0.5, 999.9)
+    Ratio(metric)     = Reference_Time / Your_Time
+    Subsystem_Score   = weighted geometric mean of its metric ratios
+    Reference_Index   = 1000 × weighted geometric mean of subsystem scores
     ```
     
     **Key Features:**
-    - **Inverse timing**: Faster completion = higher score
-    - **Weighted components**: CPU (40%), GPU (40%), Memory (20%)
-    - **Capped at 999.9**: Ensures scores remain intuitive and comparable
-    - **Security validated**: Server-side verification prevents manipulation
+    - **Reference machine**: Each profile is normalized against a stored reference machine, which scores exactly 1000
+    - **Every subsystem counts**: CPU (25%), GPU (20%), Memory (15%), Machine Learning (15%), Disk (10%), Plotting (15%)
+    - **No cap**: Geometric means keep scores proportional, so fast hardware does not saturate
+    - **Missing subsystems**: A machine without a GPU is scored on the remaining subsystems instead of losing a fixed share of its score
+    - **Versioned & security validated**: Server-side verification recomputes your score with the scoring version your client used
+    - **Error bars**: Every test runs several times, and a bootstrap over those runs gives a 95% confidence interval for your score. Results whose intervals overlap are shown as tied on the leaderboard
     
-    This creates a single, easy-to-understand number where **higher is better**, with typical scores ranging from 200-900 depending on hardware and test profile.
+    This creates a single, easy-to-understand number where **higher is better**: 2000 means twice as fast as the reference machine overall.
     """
 )
 
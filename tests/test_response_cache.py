@@ -0,0 +1,60 @@
+"""
+A submission that commits while an uncached read is waiting on its query must not
+leave the read's (now stale) response in the cache.
+"""
+import random
+
+import pytest
+from fastapi.testclient import TestClient
+
+from benchHUB import api, api_loadtest
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'leaderboard.db'}")
+    monkeypatch.setattr(api.limiter, "enabled", False)
+    api.invalidate_caches()
+    with TestClient(api.app) as client:
+        yield client
+
+
+def submit_during(monkeypatch, name):
+    """
+    Replace the query function `name` so that, once it has read the database, another
+    result is stored and the caches invalidated, as a submit finishing meanwhile would.
+    """
+    query = getattr(api, name)
+    rng = random.Random(1)
+
+    def query_then_submit(db, *args):
+        result = query(db, *args)
+        monkeypatch.setattr(api, name, query)
+        api_loadtest.seed_rows(api, rng, 4)
+        return result
+
+    monkeypatch.setattr(api, name, query_then_submit)
+
+
+def test_leaderboard_read_racing_a_submit_is_not_cached(client, monkeypatch):
+    api_loadtest.seed_rows(api, random.Random(0), 3)
+    params = {"config_name": api_loadtest.PROFILE}
+    submit_during(monkeypatch, "leaderboard_page")
+
+    stale = client.get("/api/leaderboard", params=params)
+    assert len(stale.json()["items"]) == 3
+
+    fresh = client.get("/api/leaderboard", params=params)
+    assert len(fresh.json()["items"]) == 4
+    assert fresh.headers["etag"] != stale.headers["etag"]
+
+
+def test_stats_read_racing_a_submit_is_not_cached(client, monkeypatch):
+    api_loadtest.seed_rows(api, random.Random(0), 3)
+    params = {"metric": "reference_index", "bins": 1}
+    submit_during(monkeypatch, "aggregate_statistics")
+
+    stale = client.get("/api/stats", params=params)
+    fresh = client.get("/api/stats", params=params)
+    assert fresh.headers["etag"] != stale.headers["etag"]
+    assert [group["metrics"]["reference_index"]["count"] for group in fresh.json()["groups"]] == [4]